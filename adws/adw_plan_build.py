@@ -7,6 +7,7 @@
 ADW Plan & Build - AI Developer Workflow (ADW)
 
 Usage: uv run adw_plan_build.py <github-issue-number> [adw-id]
+       uv run adw_plan_build.py --resume <adw-id>
 
 Workflow:
 1. Fetch GitHub issue details
@@ -21,42 +22,62 @@ Workflow:
    - Commit: "feature: implement #{number} - {title}"
 5. Create PR with full context
 
+Steps run in order as pipeline stages (pipeline.py) that each build on the
+checkout left by the previous one; issue comments are posted in the
+background, and per-stage timings are logged.
+Stage results and Claude session ids are checkpointed in agents/{adw_id}/state.json;
+--resume skips completed stages and continues interrupted agent sessions.
+
 Environment Requirements:
 - ANTHROPIC_API_KEY: Anthropic API key
 - CLAUDE_CODE_PATH: Path to Claude CLI
 - GITHUB_PAT: (Optional) GitHub Personal Access Token - only if using a different account than 'gh auth login'
+- ADW_WORKTREE_BASE: Git ref the feature branch starts from (default: origin/main)
 """
 
+import argparse
 import subprocess
 import sys
 import os
 import logging
-from typing import Tuple, Optional, Union
+import signal
+from typing import List, Tuple, Optional, Union
 from dotenv import load_dotenv
 from data_types import (
     AgentTemplateRequest,
     GitHubIssue,
     AgentPromptResponse,
     IssueClassSlashCommand,
+    WorkflowState,
 )
-from agent import execute_template
+from agent import cancel_agents, execute_template, reset_cancellation
+from comment_publisher import FLUSH_TIMEOUT_SECONDS, CommentPublisher
 from github import (
     extract_repo_path,
     fetch_issue,
-    make_issue_comment,
     mark_issue_in_progress,
     get_repo_url,
 )
-from utils import make_adw_id, setup_logger
+from pipeline import Stage, StageError, run_pipeline
+from resolvers import resolve_issue_class, resolve_plan_file
+from state import WorkflowStateStore
+from utils import make_adw_id, make_branch_name, setup_logger
 
 # Agent name constants
 AGENT_PLANNER = "sdlc_planner"
 AGENT_IMPLEMENTOR = "sdlc_implementor"
 AGENT_CLASSIFIER = "issue_classifier"
 AGENT_PLAN_FINDER = "plan_finder"
-AGENT_BRANCH_GENERATOR = "branch_generator"
 AGENT_PR_CREATOR = "pr_creator"
 
+# Feature branches start from this commit-ish, the same ref scheduler worktrees use
+BASE_REF = os.getenv("ADW_WORKTREE_BASE", "origin/main")
+
+# Checkpoint of the running workflow, set in main()
+workflow_state: Optional[WorkflowStateStore] = None
+# Cleared by --no-cache to run every agent even if a cached response exists
+use_response_cache = True
+
 
 def check_env_vars(logger: Optional[logging.Logger] = None) -> None:
     """Check that all required environment variables are set."""
@@ -79,12 +100,38 @@ def check_env_vars(logger: Optional[logging.Logger] = None) -> None:
         sys.exit(1)
 
 
-def parse_args(logger: Optional[logging.Logger] = None) -> Tuple[str, Optional[str]]:
+def parse_args(
+    argv: Optional[List[str]] = None, logger: Optional[logging.Logger] = None
+) -> Tuple[Optional[str], Optional[str], Optional[str], bool]:
     """Parse command line arguments.
-    Returns (issue_number, adw_id) where adw_id may be None."""
-    if len(sys.argv) < 2:
+    Returns (issue_number, adw_id, resume_adw_id, use_cache); adw_id may be
+    None, and issue_number is None when resuming."""
+    parser = argparse.ArgumentParser(
+        description="Plan and build a GitHub issue with Claude Code agents",
+        epilog=(
+            "Examples: uv run adw_plan_build.py 123 | "
+            "uv run adw_plan_build.py 123 abc12345 | "
+            "uv run adw_plan_build.py --resume abc12345"
+        ),
+    )
+    parser.add_argument("issue_number", nargs="?", help="GitHub issue number")
+    parser.add_argument("adw_id", nargs="?", help="ADW ID (generated if omitted)")
+    parser.add_argument(
+        "--resume",
+        metavar="ADW_ID",
+        help="Resume a workflow from agents/<adw-id>/state.json, skipping completed stages",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run every agent instead of replaying cached responses",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.issue_number and not args.resume:
         usage_msg = [
             "Usage: uv run adw_plan_build.py <issue-number> [adw-id]",
+            "       uv run adw_plan_build.py --resume <adw-id>",
             "Example: uv run adw_plan_build.py 123",
             "Example: uv run adw_plan_build.py 123 abc12345",
         ]
@@ -96,10 +143,60 @@ def parse_args(logger: Optional[logging.Logger] = None) -> Tuple[str, Optional[s
                 print(msg)
         sys.exit(1)
 
-    issue_number = sys.argv[1]
-    adw_id = sys.argv[2] if len(sys.argv) > 2 else None
+    return args.issue_number, args.adw_id, args.resume, not args.no_cache
+
 
-    return issue_number, adw_id
+def run_agent(request: AgentTemplateRequest) -> AgentPromptResponse:
+    """Execute an agent template, checkpointing its session for --resume.
+
+    If an earlier run of this workflow left a session for the agent, it is
+    continued instead of starting over.
+    """
+    if workflow_state:
+        request.resume_session_id = workflow_state.state.session_ids.get(request.agent_name)
+    request.use_cache = use_response_cache
+    response = execute_template(request)
+    if workflow_state:
+        workflow_state.record_session(request.agent_name, response.session_id)
+    return response
+
+
+def get_head_sha() -> Optional[str]:
+    """Return the SHA of the checked out commit."""
+    result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def prepare_resume(store: WorkflowStateStore, logger: logging.Logger) -> None:
+    """Restore the checkout for a resumed workflow.
+
+    Checks out the workflow branch and re-runs stages whose uncommitted output
+    did not survive (e.g. the previous run used a worktree that was removed).
+    """
+    completed = store.state.completed
+
+    branch_name = completed.get("branch")
+    if branch_name:
+        result = subprocess.run(["git", "checkout", branch_name], capture_output=True, text=True)
+        if result.returncode != 0:
+            logger.error(f"Error checking out branch {branch_name}: {result.stderr.strip()}")
+            sys.exit(1)
+        logger.info(f"Resumed on branch: {branch_name}")
+
+    plan_file = completed.get("find_plan_file")
+    if plan_file and not os.path.exists(plan_file):
+        logger.info(f"Plan file {plan_file} is gone, planning again")
+        for stage in ("plan", "find_plan_file", "commit_plan"):
+            store.forget_stage(stage)
+        for agent_name in (AGENT_PLANNER, AGENT_PLAN_FINDER, f"{AGENT_PLANNER}_committer"):
+            store.forget_session(agent_name)
+
+    if "implement" in completed and "commit_implementation" not in completed:
+        status = subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True)
+        if not status.stdout.strip():
+            logger.info("Uncommitted implementation is gone, implementing again")
+            store.forget_stage("implement")
+            store.forget_session(AGENT_IMPLEMENTOR)
 
 
 def format_issue_message(
@@ -115,20 +212,34 @@ def classify_issue(
     issue: GitHubIssue, adw_id: str, logger: logging.Logger
 ) -> Tuple[Optional[IssueClassSlashCommand], Optional[str]]:
     """Classify GitHub issue and return appropriate slash command.
+    Labels and title prefixes are tried first; the agent is only used when they
+    are missing or disagree.
     Returns (command, error_message) tuple."""
+    issue_command = resolve_issue_class(issue)
+    if issue_command:
+        logger.info(f"Classified issue deterministically as {issue_command}")
+        return issue_command, None
+
     issue_template_request = AgentTemplateRequest(
         agent_name=AGENT_CLASSIFIER,
         slash_command="/classify_issue",
         args=[issue.model_dump_json(indent=2, by_alias=True)],
         adw_id=adw_id,
         model="sonnet",
+        # Comments and updatedAt change with every status comment, so they would never hit
+        cache_key_args=[
+            str(issue.number),
+            issue.title,
+            issue.body,
+            *sorted(label.name for label in issue.labels),
+        ],
     )
 
     logger.debug(
         f"issue_template_request: {issue_template_request.model_dump_json(indent=2, by_alias=True)}"
     )
 
-    issue_response = execute_template(issue_template_request)
+    issue_response = run_agent(issue_template_request)
 
     logger.debug(
         f"issue_response: {issue_response.model_dump_json(indent=2, by_alias=True)}"
@@ -164,7 +275,7 @@ def build_plan(
         f"issue_plan_template_request: {issue_plan_template_request.model_dump_json(indent=2, by_alias=True)}"
     )
 
-    issue_plan_response = execute_template(issue_plan_template_request)
+    issue_plan_response = run_agent(issue_plan_template_request)
 
     logger.debug(
         f"issue_plan_response: {issue_plan_response.model_dump_json(indent=2, by_alias=True)}"
@@ -174,10 +285,22 @@ def build_plan(
 
 
 def get_plan_file(
-    plan_output: str, adw_id: str, logger: logging.Logger
+    plan_output: str,
+    adw_id: str,
+    logger: logging.Logger,
+    issue: Optional[GitHubIssue] = None,
+    issue_class: str = "",
 ) -> Tuple[Optional[str], Optional[str]]:
     """Get the path to the plan file that was just created.
+    The planner output and specs/ directory are checked first; the agent is
+    only used when the path is ambiguous.
     Returns (file_path, error_message) tuple."""
+    if issue:
+        file_path = resolve_plan_file(plan_output, issue, issue_class)
+        if file_path:
+            logger.info(f"Found plan file deterministically: {file_path}")
+            return file_path, None
+
     request = AgentTemplateRequest(
         agent_name=AGENT_PLAN_FINDER,
         slash_command="/find_plan_file",
@@ -186,7 +309,7 @@ def get_plan_file(
         model="sonnet",
     )
 
-    response = execute_template(request)
+    response = run_agent(request)
 
     if not response.success:
         return None, response.output
@@ -220,7 +343,7 @@ def implement_plan(
         f"implement_template_request: {implement_template_request.model_dump_json(indent=2, by_alias=True)}"
     )
 
-    implement_response = execute_template(implement_template_request)
+    implement_response = run_agent(implement_template_request)
 
     logger.debug(
         f"implement_response: {implement_response.model_dump_json(indent=2, by_alias=True)}"
@@ -235,25 +358,27 @@ def git_branch(
     adw_id: str,
     logger: logging.Logger,
 ) -> Tuple[Optional[str], Optional[str]]:
-    """Generate and create a git branch for the issue.
+    """Create and check out the feature branch for the issue.
+    The branch starts at BASE_REF by commit rather than by checking out the
+    base branch, which git refuses inside a worktree while another checkout
+    has that branch.
     Returns (branch_name, error_message) tuple."""
     # Remove the leading slash from issue_class for the branch name
     issue_type = issue_class.replace("/", "")
+    branch_name = make_branch_name(issue_type, issue.number, adw_id, issue.title)
 
-    request = AgentTemplateRequest(
-        agent_name=AGENT_BRANCH_GENERATOR,
-        slash_command="/generate_branch_name",
-        args=[issue_type, adw_id, issue.model_dump_json(by_alias=True)],
-        adw_id=adw_id,
-        model="sonnet",
-    )
-
-    response = execute_template(request)
+    # Start from the latest remote state; ignore fetch errors (offline, no remote)
+    if "/" in BASE_REF:
+        remote = BASE_REF.split("/", 1)[0]
+        subprocess.run(["git", "fetch", remote], capture_output=True, text=True)
 
-    if not response.success:
-        return None, response.output
+    # -B resets a branch left behind by an interrupted attempt of this stage
+    result = subprocess.run(
+        ["git", "checkout", "-B", branch_name, BASE_REF], capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None, f"Error creating branch {branch_name} at {BASE_REF}: {result.stderr.strip()}"
 
-    branch_name = response.output.strip()
     logger.info(f"Created branch: {branch_name}")
     return branch_name, None
 
@@ -281,7 +406,7 @@ def git_commit(
         model="sonnet",
     )
 
-    response = execute_template(request)
+    response = run_agent(request)
 
     if not response.success:
         return None, response.output
@@ -308,7 +433,7 @@ def pull_request(
         model="sonnet",
     )
 
-    response = execute_template(request)
+    response = run_agent(request)
 
     if not response.success:
         return None, response.output
@@ -318,6 +443,25 @@ def pull_request(
     return pr_url, None
 
 
+# Posts issue comments in the background so stages don't wait on GitHub, set in main()
+comment_publisher: Optional[CommentPublisher] = None
+
+
+def post_issue_comment(issue_number: str, comment: str, notify: bool = False) -> None:
+    """Queue an issue comment without blocking the workflow.
+
+    With ADW_COALESCE_COMMENTS, status updates edit one progress comment;
+    notify=True always posts a new comment.
+    """
+    comment_publisher.publish(comment, notify=notify)
+
+
+def flush_issue_comments() -> None:
+    """Wait, up to ADW_COMMENT_FLUSH_TIMEOUT_SECONDS, for queued comments to be posted."""
+    if not comment_publisher.close(FLUSH_TIMEOUT_SECONDS):
+        print("Warning: Some issue comments were not posted before exiting", file=sys.stderr)
+
+
 def check_error(
     error_or_response: Union[Optional[str], AgentPromptResponse],
     issue_number: str,
@@ -348,20 +492,48 @@ def check_error(
 
     if error:
         logger.error(f"{error_prefix}: {error}")
-        make_issue_comment(
+        post_issue_comment(
             issue_number,
             format_issue_message(adw_id, agent_name, f"❌ {error_prefix}: {error}"),
+            notify=True,
         )
+        flush_issue_comments()
         sys.exit(1)
 
 
-def main():
+def raise_on_error(
+    error_or_response: Union[Optional[str], AgentPromptResponse],
+    agent_name: str,
+    error_prefix: str,
+) -> None:
+    """Raise StageError if a stage step failed, for check_error to report."""
+    if isinstance(error_or_response, AgentPromptResponse):
+        if not error_or_response.success:
+            raise StageError(agent_name, error_prefix, error_or_response.output)
+    elif error_or_response:
+        raise StageError(agent_name, error_prefix, error_or_response)
+
+
+def main(argv: Optional[List[str]] = None):
     """Main entry point."""
+    global workflow_state, use_response_cache, comment_publisher
+
     # Load environment variables
     load_dotenv()
 
     # Parse arguments (before we have logger)
-    issue_number, adw_id = parse_args()
+    issue_number, adw_id, resume_adw_id, use_response_cache = parse_args(argv)
+    reset_cancellation()
+
+    # Load the checkpoint when resuming
+    store: Optional[WorkflowStateStore] = None
+    if resume_adw_id:
+        store = WorkflowStateStore.load(resume_adw_id)
+        if store is None:
+            print(f"Error: No saved state for ADW ID {resume_adw_id}", file=sys.stderr)
+            sys.exit(1)
+        adw_id = resume_adw_id
+        issue_number = store.state.issue_number
 
     # Generate ADW ID if not provided
     if not adw_id:
@@ -371,6 +543,22 @@ def main():
     logger = setup_logger(adw_id, "adw_plan_build")
     logger.info(f"ADW ID: {adw_id}")
 
+    if store is None:
+        store = WorkflowStateStore(WorkflowState(adw_id=adw_id, issue_number=issue_number))
+        store.save()
+    else:
+        logger.info(f"Resuming workflow, completed stages: {list(store.state.completed)}")
+        prepare_resume(store, logger)
+    workflow_state = store
+
+    # Stop the running agent on SIGTERM/SIGINT; the failed step then ends the workflow
+    def handle_cancel(signum, frame):
+        logger.warning(f"Received signal {signum}, cancelling workflow")
+        cancel_agents()
+
+    signal.signal(signal.SIGTERM, handle_cancel)
+    signal.signal(signal.SIGINT, handle_cancel)
+
     # Validate environment (now with logger)
     check_env_vars(logger)
 
@@ -381,155 +569,123 @@ def main():
     except ValueError as e:
         logger.error(f"Error getting repository URL: {e}")
         sys.exit(1)
+    comment_publisher = CommentPublisher(repo_path, issue_number)
 
     # Fetch and display issue
     issue: GitHubIssue = fetch_issue(issue_number, repo_path)
 
     logger.debug(f"issue: {issue.model_dump_json(indent=2, by_alias=True)}")
-    make_issue_comment(
-        issue_number, format_issue_message(adw_id, "ops", f"✅ Starting ADW workflow")
-    )
-
-    # Classify the issue
-    issue_command: IssueClassSlashCommand
-    issue_command, error = classify_issue(issue, adw_id, logger)
-
-    check_error(error, issue_number, adw_id, "ops", "Error classifying issue", logger)
-
-    logger.info(f"issue_command: {issue_command}")
-    make_issue_comment(
-        issue_number,
-        format_issue_message(adw_id, "ops", f"✅ Issue classified as: {issue_command}"),
-    )
-
-    # Create git branch
-    branch_name, error = git_branch(issue, issue_command, adw_id, logger)
-
-    check_error(error, issue_number, adw_id, "ops", "Error creating branch", logger)
-
-    logger.info(f"Working on branch: {branch_name}")
-    make_issue_comment(
-        issue_number,
-        format_issue_message(adw_id, "ops", f"✅ Working on branch: {branch_name}"),
-    )
-
-    # Build the implementation plan
-    logger.info("\n=== Building implementation plan ===")
-    make_issue_comment(
-        issue_number,
-        format_issue_message(adw_id, AGENT_PLANNER, "✅ Building implementation plan"),
-    )
-
-    issue_plan_response: AgentPromptResponse = build_plan(
-        issue, issue_command, adw_id, logger
-    )
-
-    check_error(
-        issue_plan_response,
-        issue_number,
-        adw_id,
-        AGENT_PLANNER,
-        "Error building plan",
-        logger,
-    )
-
-    logger.debug(f"issue_plan_response.output: {issue_plan_response.output}")
-    make_issue_comment(
-        issue_number,
-        format_issue_message(adw_id, AGENT_PLANNER, "✅ Implementation plan created"),
-    )
-
-    # Get the path to the plan file that was created
-    logger.info("\n=== Finding plan file ===")
-
-    plan_file_path, error = get_plan_file(issue_plan_response.output, adw_id, logger)
-
-    check_error(error, issue_number, adw_id, "ops", "Error finding plan file", logger)
-
-    logger.info(f"plan_file_path: {plan_file_path}")
-    make_issue_comment(
-        issue_number,
-        format_issue_message(adw_id, "ops", f"✅ Plan file created: {plan_file_path}"),
-    )
-
-    # Commit the plan
-    logger.info("\n=== Committing plan ===")
-    make_issue_comment(
-        issue_number, format_issue_message(adw_id, AGENT_PLANNER, "✅ Committing plan")
-    )
-    commit_msg, error = git_commit(AGENT_PLANNER, issue, issue_command, adw_id, logger)
-
-    check_error(
-        error, issue_number, adw_id, AGENT_PLANNER, "Error committing plan", logger
-    )
-
-    # Implement the plan
-    logger.info("\n=== Implementing solution ===")
-    make_issue_comment(
-        issue_number,
-        format_issue_message(adw_id, AGENT_IMPLEMENTOR, "✅ Implementing solution"),
-    )
-    implement_response: AgentPromptResponse = implement_plan(
-        plan_file_path, adw_id, logger
-    )
-
-    check_error(
-        implement_response,
-        issue_number,
-        adw_id,
-        AGENT_IMPLEMENTOR,
-        "Error implementing solution",
-        logger,
-    )
-
-    logger.debug(f"implement_response.output: {implement_response.output}")
-    make_issue_comment(
-        issue_number,
-        format_issue_message(adw_id, AGENT_IMPLEMENTOR, "✅ Solution implemented"),
-    )
-
-    # Commit the implementation
-    logger.info("\n=== Committing implementation ===")
-    make_issue_comment(
-        issue_number,
-        format_issue_message(adw_id, AGENT_IMPLEMENTOR, "✅ Committing implementation"),
-    )
-    commit_msg, error = git_commit(
-        AGENT_IMPLEMENTOR, issue, issue_command, adw_id, logger
-    )
-
-    check_error(
-        error,
-        issue_number,
-        adw_id,
-        AGENT_IMPLEMENTOR,
-        "Error committing implementation",
-        logger,
-    )
-
-    # Create pull request
-    logger.info("\n=== Creating pull request ===")
-    make_issue_comment(
-        issue_number, format_issue_message(adw_id, "ops", "✅ Creating pull request")
-    )
+    if resume_adw_id:
+        post_issue_comment(
+            issue_number, format_issue_message(adw_id, "ops", f"✅ Resuming ADW workflow")
+        )
+    else:
+        post_issue_comment(
+            issue_number, format_issue_message(adw_id, "ops", f"✅ Starting ADW workflow")
+        )
 
-    pr_url, error = pull_request(branch_name, issue, plan_file_path, adw_id, logger)
+    def comment(agent_name: str, message: str, notify: bool = False) -> None:
+        post_issue_comment(
+            issue_number, format_issue_message(adw_id, agent_name, message), notify=notify
+        )
 
-    check_error(
-        error, issue_number, adw_id, "ops", "Error creating pull request", logger
-    )
+    # Stages receive the results of finished stages by name
+    def classify_stage(results):
+        issue_command, error = classify_issue(issue, adw_id, logger)
+        raise_on_error(error, "ops", "Error classifying issue")
+        logger.info(f"issue_command: {issue_command}")
+        comment("ops", f"✅ Issue classified as: {issue_command}")
+        return issue_command
+
+    def branch_stage(results):
+        branch_name, error = git_branch(issue, results["classify"], adw_id, logger)
+        raise_on_error(error, "ops", "Error creating branch")
+        logger.info(f"Working on branch: {branch_name}")
+        comment("ops", f"✅ Working on branch: {branch_name}")
+        return branch_name
+
+    def plan_stage(results):
+        comment(AGENT_PLANNER, "✅ Building implementation plan")
+        issue_plan_response = build_plan(issue, results["classify"], adw_id, logger)
+        raise_on_error(issue_plan_response, AGENT_PLANNER, "Error building plan")
+        logger.debug(f"issue_plan_response.output: {issue_plan_response.output}")
+        comment(AGENT_PLANNER, "✅ Implementation plan created")
+        return issue_plan_response.output
+
+    def find_plan_file_stage(results):
+        plan_file_path, error = get_plan_file(
+            results["plan"], adw_id, logger, issue, results["classify"]
+        )
+        raise_on_error(error, "ops", "Error finding plan file")
+        logger.info(f"plan_file_path: {plan_file_path}")
+        comment("ops", f"✅ Plan file created: {plan_file_path}")
+        return plan_file_path
+
+    def commit_plan_stage(results):
+        comment(AGENT_PLANNER, "✅ Committing plan")
+        _, error = git_commit(AGENT_PLANNER, issue, results["classify"], adw_id, logger)
+        raise_on_error(error, AGENT_PLANNER, "Error committing plan")
+        return get_head_sha()
+
+    def implement_stage(results):
+        comment(AGENT_IMPLEMENTOR, "✅ Implementing solution")
+        implement_response = implement_plan(results["find_plan_file"], adw_id, logger)
+        raise_on_error(implement_response, AGENT_IMPLEMENTOR, "Error implementing solution")
+        logger.debug(f"implement_response.output: {implement_response.output}")
+        comment(AGENT_IMPLEMENTOR, "✅ Solution implemented")
+        return implement_response.output
+
+    def commit_implementation_stage(results):
+        comment(AGENT_IMPLEMENTOR, "✅ Committing implementation")
+        _, error = git_commit(AGENT_IMPLEMENTOR, issue, results["classify"], adw_id, logger)
+        raise_on_error(error, AGENT_IMPLEMENTOR, "Error committing implementation")
+        return get_head_sha()
+
+    def pull_request_stage(results):
+        comment("ops", "✅ Creating pull request")
+        pr_url, error = pull_request(
+            results["branch"], issue, results["find_plan_file"], adw_id, logger
+        )
+        raise_on_error(error, "ops", "Error creating pull request")
+        logger.info(f"\nPull request created: {pr_url}")
+        comment("ops", f"✅ Pull request created: {pr_url}", notify=True)
+        return pr_url
+
+    # The branch stage switches the checkout to the new branch, so planning
+    # waits for it rather than writing files into a moving tree.
+    # Commits also wait for the branch so they never land on the base ref.
+    stages = [
+        Stage("classify", classify_stage),
+        Stage("branch", branch_stage, after=["classify"]),
+        Stage("plan", plan_stage, after=["branch"]),
+        Stage("find_plan_file", find_plan_file_stage, after=["plan"]),
+        Stage("commit_plan", commit_plan_stage, after=["find_plan_file", "branch"]),
+        Stage("implement", implement_stage, after=["commit_plan"]),
+        Stage("commit_implementation", commit_implementation_stage, after=["implement"]),
+        Stage("pull_request", pull_request_stage, after=["commit_implementation", "branch"]),
+    ]
 
-    logger.info(f"\nPull request created: {pr_url}")
-    make_issue_comment(
-        issue_number,
-        format_issue_message(adw_id, "ops", f"✅ Pull request created: {pr_url}"),
-    )
+    try:
+        run_pipeline(
+            stages,
+            logger,
+            completed=store.state.completed,
+            on_stage_complete=store.complete_stage,
+        )
+    except StageError as e:
+        logger.info(f"Resume with: uv run adw_plan_build.py --resume {adw_id}")
+        check_error(e.error, issue_number, adw_id, e.agent_name, e.error_prefix, logger)
+    except Exception as e:
+        # Unexpected failures still get reported on the issue and flush queued comments
+        logger.exception("Unexpected error in workflow")
+        logger.info(f"Resume with: uv run adw_plan_build.py --resume {adw_id}")
+        check_error(
+            f"{type(e).__name__}: {e}", issue_number, adw_id, "ops", "Unexpected workflow error", logger
+        )
 
     logger.info(f"ADW workflow completed successfully for issue #{issue_number}")
-    make_issue_comment(
-        issue_number,
-        format_issue_message(adw_id, "ops", f"✅ ADW workflow completed successfully"),
-    )
+    comment("ops", f"✅ ADW workflow completed successfully", notify=True)
+    flush_issue_comments()
 
 
 if __name__ == "__main__":
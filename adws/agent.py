@@ -4,8 +4,12 @@ import subprocess
 import sys
 import os
 import json
+import queue
 import re
-from typing import Optional, List, Dict, Any, Tuple
+import signal
+import threading
+import time
+from typing import Callable, Optional, List, Dict, Any, Tuple
 from dotenv import load_dotenv
 from data_types import (
     AgentPromptRequest,
@@ -13,6 +17,13 @@ from data_types import (
     AgentTemplateRequest,
     ClaudeCodeResultMessage,
 )
+from events import AgentEventTracker
+from response_cache import (
+    get_cached_response,
+    is_cacheable,
+    make_cache_key,
+    put_cached_response,
+)
 
 # Load environment variables
 load_dotenv()
@@ -20,9 +31,109 @@ load_dotenv()
 # Get Claude Code CLI path from environment
 CLAUDE_PATH = os.getenv("CLAUDE_CODE_PATH", "claude")
 
+# Wall-clock timeouts per slash command; quick lookups fail fast, builds get longer
+DEFAULT_COMMAND_TIMEOUTS = {
+    "/classify_issue": 300,
+    "/find_plan_file": 300,
+    "/generate_branch_name": 300,
+    "/commit": 600,
+    "/pull_request": 600,
+    "/chore": 1200,
+    "/bug": 1200,
+    "/feature": 1200,
+    "/implement": 3600,
+}
+DEFAULT_TIMEOUT_SECONDS = float(os.getenv("ADW_AGENT_TIMEOUT_SECONDS", "1800"))
+IDLE_TIMEOUT_SECONDS = float(os.getenv("ADW_AGENT_IDLE_TIMEOUT_SECONDS", "600"))
+KILL_GRACE_SECONDS = float(os.getenv("ADW_AGENT_KILL_GRACE_SECONDS", "10"))
+
+# Optional CPU time and data segment limits for the agent process (0 disables)
+AGENT_CPU_SECONDS = int(os.getenv("ADW_AGENT_CPU_SECONDS", "0"))
+AGENT_MEMORY_MB = int(os.getenv("ADW_AGENT_MEMORY_MB", "0"))
+
+# Set to stop all running agents (signal handler or API); see cancel_agents()
+cancel_event = threading.Event()
+
+
+def parse_command_timeouts(value: str) -> Dict[str, float]:
+    """Parse ADW_AGENT_TIMEOUTS, e.g. "/implement=5400,/commit=300"."""
+    timeouts = {}
+    for item in value.split(","):
+        if "=" not in item:
+            continue
+        command, seconds = item.split("=", 1)
+        timeouts[command.strip()] = float(seconds)
+    return timeouts
+
+
+COMMAND_TIMEOUTS = {
+    **DEFAULT_COMMAND_TIMEOUTS,
+    **parse_command_timeouts(os.getenv("ADW_AGENT_TIMEOUTS", "")),
+}
+
+
+def get_command_timeout(slash_command: str) -> float:
+    """Return the wall-clock timeout in seconds for a slash command."""
+    return COMMAND_TIMEOUTS.get(slash_command, DEFAULT_TIMEOUT_SECONDS)
+
+
+def cancel_agents() -> None:
+    """Cooperatively stop every running agent in this process."""
+    cancel_event.set()
+
+
+def reset_cancellation() -> None:
+    """Clear a previous cancel_agents() so a new workflow run starts uncancelled."""
+    cancel_event.clear()
+
+
+def with_resource_limits(cmd: List[str]) -> List[str]:
+    """Wrap a command so it runs under the configured CPU and memory rlimits.
+
+    The limits are set by a shell that then execs the command; a preexec_fn
+    is not safe here because workflows start agents from several threads.
+    Memory is capped with RLIMIT_DATA rather than RLIMIT_AS: the CLI is a Node
+    process whose V8 heap reserves far more address space than it uses.
+    """
+    limits = []
+    if AGENT_CPU_SECONDS > 0:
+        limits.append(f"ulimit -t {AGENT_CPU_SECONDS}")
+    if AGENT_MEMORY_MB > 0:
+        limits.append(f"ulimit -d {AGENT_MEMORY_MB * 1024}")
+    if not limits:
+        return cmd
+    return ["/bin/sh", "-c", " && ".join(limits + ['exec "$@"']), "sh", *cmd]
+
+
+def stop_process_group(process: subprocess.Popen) -> None:
+    """Terminate an agent and its tool subprocesses, killing them after a grace period."""
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            return
+        try:
+            process.wait(timeout=KILL_GRACE_SECONDS)
+            return
+        except subprocess.TimeoutExpired:
+            continue
+
+
+# Successful CLI checks are reused for this long; failures are never cached
+CLAUDE_CHECK_TTL_SECONDS = float(os.getenv("ADW_CLAUDE_CHECK_TTL_SECONDS", "3600"))
+_claude_checked_at: Optional[float] = None
+
 
 def check_claude_installed() -> Optional[str]:
-    """Check if Claude Code CLI is installed. Return error message if not."""
+    """Check if Claude Code CLI is installed. Return error message if not.
+    
+    A successful check is cached per process for CLAUDE_CHECK_TTL_SECONDS so
+    repeated agent calls don't each launch `claude --version`.
+    """
+    global _claude_checked_at
+    if _claude_checked_at is not None and time.monotonic() - _claude_checked_at < CLAUDE_CHECK_TTL_SECONDS:
+        return None
+    
     try:
         result = subprocess.run(
             [CLAUDE_PATH, "--version"], capture_output=True, text=True
@@ -31,38 +142,18 @@ def check_claude_installed() -> Optional[str]:
             return f"Error: Claude Code CLI is not installed. Expected at: {CLAUDE_PATH}"
     except FileNotFoundError:
         return f"Error: Claude Code CLI is not installed. Expected at: {CLAUDE_PATH}"
+    _claude_checked_at = time.monotonic()
     return None
 
 
-def parse_jsonl_output(output_file: str) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
-    """Parse JSONL output file and return all messages and the result message.
-    
-    Returns:
-        Tuple of (all_messages, result_message) where result_message is None if not found
-    """
-    try:
-        with open(output_file, "r") as f:
-            # Read all lines and parse each as JSON
-            messages = [json.loads(line) for line in f if line.strip()]
-            
-            # Find the result message (should be the last one)
-            result_message = None
-            for message in reversed(messages):
-                if message.get("type") == "result":
-                    result_message = message
-                    break
-                    
-            return messages, result_message
-    except Exception as e:
-        print(f"Error parsing JSONL file: {e}", file=sys.stderr)
-        return [], None
+def invalidate_claude_check() -> None:
+    """Forget the cached CLI check so the next call verifies the CLI again."""
+    global _claude_checked_at
+    _claude_checked_at = None
 
 
-def convert_jsonl_to_json(jsonl_file: str) -> str:
-    """Convert JSONL file to JSON array file.
-    
-    Creates a .json file with the same name as the .jsonl file,
-    containing all messages as a JSON array.
+def write_json_messages(messages: List[Dict[str, Any]], jsonl_file: str) -> str:
+    """Write already parsed messages as a JSON array next to the .jsonl file.
     
     Returns:
         Path to the created JSON file
@@ -70,9 +161,6 @@ def convert_jsonl_to_json(jsonl_file: str) -> str:
     # Create JSON filename by replacing .jsonl with .json
     json_file = jsonl_file.replace('.jsonl', '.json')
     
-    # Parse the JSONL file
-    messages, _ = parse_jsonl_output(jsonl_file)
-    
     # Write as JSON array
     with open(json_file, 'w') as f:
         json.dump(messages, f, indent=2)
@@ -81,6 +169,85 @@ def convert_jsonl_to_json(jsonl_file: str) -> str:
     return json_file
 
 
+def stream_claude_output(
+    process: subprocess.Popen,
+    output_file: str,
+    on_message: Optional[Callable[[Dict[str, Any]], None]] = None,
+    timeout_seconds: Optional[float] = None,
+    idle_timeout_seconds: Optional[float] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]], str, Optional[str]]:
+    """Tee Claude Code's stream-json stdout to output_file, parsing each line once.
+    
+    Stops the agent if it exceeds timeout_seconds, produces no output for
+    idle_timeout_seconds, or cancel_event is set.
+    
+    Returns:
+        Tuple of (all_messages, result_message, raw_output, stop_reason) where
+        stop_reason is None if the agent ran to completion
+    """
+    messages: List[Dict[str, Any]] = []
+    result_message = None
+    raw_lines: List[str] = []
+    stop_reason = None
+    
+    # Read on a separate thread so timeouts fire even when the agent is silent
+    lines: "queue.Queue[Optional[str]]" = queue.Queue()
+    
+    def read_stdout():
+        for line in process.stdout:
+            lines.put(line)
+        lines.put(None)
+    
+    threading.Thread(target=read_stdout, daemon=True).start()
+    
+    start_time = time.time()
+    last_output = start_time
+    with open(output_file, "w") as f:
+        while True:
+            now = time.time()
+            if cancel_event.is_set():
+                stop_reason = "cancelled"
+            elif timeout_seconds and now - start_time > timeout_seconds:
+                stop_reason = f"timed out after {timeout_seconds:.0f} seconds"
+            elif idle_timeout_seconds and now - last_output > idle_timeout_seconds:
+                stop_reason = f"produced no output for {idle_timeout_seconds:.0f} seconds"
+            if stop_reason:
+                stop_process_group(process)
+                break
+            
+            try:
+                line = lines.get(timeout=1)
+            except queue.Empty:
+                continue
+            if line is None:
+                break
+            
+            last_output = time.time()
+            f.write(line)
+            f.flush()
+            raw_lines.append(line)
+            if not line.strip():
+                continue
+            
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                print(f"Skipping non-JSON output line: {line.strip()[:200]}", file=sys.stderr)
+                continue
+            
+            messages.append(message)
+            if message.get("type") == "result":
+                result_message = message
+            
+            if on_message:
+                try:
+                    on_message(message)
+                except Exception as e:
+                    print(f"Error in on_message callback: {e}", file=sys.stderr)
+    
+    return messages, result_message, "".join(raw_lines), stop_reason
+
+
 def get_claude_env() -> Dict[str, str]:
     """Get only the required environment variables for Claude Code execution.
     
@@ -153,8 +320,19 @@ def save_prompt(prompt: str, adw_id: str, agent_name: str = "ops") -> None:
     print(f"Saved prompt to: {prompt_file}")
 
 
-def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
-    """Execute Claude Code with the given prompt configuration."""
+def prompt_claude_code(
+    request: AgentPromptRequest,
+    on_message: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> AgentPromptResponse:
+    """Execute Claude Code with the given prompt configuration.
+    
+    Output is parsed as it streams: each line is written to request.output_file
+    and parsed once, and on_message is called with every message as it arrives.
+    The agent runs in its own process group so timeouts and cancellation also
+    stop the tools it started.
+    """
+    if cancel_event.is_set():
+        return AgentPromptResponse(output="Error: Claude Code agent cancelled", success=False, session_id=None)
 
     # Check if Claude Code CLI is installed
     error_msg = check_claude_installed()
@@ -179,24 +357,59 @@ def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
     if request.dangerously_skip_permissions:
         cmd.append("--dangerously-skip-permissions")
 
+    # Continue an earlier session (e.g. when resuming a failed workflow)
+    if request.resume_session_id:
+        cmd.extend(["--resume", request.resume_session_id])
+
     # Set up environment with only required variables
     env = get_claude_env()
 
     try:
-        # Execute Claude Code and pipe output to file
-        with open(request.output_file, "w") as f:
-            result = subprocess.run(
-                cmd, stdout=f, stderr=subprocess.PIPE, text=True, env=env
-            )
+        # Execute Claude Code and stream its output
+        process = subprocess.Popen(
+            with_resource_limits(cmd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            env=env,
+            start_new_session=True,
+        )
+        
+        # Drain stderr concurrently so a full pipe cannot stall the agent
+        stderr_chunks: List[str] = []
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True
+        )
+        stderr_reader.start()
+        
+        messages, result_message, raw_output, stop_reason = stream_claude_output(
+            process,
+            request.output_file,
+            on_message,
+            request.timeout_seconds,
+            request.idle_timeout_seconds,
+        )
+        returncode = process.wait()
+        stderr_reader.join(KILL_GRACE_SECONDS)
+        stderr = "".join(stderr_chunks)
+
+        # Every message carries the session id, so stopped agents can be resumed too
+        started_session_id = next(
+            (m["session_id"] for m in messages if m.get("session_id")), None
+        )
 
-        if result.returncode == 0:
+        if stop_reason:
+            error_msg = f"Error: Claude Code agent {stop_reason}"
+            print(error_msg, file=sys.stderr)
+            write_json_messages(messages, request.output_file)
+            return AgentPromptResponse(output=error_msg, success=False, session_id=started_session_id)
+
+        if returncode == 0:
             print(f"Output saved to: {request.output_file}")
             
-            # Parse the JSONL file
-            messages, result_message = parse_jsonl_output(request.output_file)
-            
-            # Convert JSONL to JSON array file
-            json_file = convert_jsonl_to_json(request.output_file)
+            # Write the JSON array file from the messages already parsed
+            write_json_messages(messages, request.output_file)
             
             if result_message:
                 # Extract session_id from result message
@@ -213,30 +426,45 @@ def prompt_claude_code(request: AgentPromptRequest) -> AgentPromptResponse:
                 )
             else:
                 # No result message found, return raw output
-                with open(request.output_file, "r") as f:
-                    raw_output = f.read()
                 return AgentPromptResponse(
                     output=raw_output, 
                     success=True,
                     session_id=None
                 )
         else:
-            error_msg = f"Claude Code error: {result.stderr}"
+            error_msg = f"Claude Code error: {stderr}"
             print(error_msg, file=sys.stderr)
-            return AgentPromptResponse(output=error_msg, success=False, session_id=None)
+            return AgentPromptResponse(output=error_msg, success=False, session_id=started_session_id)
 
-    except subprocess.TimeoutExpired:
-        error_msg = "Error: Claude Code command timed out after 5 minutes"
-        print(error_msg, file=sys.stderr)
-        return AgentPromptResponse(output=error_msg, success=False, session_id=None)
     except Exception as e:
+        if isinstance(e, (FileNotFoundError, PermissionError)):
+            # The CLI went away since it was last checked
+            invalidate_claude_check()
         error_msg = f"Error executing Claude Code: {e}"
         print(error_msg, file=sys.stderr)
         return AgentPromptResponse(output=error_msg, success=False, session_id=None)
 
 
-def execute_template(request: AgentTemplateRequest) -> AgentPromptResponse:
-    """Execute a Claude Code template with slash command and arguments."""
+def execute_template(
+    request: AgentTemplateRequest,
+    on_message: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> AgentPromptResponse:
+    """Execute a Claude Code template with slash command and arguments.
+    
+    Progress events are recorded live (events.jsonl and execution.log) unless a
+    custom on_message callback is given. Idempotent commands are answered from
+    the response cache when possible (see response_cache.py); set
+    request.use_cache=False to bypass it.
+    """
+    cache_key = None
+    if request.use_cache and is_cacheable(request.slash_command):
+        key_args = request.args if request.cache_key_args is None else request.cache_key_args
+        cache_key = make_cache_key(request.slash_command, key_args, request.model)
+        cached_response = get_cached_response(cache_key)
+        if cached_response:
+            print(f"Using cached response for {request.slash_command} ({request.agent_name})")
+            return cached_response
+
     # Construct prompt from slash command and args
     prompt = f"{request.slash_command} {' '.join(request.args)}"
     
@@ -256,7 +484,15 @@ def execute_template(request: AgentTemplateRequest) -> AgentPromptResponse:
         model=request.model,
         dangerously_skip_permissions=True,
         output_file=output_file,
+        timeout_seconds=get_command_timeout(request.slash_command),
+        idle_timeout_seconds=IDLE_TIMEOUT_SECONDS,
+        resume_session_id=request.resume_session_id,
     )
 
     # Execute and return response (prompt_claude_code now handles all parsing)
-    return prompt_claude_code(prompt_request)
+    response = prompt_claude_code(
+        prompt_request, on_message or AgentEventTracker(request.adw_id, request.agent_name)
+    )
+    if cache_key:
+        put_cached_response(cache_key, response)
+    return response
@@ -0,0 +1,122 @@
+#!/usr/bin/env -S uv run
+# /// script
+# dependencies = ["python-dotenv", "pydantic"]
+# ///
+
+"""
+ADW Benchmarks - AI Developer Workflow (ADW)
+
+Measures the fixed per-call overhead of agent execution that does not depend
+on the model, so regressions show up without spending API credits.
+
+Usage:
+    uv run benchmark.py            # 7 calls, like one adw_plan_build run
+    uv run benchmark.py --calls 20
+    uv run benchmark.py --only workflow_startup
+
+Benchmarks:
+- claude_check: cost of check_claude_installed() with the cache cold (one
+  `claude --version` process launch) versus warm (cached result)
+- workflow_startup: time until a workflow can start its first agent call,
+  for a new interpreter importing adw_plan_build versus a handoff to a
+  prewarmed worker (workflow_runner.py)
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, List
+
+import agent
+import workflow_runner
+
+
+def time_calls(func: Callable[[], object], calls: int) -> List[float]:
+    """Run func the given number of times and return each duration in seconds."""
+    durations = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def benchmark_claude_check(calls: int) -> None:
+    """Compare uncached and cached Claude Code CLI checks."""
+    def uncached_check():
+        agent.invalidate_claude_check()
+        return agent.check_claude_installed()
+
+    error = uncached_check()
+    if error:
+        print(error)
+        return
+
+    cold = time_calls(uncached_check, calls)
+    agent.check_claude_installed()
+    warm = time_calls(agent.check_claude_installed, calls)
+
+    print(f"claude_check ({calls} calls, CLI: {agent.CLAUDE_PATH})")
+    print(f"  uncached: median {statistics.median(cold) * 1000:8.1f} ms, total {sum(cold) * 1000:8.1f} ms")
+    print(f"  cached:   median {statistics.median(warm) * 1000:8.3f} ms, total {sum(warm) * 1000:8.3f} ms")
+    print(f"  saved per workflow run: {(sum(cold) - sum(warm)) * 1000:.0f} ms")
+
+
+def benchmark_workflow_startup(calls: int) -> None:
+    """Compare a cold workflow launch with a handoff to a prewarmed worker."""
+    def cold_start():
+        subprocess.run(
+            [sys.executable, "-c", "import adw_plan_build"],
+            cwd=workflow_runner.SCRIPT_DIR,
+            check=True,
+        )
+
+    cold = time_calls(cold_start, calls)
+
+    # Does what an idle pool worker does (import, wait for a job on stdin) but
+    # answers instead of running the workflow
+    probe = "import sys, adw_plan_build; sys.stdin.readline(); print('ready', flush=True)"
+    warm = []
+    for _ in range(calls):
+        worker = subprocess.Popen(
+            [sys.executable, "-c", probe],
+            cwd=workflow_runner.SCRIPT_DIR,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        # Let the worker finish importing, as an idle pool worker would have
+        time.sleep(max(cold) * 2)
+        start = time.perf_counter()
+        worker.stdin.write("{}\n")
+        worker.stdin.close()
+        worker.stdout.readline()
+        warm.append(time.perf_counter() - start)
+        worker.wait()
+
+    print(f"workflow_startup ({calls} launches)")
+    print(f"  new interpreter:  median {statistics.median(cold) * 1000:8.1f} ms")
+    print(f"  prewarmed worker: median {statistics.median(warm) * 1000:8.1f} ms")
+
+
+BENCHMARKS = {
+    "claude_check": benchmark_claude_check,
+    "workflow_startup": benchmark_workflow_startup,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ADW agent overhead")
+    parser.add_argument("--calls", type=int, default=7, help="Agent calls to simulate (default: 7)")
+    parser.add_argument("--only", choices=sorted(BENCHMARKS), help="Run a single benchmark")
+    args = parser.parse_args()
+
+    for name, benchmark in BENCHMARKS.items():
+        if args.only in (None, name):
+            benchmark(args.calls)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Comment Publisher - AI Developer Workflow (ADW)
+
+Posts issue comments from a background thread so workflow stages never wait
+on GitHub. Comments are queued and delivered in order; failed posts are
+retried with exponential backoff, waiting for the reset when GitHub reports a
+rate limit, and dropped with an error once attempts run out. A failed post
+never ends the workflow.
+
+With coalescing on, status updates are collected into a single progress
+comment that is edited as the workflow advances, and everything queued while
+a request is in flight goes out in one edit. Messages published with
+notify=True (errors, the final result) are always posted as new comments, so
+subscribers are notified.
+
+Status updates have the lowest priority in the shared rate limit budget: when
+few API calls remain they wait for the reset (and, with coalescing, are merged
+meanwhile), while notify=True comments are sent right away.
+
+Environment:
+- ADW_COALESCE_COMMENTS: Set to "true" to edit one progress comment (default: false)
+- ADW_COMMENT_MAX_ATTEMPTS: Attempts per comment before it is dropped (default: 5)
+- ADW_COMMENT_RETRY_BACKOFF_SECONDS: First retry delay, doubled per attempt (default: 2)
+- ADW_COMMENT_MAX_BACKOFF_SECONDS: Longest delay between attempts (default: 300)
+- ADW_COMMENT_FLUSH_TIMEOUT_SECONDS: How long a finishing workflow waits for
+  queued comments (default: 120)
+"""
+
+import os
+import queue
+import sys
+import threading
+import time
+from typing import List, Optional
+
+from github import create_issue_comment, rate_limit_budget, update_issue_comment
+from github_http import GitHubAPIError
+
+COALESCE_COMMENTS = os.getenv("ADW_COALESCE_COMMENTS", "false").lower() == "true"
+MAX_ATTEMPTS = int(os.getenv("ADW_COMMENT_MAX_ATTEMPTS", "5"))
+RETRY_BACKOFF_SECONDS = float(os.getenv("ADW_COMMENT_RETRY_BACKOFF_SECONDS", "2"))
+MAX_BACKOFF_SECONDS = float(os.getenv("ADW_COMMENT_MAX_BACKOFF_SECONDS", "300"))
+FLUSH_TIMEOUT_SECONDS = float(os.getenv("ADW_COMMENT_FLUSH_TIMEOUT_SECONDS", "120"))
+
+# How often held status updates re-check the API budget
+BUDGET_CHECK_SECONDS = 5
+
+# GitHub rejects comment bodies over 65536 characters
+MAX_COMMENT_CHARS = 60000
+
+
+class QueuedComment:
+    """A comment waiting to be published."""
+
+    def __init__(self, body: str, notify: bool):
+        self.body = body
+        self.notify = notify
+
+
+_STOP = object()
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """Check whether a failed post was rejected by a GitHub rate limit."""
+    if isinstance(error, GitHubAPIError):
+        return error.status in (403, 429) and "rate limit" in str(error).lower()
+    return "rate limit" in str(error).lower()
+
+
+def retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before the next attempt after a failure."""
+    if is_rate_limited(error):
+        until_reset = rate_limit_budget.seconds_until_reset()
+        if until_reset:
+            return min(MAX_BACKOFF_SECONDS, until_reset + 1)
+        return MAX_BACKOFF_SECONDS
+    return min(MAX_BACKOFF_SECONDS, RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+
+
+class CommentPublisher:
+    """Ordered, retrying, non-blocking publisher of comments on one issue."""
+
+    def __init__(self, repo_path: str, issue_number: str, coalesce: bool = COALESCE_COMMENTS):
+        self.repo_path = repo_path
+        self.issue_number = issue_number
+        self.coalesce = coalesce
+        self.posted = 0
+        self.dropped = 0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._progress_comment_id: Optional[str] = None
+        self._progress_lines: List[str] = []
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"adw-comments-{issue_number}", daemon=True
+        )
+        self._thread.start()
+
+    def publish(self, body: str, notify: bool = False) -> None:
+        """Queue a comment and return immediately."""
+        self._queue.put(QueuedComment(body, notify))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until queued comments are delivered. Returns False on timeout."""
+        deadline = None if timeout is None else time.time() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """Deliver queued comments and stop the worker.
+
+        After the timeout, retries are abandoned. Returns False if comments
+        were still pending.
+        """
+        self._queue.put(_STOP)
+        delivered = self.flush(timeout)
+        self._stopping.set()
+        self._thread.join(timeout=5)
+        return delivered
+
+    def _run(self) -> None:
+        held: List[QueuedComment] = []  # Status updates waiting for API budget
+        stop = False
+        while True:
+            if self._stopping.is_set() and held:
+                print(
+                    f"Error posting comment to issue #{self.issue_number}, giving up: "
+                    f"{len(held)} status updates still waiting for GitHub API budget",
+                    file=sys.stderr,
+                )
+                self.dropped += len(held)
+                for _ in held:
+                    self._queue.task_done()
+                held = []
+            if stop and not held:
+                return
+
+            items = []
+            try:
+                # While updates are held, wake up regularly to check the budget
+                items.append(self._queue.get(timeout=BUDGET_CHECK_SECONDS if held else None))
+                # Take everything queued meanwhile so it can go out in one edit
+                while True:
+                    items.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            comments = [item for item in items if item is not _STOP]
+            stop = stop or len(comments) < len(items)
+            pending = held + comments
+            try:
+                if rate_limit_budget.allow("status"):
+                    self._deliver(pending)
+                    held = []
+                else:
+                    # Errors and results go out now; status updates wait for the reset
+                    if not held:
+                        print(
+                            f"INFO: GitHub API budget low ({rate_limit_budget.describe()}), "
+                            f"holding status comments for issue #{self.issue_number}",
+                            file=sys.stderr,
+                        )
+                    self._deliver([comment for comment in pending if comment.notify])
+                    held = [comment for comment in pending if not comment.notify]
+            except Exception as e:
+                print(f"Error publishing comments to issue #{self.issue_number}: {e}", file=sys.stderr)
+                held = []
+            finally:
+                for _ in range(len(pending) - len(held) + len(items) - len(comments)):
+                    self._queue.task_done()
+
+    def _deliver(self, comments: List[QueuedComment]) -> None:
+        i = 0
+        while i < len(comments):
+            if self.coalesce and not comments[i].notify:
+                j = i
+                while j < len(comments) and not comments[j].notify:
+                    j += 1
+                lines = [comment.body for comment in comments[i:j]]
+                self._with_retries(lambda: self._write_progress(lines), len(lines))
+                i = j
+            else:
+                body = comments[i].body
+                priority = "critical" if comments[i].notify else "status"
+                self._with_retries(
+                    lambda: create_issue_comment(self.repo_path, self.issue_number, body, priority),
+                    1,
+                )
+                i += 1
+
+    def _write_progress(self, lines: List[str]) -> None:
+        """Append lines to the progress comment, starting a new one when it is full."""
+        all_lines = self._progress_lines + lines
+        body = "\n\n".join(all_lines)
+        if self._progress_comment_id and len(body) > MAX_COMMENT_CHARS:
+            self._progress_comment_id = None
+            all_lines = lines
+            body = "\n\n".join(all_lines)
+
+        if self._progress_comment_id is None:
+            self._progress_comment_id = create_issue_comment(
+                self.repo_path, self.issue_number, body
+            )
+        else:
+            update_issue_comment(self.repo_path, self._progress_comment_id, body)
+        self._progress_lines = all_lines
+
+    def _with_retries(self, send, count: int) -> None:
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                send()
+                self.posted += count
+                return
+            except Exception as e:
+                if attempt == MAX_ATTEMPTS or self._stopping.is_set():
+                    print(
+                        f"Error posting comment to issue #{self.issue_number}, giving up: {e}",
+                        file=sys.stderr,
+                    )
+                    self.dropped += count
+                    return
+                delay = retry_delay(e, attempt)
+                print(
+                    f"Error posting comment to issue #{self.issue_number} "
+                    f"(attempt {attempt}/{MAX_ATTEMPTS}), retrying in {delay:.0f}s: {e}",
+                    file=sys.stderr,
+                )
+                if self._stopping.wait(delay):
+                    self.dropped += count
+                    return
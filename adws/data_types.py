@@ -1,7 +1,7 @@
 """Data types for GitHub API responses and Claude Code agent."""
 
 from datetime import datetime
-from typing import Optional, List, Literal
+from typing import Any, Dict, Optional, List, Literal
 from pydantic import BaseModel, Field
 
 # Supported slash commands for issue classification
@@ -74,6 +74,9 @@ class GitHubIssueListItem(BaseModel):
     labels: List[GitHubLabel] = []
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
+    comment_count: Optional[int] = None  # Only set by the GraphQL poller
+    last_comment_id: Optional[str] = None  # Numeric id, as in webhook payloads
+    last_comment_body: Optional[str] = None
 
     class Config:
         populate_by_name = True
@@ -100,6 +103,20 @@ class GitHubIssue(BaseModel):
         populate_by_name = True
 
 
+# Workflow-critical calls are never held back; polling and status comments
+# yield to them when the API budget runs low
+GitHubCallPriority = Literal["critical", "poll", "status"]
+
+
+class GitHubRateLimit(BaseModel):
+    """Rate limit state of one GitHub API resource (core, graphql, ...)."""
+
+    resource: str
+    limit: int
+    remaining: int
+    reset_at: float  # Unix time
+
+
 class AgentPromptRequest(BaseModel):
     """Claude Code agent prompt configuration."""
 
@@ -109,6 +126,9 @@ class AgentPromptRequest(BaseModel):
     model: Literal["sonnet", "opus"] = "opus"
     dangerously_skip_permissions: bool = False
     output_file: str
+    timeout_seconds: Optional[float] = None  # Wall-clock limit, None for no limit
+    idle_timeout_seconds: Optional[float] = None  # Limit on time without output
+    resume_session_id: Optional[str] = None  # Continue this Claude Code session
 
 
 class AgentPromptResponse(BaseModel):
@@ -117,6 +137,7 @@ class AgentPromptResponse(BaseModel):
     output: str
     success: bool
     session_id: Optional[str] = None
+    cached: bool = False  # Replayed from the response cache without running an agent
 
 
 class AgentTemplateRequest(BaseModel):
@@ -127,6 +148,9 @@ class AgentTemplateRequest(BaseModel):
     args: List[str]
     adw_id: str
     model: Literal["sonnet", "opus"] = "sonnet"
+    resume_session_id: Optional[str] = None  # Continue this Claude Code session
+    use_cache: bool = True  # False bypasses the response cache
+    cache_key_args: Optional[List[str]] = None  # Stable inputs keying the response cache, default args
 
 
 class ClaudeCodeResultMessage(BaseModel):
@@ -141,3 +165,60 @@ class ClaudeCodeResultMessage(BaseModel):
     result: str
     session_id: str
     total_cost_usd: float
+
+
+AgentEventType = Literal["agent_started", "assistant_turn", "tool_call", "agent_finished"]
+
+
+class AgentEvent(BaseModel):
+    """Live progress event parsed from an agent's stream-json output."""
+
+    timestamp: datetime = Field(default_factory=datetime.now)
+    adw_id: str
+    agent_name: str
+    event: AgentEventType
+    turn: int = 0
+    tool: Optional[str] = None
+    text: Optional[str] = None
+    input_tokens: int = 0  # Cumulative for the agent, including cache reads/writes
+    output_tokens: int = 0  # Cumulative for the agent
+    cost_usd: Optional[float] = None  # Reported once the agent finishes
+    is_error: Optional[bool] = None
+
+
+class StageTiming(BaseModel):
+    """Timing of one workflow pipeline stage."""
+
+    name: str
+    started_at: float  # Seconds since the pipeline started
+    duration_seconds: float
+    status: Literal["succeeded", "failed"]
+
+
+class WorkflowState(BaseModel):
+    """Checkpoint of an adw_plan_build run, stored in agents/{adw_id}/state.json."""
+
+    adw_id: str
+    issue_number: str
+    completed: Dict[str, Any] = {}  # Stage name -> result (branch, plan file, commit SHA, ...)
+    session_ids: Dict[str, str] = {}  # Agent name -> latest Claude Code session id
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+
+JobState = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+
+class WorkflowJob(BaseModel):
+    """ADW workflow run stored in the job queue."""
+
+    id: Optional[int] = None
+    issue_number: int
+    comment_id: str = ""  # Triggering comment, empty for new issues
+    adw_id: str
+    repo_path: str
+    reason: str = ""
+    state: JobState = "queued"
+    attempts: int = 0
+    exit_code: Optional[int] = None
+    last_error: Optional[str] = None
+    enqueued_at: datetime = Field(default_factory=datetime.now)
@@ -0,0 +1,150 @@
+"""
+Agent Events - AI Developer Workflow (ADW)
+
+Turns the stream-json messages of running agents into progress events:
+assistant turns, tool calls and cumulative token and cost counts. Events are
+appended to agents/{adw_id}/events.jsonl and written to the workflow's
+execution.log as they arrive, so stuck or runaway agents are visible within
+seconds. The webhook server streams the events file over SSE.
+"""
+
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from data_types import AgentEvent
+from utils import get_logger
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADW_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+# Serializes appends from agents of the same workflow running in parallel
+_write_lock = threading.Lock()
+
+
+def events_path(adw_id: str) -> str:
+    """Return the events file path for a workflow."""
+    if not ADW_ID_PATTERN.match(adw_id):
+        raise ValueError(f"Invalid ADW ID: {adw_id}")
+    return os.path.join(PROJECT_ROOT, "agents", adw_id, "events.jsonl")
+
+
+def read_events(adw_id: str, offset: int = 0) -> Tuple[List[str], int]:
+    """Read complete event lines written after offset.
+
+    Returns (lines, new_offset). A partially written last line is left for the
+    next read.
+    """
+    path = events_path(adw_id)
+    if not os.path.exists(path):
+        return [], offset
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    lines = [line.decode() for line in data[:end].splitlines() if line.strip()]
+    return lines, offset + end
+
+
+class AgentEventTracker:
+    """on_message callback that records progress events for one agent run."""
+
+    def __init__(self, adw_id: str, agent_name: str):
+        self.adw_id = adw_id
+        self.agent_name = agent_name
+        self.turn = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        # Claude Code splits one API response into several assistant messages
+        # that share message.id and repeat its usage; count each id once
+        self._seen_message_ids: Set[str] = set()
+        self.path = events_path(adw_id)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+    def __call__(self, message: Dict[str, Any]) -> None:
+        for event in self.parse(message):
+            self.emit(event)
+
+    def parse(self, message: Dict[str, Any]) -> List[AgentEvent]:
+        """Convert one stream-json message into zero or more events."""
+        message_type = message.get("type")
+
+        if message_type == "system" and message.get("subtype") == "init":
+            return [self._event("agent_started", text=message.get("model"))]
+
+        if message_type == "assistant":
+            body = message.get("message", {})
+            message_id = body.get("id")
+            if message_id is None or message_id not in self._seen_message_ids:
+                if message_id is not None:
+                    self._seen_message_ids.add(message_id)
+                usage = body.get("usage", {})
+                self.turn += 1
+                self.input_tokens += (
+                    usage.get("input_tokens", 0)
+                    + usage.get("cache_creation_input_tokens", 0)
+                    + usage.get("cache_read_input_tokens", 0)
+                )
+                self.output_tokens += usage.get("output_tokens", 0)
+
+            events = []
+            for block in body.get("content", []):
+                if block.get("type") == "tool_use":
+                    events.append(self._event("tool_call", tool=block.get("name")))
+                elif block.get("type") == "text" and block.get("text", "").strip():
+                    text = block["text"].strip().splitlines()[0][:200]
+                    events.append(self._event("assistant_turn", text=text))
+            return events or [self._event("assistant_turn")]
+
+        if message_type == "result":
+            # The result carries the authoritative totals for the whole run
+            usage = message.get("usage", {})
+            if usage:
+                self.input_tokens = (
+                    usage.get("input_tokens", 0)
+                    + usage.get("cache_creation_input_tokens", 0)
+                    + usage.get("cache_read_input_tokens", 0)
+                )
+                self.output_tokens = usage.get("output_tokens", self.output_tokens)
+            return [self._event(
+                "agent_finished",
+                text=message.get("subtype"),
+                cost_usd=message.get("total_cost_usd"),
+                is_error=message.get("is_error", False),
+            )]
+
+        return []
+
+    def emit(self, event: AgentEvent) -> None:
+        """Append an event to events.jsonl and the workflow's execution log."""
+        with _write_lock:
+            with open(self.path, "a") as f:
+                f.write(event.model_dump_json() + "\n")
+        get_logger(self.adw_id).info(format_event(event))
+
+    def _event(self, event: str, **fields: Any) -> AgentEvent:
+        return AgentEvent(
+            adw_id=self.adw_id,
+            agent_name=self.agent_name,
+            event=event,
+            turn=self.turn,
+            input_tokens=self.input_tokens,
+            output_tokens=self.output_tokens,
+            **fields,
+        )
+
+
+def format_event(event: AgentEvent) -> str:
+    """Return a one-line log summary of an event."""
+    tokens = f"{event.input_tokens} in / {event.output_tokens} out tokens"
+    if event.event == "agent_started":
+        detail = f"started ({event.text})"
+    elif event.event == "tool_call":
+        detail = f"turn {event.turn} tool: {event.tool}"
+    elif event.event == "assistant_turn":
+        detail = f"turn {event.turn}" + (f": {event.text}" if event.text else "")
+    else:
+        cost = f", ${event.cost_usd:.4f}" if event.cost_usd is not None else ""
+        detail = f"finished {event.text} after {event.turn} turns{cost}"
+    return f"[{event.agent_name}] {detail} ({tokens})"
@@ -11,14 +11,212 @@ This module contains all GitHub-related operations including:
 - Comment posting
 - Repository path extraction
 - Issue status management
+
+Each operation runs either through the `gh` CLI or through the pooled HTTP
+client in github_http.py, which reuses connections instead of starting a
+process per call.
+
+Every call is counted against a shared rate limit budget (rate_limit_budget),
+updated from response headers. Polling slows down and status comments wait
+when the budget runs low, leaving the rest for workflow-critical calls.
+
+Environment:
+- ADW_GITHUB_BACKEND: "http", "gh" or "auto" (default: auto, which uses http
+  when GITHUB_PAT is set and gh otherwise)
+- ADW_RATE_LIMIT_STATUS_RESERVE: Remaining calls below which status comments
+  wait for the reset (default: 500)
+- ADW_RATE_LIMIT_POLL_SHARE: Share of the remaining budget polling may use
+  before the reset (default: 0.5)
+- ADW_RATE_LIMIT_REFRESH_SECONDS: Age after which the budget is re-read from
+  the rate_limit endpoint, which is free (default: 60)
 """
 
 import subprocess
 import sys
 import os
 import json
-from typing import Dict, List, Optional
-from data_types import GitHubIssue, GitHubIssueListItem
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+from data_types import (
+    GitHubCallPriority,
+    GitHubIssue,
+    GitHubIssueListItem,
+    GitHubLabel,
+    GitHubRateLimit,
+)
+from github_http import GitHubAPIError, get_client, get_token, response_listeners
+
+GITHUB_BACKEND = os.getenv("ADW_GITHUB_BACKEND", "auto").lower()
+
+
+def use_http_backend() -> bool:
+    """Check whether API calls go through the HTTP client instead of gh."""
+    if GITHUB_BACKEND in ("http", "gh"):
+        return GITHUB_BACKEND == "http"
+    # gh keeps its own login, the HTTP client needs a token
+    return get_token() is not None
+
+
+class RateLimitBudget:
+    """Shared view of the GitHub API rate limit and of the calls made against it.
+
+    Remaining calls come from GitHub's headers, so they reflect every process
+    using the token; call counts are for this process only.
+    """
+
+    def __init__(
+        self,
+        status_reserve: int = int(os.getenv("ADW_RATE_LIMIT_STATUS_RESERVE", "500")),
+        poll_share: float = float(os.getenv("ADW_RATE_LIMIT_POLL_SHARE", "0.5")),
+        refresh_seconds: float = float(os.getenv("ADW_RATE_LIMIT_REFRESH_SECONDS", "60")),
+    ):
+        self.status_reserve = status_reserve
+        self.poll_share = poll_share
+        self.refresh_seconds = refresh_seconds
+        self.started_at = time.time()
+        self.updated_at = 0.0
+        self.calls: Dict[str, int] = {"critical": 0, "poll": 0, "status": 0}
+        self._limits: Dict[str, GitHubRateLimit] = {}
+        self._lock = threading.Lock()
+
+    def update(self, headers: Dict[str, str]) -> None:
+        """Record the x-ratelimit-* headers of a response."""
+        if "x-ratelimit-remaining" not in headers:
+            return
+        resource = headers.get("x-ratelimit-resource", "core")
+        limit = GitHubRateLimit(
+            resource=resource,
+            limit=int(headers.get("x-ratelimit-limit", 0)),
+            remaining=int(headers["x-ratelimit-remaining"]),
+            reset_at=float(headers.get("x-ratelimit-reset", 0)),
+        )
+        with self._lock:
+            self._limits[resource] = limit
+            self.updated_at = time.time()
+
+    def record_call(self, priority: GitHubCallPriority) -> None:
+        with self._lock:
+            self.calls[priority] += 1
+
+    def refresh(self, force: bool = False) -> None:
+        """Re-read all limits from the rate_limit endpoint when stale.
+
+        Needed for the gh backend, whose commands don't show headers. The
+        endpoint does not count against the limit.
+        """
+        if not force and time.time() - self.updated_at < self.refresh_seconds:
+            return
+        try:
+            if use_http_backend():
+                resources = get_client().request_json("GET", "rate_limit")["resources"]
+            else:
+                result = subprocess.run(
+                    ["gh", "api", "rate_limit", "--jq", ".resources"],
+                    capture_output=True, text=True, check=True, env=get_github_env(),
+                )
+                resources = json.loads(result.stdout)
+        except (GitHubAPIError, OSError, subprocess.CalledProcessError, ValueError) as e:
+            print(f"ERROR: Failed to read GitHub rate limit: {e}", file=sys.stderr)
+            # Don't retry on every call; keep the last known state until the next refresh
+            self.updated_at = time.time()
+            return
+
+        with self._lock:
+            for resource in ("core", "graphql"):
+                if resource in resources:
+                    data = resources[resource]
+                    self._limits[resource] = GitHubRateLimit(
+                        resource=resource,
+                        limit=data["limit"],
+                        remaining=data["remaining"],
+                        reset_at=data["reset"],
+                    )
+            self.updated_at = time.time()
+
+    def get(self, resource: str = "core") -> Optional[GitHubRateLimit]:
+        """Return the current limit, treated as full once its reset time has passed."""
+        with self._lock:
+            limit = self._limits.get(resource)
+        if limit and time.time() >= limit.reset_at:
+            return limit.model_copy(update={"remaining": limit.limit})
+        return limit
+
+    def seconds_until_reset(self, resource: str = "core") -> float:
+        limit = self.get(resource)
+        return max(0.0, limit.reset_at - time.time()) if limit else 0.0
+
+    def allow(self, priority: GitHubCallPriority, resource: str = "core") -> bool:
+        """Check whether a call of this priority should be made now."""
+        if priority == "critical":
+            return True
+        self.refresh()
+        limit = self.get(resource)
+        if limit is None:
+            return True
+        if priority == "status":
+            return limit.remaining > self.status_reserve
+        return limit.remaining > 0
+
+    def poll_interval(self, base_seconds: float) -> float:
+        """Seconds between poll cycles that keep polling within its share of the budget.
+
+        A cycle costs at most one call per resource, so the interval is
+        stretched until the polls before the reset fit into poll_share of the
+        remaining calls above the status reserve.
+        """
+        self.refresh()
+        interval = base_seconds
+        for resource in ("core", "graphql"):
+            limit = self.get(resource)
+            if limit is None:
+                continue
+            until_reset = self.seconds_until_reset(resource)
+            spendable = (limit.remaining - self.status_reserve) * self.poll_share
+            if spendable < 1:
+                interval = max(interval, until_reset + 1)
+            else:
+                interval = max(interval, until_reset / spendable)
+        return interval
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current budget and usage, for health output."""
+        elapsed_minutes = max((time.time() - self.started_at) / 60, 1 / 60)
+        with self._lock:
+            calls = dict(self.calls)
+        resources = {}
+        for resource in ("core", "graphql"):
+            limit = self.get(resource)
+            if limit:
+                resources[resource] = {
+                    "limit": limit.limit,
+                    "remaining": limit.remaining,
+                    "reset_in_seconds": round(self.seconds_until_reset(resource)),
+                }
+        return {
+            "resources": resources,
+            "calls": calls,
+            "calls_per_minute": round(sum(calls.values()) / elapsed_minutes, 2),
+        }
+
+    def describe(self) -> str:
+        """One-line summary of the budget for logs."""
+        parts = []
+        for resource in ("core", "graphql"):
+            limit = self.get(resource)
+            if limit:
+                parts.append(
+                    f"{resource} {limit.remaining}/{limit.limit} "
+                    f"(reset in {self.seconds_until_reset(resource):.0f}s)"
+                )
+        return ", ".join(parts) or "unknown"
+
+
+rate_limit_budget = RateLimitBudget()
+response_listeners.append(rate_limit_budget.update)
 
 
 def get_github_env() -> Optional[dict]:
@@ -73,8 +271,65 @@ def extract_repo_path(github_url: str) -> str:
     return github_url.replace("https://github.com/", "").replace(".git", "")
 
 
+@lru_cache(maxsize=None)
+def get_repo_path() -> str:
+    """Get owner/repo of the git remote, looked up once per process."""
+    return extract_repo_path(get_repo_url())
+
+
+ISSUE_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    issue(number: $number) {
+      number
+      title
+      body
+      state
+      url
+      createdAt
+      updatedAt
+      closedAt
+      author { login }
+      assignees(first: 100) { nodes { id login name } }
+      labels(first: 100) { nodes { id name color description } }
+      milestone { id number title description state }
+      comments(first: 100) { nodes { id author { login } body createdAt updatedAt } }
+    }
+  }
+}
+"""
+
+
+def fetch_issue_http(issue_number: str, repo_path: str) -> GitHubIssue:
+    """Fetch an issue with its comments in one GraphQL request."""
+    owner, name = repo_path.split("/", 1)
+    data = get_client().graphql(
+        ISSUE_QUERY, {"owner": owner, "name": name, "number": int(issue_number)}
+    )
+    issue_data = data["repository"]["issue"]
+    if issue_data is None:
+        raise GitHubAPIError(404, f"Issue #{issue_number} not found in {repo_path}")
+
+    # Match the shape of `gh issue view --json`
+    for key in ("assignees", "labels", "comments"):
+        issue_data[key] = issue_data[key]["nodes"]
+    # Deleted accounts have no author
+    issue_data["author"] = issue_data["author"] or {"login": "ghost"}
+    for comment in issue_data["comments"]:
+        comment["author"] = comment["author"] or {"login": "ghost"}
+    return GitHubIssue(**issue_data)
+
+
 def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
     """Fetch GitHub issue using gh CLI and return typed model."""
+    rate_limit_budget.record_call("critical")
+    if use_http_backend():
+        try:
+            return fetch_issue_http(issue_number, repo_path)
+        except (GitHubAPIError, OSError) as e:
+            print(f"Error fetching issue: {e}", file=sys.stderr)
+            sys.exit(1)
+
     # Use JSON output for structured data
     cmd = [
         "gh",
@@ -122,9 +377,19 @@ def fetch_issue(issue_number: str, repo_path: str) -> GitHubIssue:
 
 def make_issue_comment(issue_id: str, comment: str) -> None:
     """Post a comment to a GitHub issue using gh CLI."""
-    # Get repo information from git remote
-    github_repo_url = get_repo_url()
-    repo_path = extract_repo_path(github_repo_url)
+    repo_path = get_repo_path()
+    rate_limit_budget.record_call("critical")
+
+    if use_http_backend():
+        try:
+            get_client().request_json(
+                "POST", f"repos/{repo_path}/issues/{issue_id}/comments", {"body": comment}
+            )
+            print(f"Successfully posted comment to issue #{issue_id}")
+        except (GitHubAPIError, OSError) as e:
+            print(f"Error posting comment: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
 
     # Build command
     cmd = [
@@ -154,11 +419,50 @@ def make_issue_comment(issue_id: str, comment: str) -> None:
         sys.exit(1)
 
 
+def create_issue_comment(
+    repo_path: str, issue_number: str, body: str, priority: GitHubCallPriority = "status"
+) -> str:
+    """Post a comment and return its numeric id. Raises RuntimeError on failure."""
+    path = f"repos/{repo_path}/issues/{issue_number}/comments"
+    rate_limit_budget.record_call(priority)
+    if use_http_backend():
+        try:
+            return str(get_client().request_json("POST", path, {"body": body})["id"])
+        except OSError as e:
+            raise RuntimeError(f"POST {path} failed: {e}")
+
+    cmd = ["gh", "api", path, "-f", f"body={body}", "--jq", ".id"]
+    result = subprocess.run(cmd, capture_output=True, text=True, env=get_github_env())
+    if result.returncode != 0:
+        raise RuntimeError(f"POST {path} failed: {result.stderr.strip()}")
+    return result.stdout.strip()
+
+
+def update_issue_comment(repo_path: str, comment_id: str, body: str) -> None:
+    """Replace the body of an existing comment. Raises RuntimeError on failure."""
+    path = f"repos/{repo_path}/issues/comments/{comment_id}"
+    rate_limit_budget.record_call("status")
+    if use_http_backend():
+        try:
+            get_client().request_json("PATCH", path, {"body": body})
+            return
+        except OSError as e:
+            raise RuntimeError(f"PATCH {path} failed: {e}")
+
+    cmd = ["gh", "api", "-X", "PATCH", path, "-f", f"body={body}", "--silent"]
+    result = subprocess.run(cmd, capture_output=True, text=True, env=get_github_env())
+    if result.returncode != 0:
+        raise RuntimeError(f"PATCH {path} failed: {result.stderr.strip()}")
+
+
 def mark_issue_in_progress(issue_id: str) -> None:
     """Mark issue as in progress by adding label and comment."""
-    # Get repo information from git remote
-    github_repo_url = get_repo_url()
-    repo_path = extract_repo_path(github_repo_url)
+    repo_path = get_repo_path()
+    rate_limit_budget.record_call("status")
+
+    if use_http_backend():
+        mark_issue_in_progress_http(issue_id, repo_path)
+        return
 
     # Add "in_progress" label
     cmd = [
@@ -199,56 +503,50 @@ def mark_issue_in_progress(issue_id: str) -> None:
         print(f"Assigned issue #{issue_id} to self")
 
 
-def fetch_open_issues(repo_path: str) -> List[GitHubIssueListItem]:
-    """Fetch all open issues from the GitHub repository."""
+def mark_issue_in_progress_http(issue_id: str, repo_path: str) -> None:
+    """Add the in_progress label and assign the authenticated user via the API."""
+    client = get_client()
+    issue_path = f"repos/{repo_path}/issues/{issue_id}"
     try:
-        cmd = [
-            "gh",
-            "issue",
-            "list",
-            "--repo",
-            repo_path,
-            "--state",
-            "open",
-            "--json",
-            "number,title,body,labels,createdAt,updatedAt",
-            "--limit",
-            "1000",
-        ]
-
-        # Set up environment with GitHub token if available
-        env = get_github_env()
+        client.request_json("POST", f"{issue_path}/labels", {"labels": ["in_progress"]})
+    except (GitHubAPIError, OSError) as e:
+        print(f"Note: Could not add 'in_progress' label: {e}")
 
-        # DEBUG level - not printing command
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, check=True, env=env
-        )
+    try:
+        client.request_json("POST", f"{issue_path}/assignees", {"assignees": [client.get_login()]})
+        print(f"Assigned issue #{issue_id} to self")
+    except (GitHubAPIError, OSError):
+        pass
 
-        issues_data = json.loads(result.stdout)
-        issues = [GitHubIssueListItem(**issue_data) for issue_data in issues_data]
-        print(f"Fetched {len(issues)} open issues")
-        return issues
 
-    except subprocess.CalledProcessError as e:
-        print(f"ERROR: Failed to fetch issues: {e.stderr}", file=sys.stderr)
-        return []
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Failed to parse issues JSON: {e}", file=sys.stderr)
-        return []
+def fetch_issue_comments(repo_path: str, issue_number: int) -> List[Dict]:
+    """Fetch comments for a specific issue, oldest first.
 
+    Comment ids are the numeric REST ids, matching webhook payloads.
+    """
+    path = f"repos/{repo_path}/issues/{issue_number}/comments?per_page=100"
+    rate_limit_budget.record_call("poll")
+
+    if use_http_backend():
+        try:
+            comments = [
+                {"id": str(c["id"]), "body": c["body"] or "", "createdAt": c["created_at"]}
+                for c in get_client().paginate(path)
+            ]
+        except (GitHubAPIError, OSError) as e:
+            print(f"ERROR: Failed to fetch comments for issue #{issue_number}: {e}", file=sys.stderr)
+            return []
+        comments.sort(key=lambda c: c.get("createdAt", ""))
+        return comments
 
-def fetch_issue_comments(repo_path: str, issue_number: int) -> List[Dict]:
-    """Fetch all comments for a specific issue."""
     try:
         cmd = [
             "gh",
-            "issue",
-            "view",
-            str(issue_number),
-            "--repo",
-            repo_path,
-            "--json",
-            "comments",
+            "api",
+            "--paginate",
+            path,
+            "--jq",
+            ".[] | {id: (.id | tostring), body: (.body // \"\"), createdAt: .created_at}",
         ]
 
         # Set up environment with GitHub token if available
@@ -257,8 +555,7 @@ def fetch_issue_comments(repo_path: str, issue_number: int) -> List[Dict]:
         result = subprocess.run(
             cmd, capture_output=True, text=True, check=True, env=env
         )
-        data = json.loads(result.stdout)
-        comments = data.get("comments", [])
+        comments = [json.loads(line) for line in result.stdout.splitlines() if line.strip()]
 
         # Sort comments by creation time
         comments.sort(key=lambda c: c.get("createdAt", ""))
@@ -278,3 +575,234 @@ def fetch_issue_comments(repo_path: str, issue_number: int) -> List[Dict]:
             file=sys.stderr,
         )
         return []
+
+
+def gh_api_request(
+    path: str, headers: Optional[Dict[str, str]] = None
+) -> Tuple[int, Dict[str, str], str]:
+    """Make a REST GET request with `gh api --include` or the HTTP client.
+
+    Returns (status, headers, body). Header names are lower-cased. Unlike
+    plain `gh api`, 304 Not Modified responses are returned, not raised.
+    """
+    rate_limit_budget.record_call("poll")
+    if use_http_backend():
+        try:
+            response = get_client().request("GET", path, headers=headers)
+        except OSError as e:
+            raise RuntimeError(f"GET {path} failed: {e}")
+        return response.status, response.headers, response.text
+
+    cmd = ["gh", "api", "--include", "-H", "Accept: application/vnd.github+json"]
+    for name, value in (headers or {}).items():
+        cmd.extend(["-H", f"{name}: {value}"])
+    cmd.append(path)
+
+    result = subprocess.run(cmd, capture_output=True, text=True, env=get_github_env())
+
+    # gh prints the status line and headers, a blank line, then the body
+    head, _, body = result.stdout.replace("\r\n", "\n").partition("\n\n")
+    lines = head.splitlines()
+    match = re.match(r"HTTP/[\d.]+ (\d{3})", lines[0]) if lines else None
+    if not match:
+        raise RuntimeError(f"gh api {path} failed: {result.stderr.strip()}")
+
+    response_headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        response_headers[name.strip().lower()] = value.strip()
+    rate_limit_budget.update(response_headers)
+    return int(match.group(1)), response_headers, body
+
+
+OPEN_ISSUES_QUERY = """
+query($owner: String!, $name: String!, $since: DateTime, $endCursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(
+      first: 100
+      after: $endCursor
+      states: OPEN
+      filterBy: {since: $since}
+      orderBy: {field: UPDATED_AT, direction: ASC}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        body
+        createdAt
+        updatedAt
+        labels(first: 20) { nodes { id name color description } }
+        comments(last: 1) { totalCount nodes { databaseId body } }
+      }
+    }
+  }
+}
+"""
+
+
+def fetch_open_issues_with_last_comment(
+    repo_path: str, since: Optional[str] = None
+) -> Optional[List[GitHubIssueListItem]]:
+    """Fetch open issues with their latest comment in one paginated GraphQL query.
+
+    With since (ISO 8601), only issues updated at or after that time are
+    returned. The number of API calls depends on pages of 100 issues, not on
+    the number of issues, since no per-issue comment lookups are needed.
+    Returns None if the issues could not be fetched.
+    """
+    rate_limit_budget.record_call("poll")
+    try:
+        if use_http_backend():
+            nodes = fetch_open_issue_nodes_http(repo_path, since)
+        else:
+            nodes = fetch_open_issue_nodes_gh(repo_path, since)
+    except (GitHubAPIError, OSError) as e:
+        print(f"ERROR: Failed to fetch issues: {e}", file=sys.stderr)
+        return None
+    except subprocess.CalledProcessError as e:
+        print(f"ERROR: Failed to fetch issues: {e.stderr}", file=sys.stderr)
+        return None
+    except json.JSONDecodeError as e:
+        print(f"ERROR: Failed to parse issues JSON: {e}", file=sys.stderr)
+        return None
+
+    issues = []
+    for node in nodes:
+        last_comments = node["comments"]["nodes"]
+        last_comment = last_comments[0] if last_comments else None
+        issues.append(GitHubIssueListItem(
+            number=node["number"],
+            title=node["title"],
+            body=node.get("body") or "",
+            labels=[GitHubLabel(**label) for label in node["labels"]["nodes"]],
+            createdAt=node["createdAt"],
+            updatedAt=node["updatedAt"],
+            comment_count=node["comments"]["totalCount"],
+            last_comment_id=str(last_comment["databaseId"]) if last_comment else None,
+            last_comment_body=last_comment["body"] if last_comment else None,
+        ))
+    return issues
+
+
+def fetch_open_issue_nodes_http(repo_path: str, since: Optional[str]) -> List[Dict[str, Any]]:
+    """Run OPEN_ISSUES_QUERY page by page over the HTTP client."""
+    owner, name = repo_path.split("/", 1)
+    client = get_client()
+    nodes: List[Dict[str, Any]] = []
+    cursor = None
+    while True:
+        data = client.graphql(
+            OPEN_ISSUES_QUERY,
+            {"owner": owner, "name": name, "since": since, "endCursor": cursor},
+        )
+        page = data["repository"]["issues"]
+        nodes.extend(page["nodes"])
+        if not page["pageInfo"]["hasNextPage"]:
+            return nodes
+        cursor = page["pageInfo"]["endCursor"]
+
+
+def fetch_open_issue_nodes_gh(repo_path: str, since: Optional[str]) -> List[Dict[str, Any]]:
+    """Run OPEN_ISSUES_QUERY with `gh api graphql --paginate`."""
+    owner, name = repo_path.split("/", 1)
+    cmd = [
+        "gh",
+        "api",
+        "graphql",
+        "--paginate",
+        "-f",
+        f"query={OPEN_ISSUES_QUERY}",
+        "-F",
+        f"owner={owner}",
+        "-F",
+        f"name={name}",
+        "-F",
+        f"since={since or 'null'}",
+        "--jq",
+        ".data.repository.issues.nodes[]",
+    ]
+    result = subprocess.run(
+        cmd, capture_output=True, text=True, check=True, env=get_github_env()
+    )
+    return [json.loads(line) for line in result.stdout.splitlines() if line.strip()]
+
+
+class IssuePoller:
+    """Incremental poller for open issues.
+
+    Each poll first sends a conditional request for the most recently updated
+    open issue. A quiet repository answers 304 Not Modified, which GitHub does
+    not count against the rate limit. Otherwise the issues updated since the
+    newest update seen so far are fetched, with their latest comments, in one
+    GraphQL query.
+    """
+
+    def __init__(self, repo_path: str):
+        self.repo_path = repo_path
+        self.since: Optional[str] = None
+        self.etag: Optional[str] = None
+        # Issue number -> updatedAt of the version already seen, for issues
+        # the next incremental fetch can return again unchanged
+        self.seen: Dict[int, str] = {}
+
+    def has_changes(self) -> Tuple[bool, Optional[str]]:
+        """Check with a conditional request whether any open issue changed.
+
+        Returns (changed, etag). The caller stores the ETag only once the
+        changes have been fetched, so a failed fetch is retried next poll
+        instead of being answered 304 from then on.
+        """
+        path = (
+            f"repos/{self.repo_path}/issues?"
+            + urlencode({"state": "open", "sort": "updated", "direction": "desc", "per_page": 1})
+        )
+        headers = {"If-None-Match": self.etag} if self.etag else {}
+        try:
+            status, response_headers, _ = gh_api_request(path, headers)
+        except RuntimeError as e:
+            print(f"ERROR: Failed to poll issues: {e}", file=sys.stderr)
+            return False, None
+        if status == 304:
+            return False, None
+        if status != 200:
+            print(f"ERROR: Failed to poll issues: HTTP {status}", file=sys.stderr)
+            return False, None
+        return True, response_headers.get("etag")
+
+    def poll(self) -> List[GitHubIssueListItem]:
+        """Return open issues that changed since the last poll, with their latest comment."""
+        changed_upstream, etag = self.has_changes()
+        if not changed_upstream:
+            print("Issues unchanged since last poll (304 Not Modified)")
+            return []
+
+        issues = fetch_open_issues_with_last_comment(self.repo_path, self.since)
+        if issues is None:
+            return []
+        self.etag = etag
+
+        changed = []
+        for issue in issues:
+            updated_at = issue.updated_at.isoformat()
+            if self.seen.get(issue.number) == updated_at:
+                continue
+            self.seen[issue.number] = updated_at
+            changed.append(issue)
+            if not self.since or issue.updated_at.isoformat() > self.since:
+                self.since = updated_at
+
+        # Only issues updated at the since cursor can come back unchanged (the
+        # filter is inclusive); closed issues and older updates are dropped so
+        # the map does not grow for the life of the process
+        latest = {issue.number for issue in issues}
+        self.seen = {
+            number: updated_at
+            for number, updated_at in self.seen.items()
+            if number in latest and updated_at >= self.since
+        }
+
+        print(f"Fetched {len(changed)} changed open issues")
+        return changed
+
+
@@ -0,0 +1,300 @@
+"""
+GitHub HTTP Client - AI Developer Workflow (ADW)
+
+Talks to the GitHub REST and GraphQL APIs directly instead of forking a `gh`
+process per call. Connections are kept alive in a small pool, so after the
+first request each call skips process startup and the TLS handshake. When the
+server drops an idle pooled connection, the request is resent on a new one
+only if it was not sent yet or is idempotent, so a comment is never posted
+twice.
+
+Response headers are passed to response_listeners, which github.py uses to
+track the rate limit budget. When GitHub rejects a request for exceeding the
+primary or secondary rate limit, the client waits for the reset (up to a cap)
+and retries once.
+
+Environment:
+- GITHUB_PAT: Token used for API requests (GH_TOKEN or GITHUB_TOKEN also work)
+- ADW_GITHUB_API_URL: API base URL (default: https://api.github.com)
+- ADW_GITHUB_POOL_SIZE: Idle connections kept open (default: 4)
+- ADW_GITHUB_TIMEOUT_SECONDS: Socket timeout per request (default: 30)
+- ADW_GITHUB_MAX_RATE_WAIT_SECONDS: Longest wait for a rate limit reset (default: 60)
+"""
+
+import http.client
+import json
+import os
+import queue
+import re
+import select
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+API_URL = os.getenv("ADW_GITHUB_API_URL", "https://api.github.com").rstrip("/")
+POOL_SIZE = int(os.getenv("ADW_GITHUB_POOL_SIZE", "4"))
+TIMEOUT_SECONDS = float(os.getenv("ADW_GITHUB_TIMEOUT_SECONDS", "30"))
+MAX_RATE_WAIT_SECONDS = float(os.getenv("ADW_GITHUB_MAX_RATE_WAIT_SECONDS", "60"))
+
+USER_AGENT = "adw-github-client"
+NEXT_LINK_PATTERN = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+# Errors raised when a pooled connection was closed by the server while idle
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+# Requests that can be resent safely when the connection drops after sending
+IDEMPOTENT_METHODS = ("GET", "HEAD", "PUT", "DELETE", "OPTIONS")
+
+
+def get_token() -> Optional[str]:
+    """Return the GitHub token from the environment, if any."""
+    return os.getenv("GITHUB_PAT") or os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN")
+
+
+class GitHubAPIError(RuntimeError):
+    """Raised for unsuccessful GitHub API responses."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"GitHub API error {status}: {message}")
+        self.status = status
+
+
+class GitHubResponse:
+    """Status, lower-cased headers and body of an API response."""
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.body) if self.body else None
+
+
+# Called with the headers of every response, e.g. to track the rate limit budget
+response_listeners: List[Callable[[Dict[str, str]], None]] = []
+
+
+def notify_listeners(headers: Dict[str, str]) -> None:
+    for listener in response_listeners:
+        listener(headers)
+
+
+def rate_limit_wait(status: int, headers: Dict[str, str]) -> Optional[float]:
+    """Seconds to wait before retrying a rate limited response, or None if not rate limited."""
+    if status not in (403, 429):
+        return None
+    if "retry-after" in headers:
+        return float(headers["retry-after"])
+    if headers.get("x-ratelimit-remaining") == "0" and "x-ratelimit-reset" in headers:
+        return max(0.0, float(headers["x-ratelimit-reset"]) - time.time()) + 1
+    return None
+
+
+def is_closed_by_server(conn: http.client.HTTPConnection) -> bool:
+    """Check whether an idle keep-alive connection was closed by the server.
+
+    An idle connection has nothing to read, so a readable socket means EOF.
+    """
+    if conn.sock is None:
+        return False
+    try:
+        readable, _, _ = select.select([conn.sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+class GitHubClient:
+    """Thread-safe GitHub API client over pooled keep-alive connections."""
+
+    def __init__(
+        self,
+        api_url: str = API_URL,
+        token: Optional[str] = None,
+        pool_size: int = POOL_SIZE,
+        timeout: float = TIMEOUT_SECONDS,
+    ):
+        parts = urlsplit(api_url)
+        self.scheme = parts.scheme
+        self.netloc = parts.netloc
+        self.base_path = parts.path.rstrip("/")
+        self.token = token if token is not None else get_token()
+        self.timeout = timeout
+        self._pool: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue(pool_size)
+        self._login: Optional[str] = None
+        self._login_lock = threading.Lock()
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(self.netloc, timeout=self.timeout)
+
+    def _get_connection(self, method: str) -> http.client.HTTPConnection:
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                return self._new_connection()
+            # A request that cannot be resent should not go out on a connection
+            # the server has already closed
+            if method in IDEMPOTENT_METHODS or not is_closed_by_server(conn):
+                return conn
+            conn.close()
+
+    def _release_connection(self, conn: http.client.HTTPConnection) -> None:
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _send(
+        self, method: str, path: str, body: Optional[bytes], headers: Dict[str, str]
+    ) -> GitHubResponse:
+        conn = self._get_connection(method)
+        for attempt in range(2):
+            sent = False
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                sent = True
+                response = conn.getresponse()
+                data = response.read()
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                # The server closed the idle connection. Retry on a fresh one, unless
+                # the request went out and repeating it could apply it twice
+                if attempt or (sent and method not in IDEMPOTENT_METHODS):
+                    raise
+                conn = self._new_connection()
+                continue
+            except Exception:
+                conn.close()
+                raise
+
+            response_headers = {name.lower(): value for name, value in response.getheaders()}
+            if response.will_close:
+                conn.close()
+            else:
+                self._release_connection(conn)
+            return GitHubResponse(response.status, response_headers, data)
+        raise AssertionError("unreachable")
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        json_body: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> GitHubResponse:
+        """Send a request and return the response, whatever its status.
+
+        path is relative to the API URL (e.g. "repos/owner/repo/issues") or an
+        absolute URL on the same host, such as a Link header.
+        """
+        if path.startswith(("http://", "https://")):
+            parts = urlsplit(path)
+            path = parts.path + (f"?{parts.query}" if parts.query else "")
+        else:
+            path = f"{self.base_path}/{path.lstrip('/')}"
+
+        request_headers = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": USER_AGENT,
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        if self.token:
+            request_headers["Authorization"] = f"Bearer {self.token}"
+        body = None
+        if json_body is not None:
+            body = json.dumps(json_body).encode()
+            request_headers["Content-Type"] = "application/json"
+        request_headers.update(headers or {})
+
+        response = self._send(method, path, body, request_headers)
+        notify_listeners(response.headers)
+
+        wait = rate_limit_wait(response.status, response.headers)
+        if wait is not None and wait <= MAX_RATE_WAIT_SECONDS:
+            print(
+                f"INFO: GitHub rate limit hit, retrying {method} {path} in {wait:.0f}s",
+                file=sys.stderr,
+            )
+            time.sleep(wait)
+            response = self._send(method, path, body, request_headers)
+            notify_listeners(response.headers)
+        return response
+
+    def request_json(self, method: str, path: str, json_body: Any = None) -> Any:
+        """Send a request and return the decoded body, raising GitHubAPIError on failure."""
+        response = self.request(method, path, json_body)
+        if response.status >= 400:
+            raise GitHubAPIError(response.status, error_message(response))
+        return response.json()
+
+    def paginate(self, path: str) -> Iterator[Any]:
+        """Yield the items of every page of a list endpoint, following Link headers."""
+        next_path: Optional[str] = path
+        while next_path:
+            response = self.request("GET", next_path)
+            if response.status >= 400:
+                raise GitHubAPIError(response.status, error_message(response))
+            yield from response.json()
+            match = NEXT_LINK_PATTERN.search(response.headers.get("link", ""))
+            next_path = match.group(1) if match else None
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a GraphQL query and return its data, raising GitHubAPIError on errors."""
+        payload = {"query": query, "variables": variables or {}}
+        response = self.request("POST", "graphql", payload)
+        result = response.json() if response.body else {}
+        if response.status >= 400 or result.get("errors"):
+            messages = [e.get("message", "") for e in result.get("errors", [])]
+            raise GitHubAPIError(response.status, "; ".join(messages) or error_message(response))
+        return result["data"]
+
+    def get_login(self) -> str:
+        """Return the login of the authenticated user, fetched once."""
+        with self._login_lock:
+            if self._login is None:
+                self._login = self.request_json("GET", "user")["login"]
+            return self._login
+
+
+def error_message(response: GitHubResponse) -> str:
+    """Extract GitHub's error message from a response body."""
+    try:
+        return response.json().get("message", response.text)
+    except (ValueError, AttributeError):
+        return response.text
+
+
+_client: Optional[GitHubClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> GitHubClient:
+    """Return the process-wide client, so connections are shared between calls."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = GitHubClient()
+        return _client
@@ -17,7 +17,11 @@ This script performs comprehensive health checks:
 1. Validates all required environment variables
 2. Checks git repository configuration
 3. Tests Claude Code CLI functionality
-4. Returns structured results
+4. Reports the GitHub API rate limit budget
+5. Returns structured results
+
+The webhook server runs the same checks on a schedule with HealthMonitor and
+serves the cached result, since the Claude Code check runs a real prompt.
 """
 
 import os
@@ -25,6 +29,8 @@ import sys
 import json
 import subprocess
 import tempfile
+import threading
+import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pathlib import Path
@@ -34,7 +40,7 @@ from dotenv import load_dotenv
 from pydantic import BaseModel
 
 # Import git repo functions from github module
-from github import get_repo_url, extract_repo_path, make_issue_comment
+from github import get_repo_url, extract_repo_path, make_issue_comment, rate_limit_budget
 
 # Load environment variables
 load_dotenv()
@@ -253,6 +259,27 @@ def check_github_cli() -> CheckResult:
         )
 
 
+def check_github_rate_limit() -> CheckResult:
+    """Report the remaining GitHub API budget (reading it does not use any)."""
+    rate_limit_budget.refresh(force=True)
+    snapshot = rate_limit_budget.snapshot()
+    core = snapshot["resources"].get("core")
+    if core is None:
+        return CheckResult(success=False, error="Could not read GitHub API rate limit")
+
+    warning = None
+    if core["remaining"] <= rate_limit_budget.status_reserve:
+        warning = (
+            f"GitHub API budget low: {core['remaining']}/{core['limit']} calls left, "
+            f"resets in {core['reset_in_seconds']}s; status comments are held until then"
+        )
+    details = {
+        f"{resource}_remaining": f"{limit['remaining']}/{limit['limit']} (resets in {limit['reset_in_seconds']}s)"
+        for resource, limit in snapshot["resources"].items()
+    }
+    return CheckResult(success=True, warning=warning, details=details)
+
+
 def run_health_check() -> HealthCheckResult:
     """Run all health checks and return results."""
     result = HealthCheckResult(
@@ -291,6 +318,17 @@ def run_health_check() -> HealthCheckResult:
         if gh_check.error:
             result.errors.append(gh_check.error)
 
+    # Check GitHub API budget
+    if gh_check.success:
+        rate_limit_check = check_github_rate_limit()
+        result.checks["github_rate_limit"] = rate_limit_check
+        if not rate_limit_check.success:
+            result.success = False
+            if rate_limit_check.error:
+                result.errors.append(rate_limit_check.error)
+        elif rate_limit_check.warning:
+            result.warnings.append(rate_limit_check.warning)
+
     # Check Claude Code - only if we have the API key
     if os.getenv("ANTHROPIC_API_KEY"):
         claude_check = check_claude_code()
@@ -308,6 +346,87 @@ def run_health_check() -> HealthCheckResult:
     return result
 
 
+class HealthMonitor:
+    """Runs the health checks in a background thread and caches the latest result."""
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self.result: Optional[HealthCheckResult] = None
+        self.checked_at: Optional[float] = None
+        self._run_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Run the first check right away, then every interval_seconds."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="adw-health", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def run(self) -> HealthCheckResult:
+        """Run the checks now and cache the result.
+
+        Callers arriving while a run is in progress wait for it and share its
+        result instead of starting another one.
+        """
+        if not self._run_lock.acquire(blocking=False):
+            # A run is already in progress; wait for it and share its result
+            with self._run_lock:
+                return self.result
+        try:
+            try:
+                result = run_health_check()
+            except Exception as e:
+                result = HealthCheckResult(
+                    success=False,
+                    timestamp=datetime.now().isoformat(),
+                    checks={},
+                    errors=[f"Health check failed: {e}"],
+                )
+            previous = self.result
+            self.result, self.checked_at = result, time.time()
+        finally:
+            self._run_lock.release()
+
+        if previous is None or previous.success != result.success:
+            if result.success:
+                print("INFO: Health check healthy")
+            else:
+                print(f"ERROR: Health check unhealthy: {'; '.join(result.errors)}")
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Latest result and its age, without running any checks."""
+        if self.result is None:
+            # No check has finished yet, so there is no fresh result either
+            return {
+                "status": "pending",
+                "checked_at": None,
+                "age_seconds": None,
+                "stale": True,
+                "health_check": None,
+            }
+        age = time.time() - self.checked_at
+        return {
+            "status": "healthy" if self.result.success else "unhealthy",
+            "checked_at": datetime.fromtimestamp(self.checked_at).isoformat(),
+            "age_seconds": round(age),
+            # A check is overdue when the last scheduled run is hanging
+            "stale": age > 2 * self.interval_seconds,
+            "health_check": self.result.model_dump(),
+        }
+
+    def _loop(self) -> None:
+        while not self._stopping.is_set():
+            self.run()
+            self._stopping.wait(self.interval_seconds)
+
+
 def main():
     """Main entry point."""
     # Parse command line arguments
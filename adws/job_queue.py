@@ -0,0 +1,354 @@
+"""
+Job Queue - AI Developer Workflow (ADW)
+
+Durable SQLite-backed queue of ADW workflow runs shared by the triggers and
+the scheduler workers, so queued work survives restarts and is never run twice.
+
+Jobs move through: queued -> running -> succeeded | failed | cancelled
+- Deduplication: one job per (repository, issue, triggering comment). New-issue
+  triggers use an empty comment id.
+- One active workflow per issue: a job is not claimed while another job for
+  the same issue is running.
+- Leases: a worker owns a running job only while it keeps renewing its lease.
+  Jobs whose lease expired (crashed worker) are claimed again by other workers.
+- Retries: failed attempts are re-queued with exponential backoff until
+  max_attempts is reached.
+
+Environment:
+- ADW_QUEUE_DB: Path to the queue database (default: agents/job_queue.db)
+- ADW_JOB_MAX_ATTEMPTS: Attempts per job before it is marked failed (default: 2)
+- ADW_JOB_RETRY_BACKOFF_SECONDS: Delay before the first retry, doubled per attempt (default: 60)
+"""
+
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from data_types import WorkflowJob
+from utils import make_adw_id
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+QUEUE_DB_PATH = os.getenv(
+    "ADW_QUEUE_DB", os.path.join(PROJECT_ROOT, "agents", "job_queue.db")
+)
+MAX_ATTEMPTS = int(os.getenv("ADW_JOB_MAX_ATTEMPTS", "2"))
+RETRY_BACKOFF_SECONDS = float(os.getenv("ADW_JOB_RETRY_BACKOFF_SECONDS", "60"))
+
+JOB_COLUMNS = (
+    "id, issue_number, comment_id, repo_path, adw_id, reason, state, attempts, "
+    "max_attempts, available_at, lease_owner, lease_expires_at, exit_code, "
+    "last_error, created_at, updated_at"
+)
+
+
+class JobQueue:
+    """SQLite job queue safe to share between threads and processes."""
+
+    def __init__(self, db_path: str = QUEUE_DB_PATH, max_attempts: int = MAX_ATTEMPTS):
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._init_db()
+
+    @contextmanager
+    def _connect(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one transaction.
+
+        immediate=True takes the write lock up front so that read-then-update
+        sequences (claiming a job) are atomic across processes.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            yield conn
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _init_db(self) -> None:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    issue_number INTEGER NOT NULL,
+                    comment_id TEXT NOT NULL DEFAULT '',
+                    repo_path TEXT NOT NULL,
+                    adw_id TEXT NOT NULL,
+                    reason TEXT NOT NULL DEFAULT '',
+                    state TEXT NOT NULL DEFAULT 'queued',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    available_at REAL NOT NULL,
+                    lease_owner TEXT,
+                    lease_expires_at REAL,
+                    exit_code INTEGER,
+                    last_error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    UNIQUE (repo_path, issue_number, comment_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_jobs_state_available
+                    ON jobs (state, available_at);
+                CREATE INDEX IF NOT EXISTS idx_jobs_issue
+                    ON jobs (repo_path, issue_number, state);
+            """)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def enqueue(
+        self,
+        issue_number: int,
+        repo_path: str,
+        comment_id: Optional[str] = None,
+        reason: str = "",
+    ) -> Optional[WorkflowJob]:
+        """Queue a workflow run. Returns None if this trigger was already queued."""
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                INSERT OR IGNORE INTO jobs
+                    (issue_number, comment_id, repo_path, adw_id, reason, state,
+                     max_attempts, available_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, 'queued', ?, ?, ?, ?)
+                """,
+                (issue_number, str(comment_id or ""), repo_path, make_adw_id(),
+                 reason, self.max_attempts, now, now, now),
+            )
+            if cursor.rowcount == 0:
+                return None
+            row = conn.execute(
+                f"SELECT {JOB_COLUMNS} FROM jobs WHERE id = ?", (cursor.lastrowid,)
+            ).fetchone()
+        return _row_to_job(row)
+
+    def claim(
+        self, worker_id: str, lease_seconds: float, max_per_repo: int
+    ) -> Optional[WorkflowJob]:
+        """Claim the oldest runnable job and lease it to worker_id.
+
+        Runnable jobs are queued jobs whose backoff has elapsed and running jobs
+        whose lease expired. Repositories already running max_per_repo jobs and
+        issues with a running job are skipped.
+        """
+        now = time.time()
+        with self._connect(immediate=True) as conn:
+            row = conn.execute(
+                f"""
+                SELECT {JOB_COLUMNS} FROM jobs AS j
+                WHERE (
+                    (j.state = 'queued' AND j.available_at <= :now)
+                    OR (j.state = 'running' AND j.lease_expires_at < :now)
+                )
+                AND (
+                    SELECT COUNT(*) FROM jobs AS r
+                    WHERE r.repo_path = j.repo_path
+                      AND r.state = 'running'
+                      AND r.lease_expires_at >= :now
+                ) < :max_per_repo
+                AND NOT EXISTS (
+                    SELECT 1 FROM jobs AS i
+                    WHERE i.repo_path = j.repo_path
+                      AND i.issue_number = j.issue_number
+                      AND i.id != j.id
+                      AND i.state = 'running'
+                      AND i.lease_expires_at >= :now
+                )
+                ORDER BY j.available_at, j.id
+                LIMIT 1
+                """,
+                {"now": now, "max_per_repo": max_per_repo},
+            ).fetchone()
+            if row is None:
+                return None
+
+            # An expired lease counts as a failed attempt
+            if row["state"] == "running" and row["attempts"] >= row["max_attempts"]:
+                conn.execute(
+                    """
+                    UPDATE jobs SET state = 'failed', lease_owner = NULL,
+                        last_error = 'Lease expired', updated_at = ?
+                    WHERE id = ?
+                    """,
+                    (now, row["id"]),
+                )
+                return None
+
+            conn.execute(
+                """
+                UPDATE jobs SET state = 'running', attempts = attempts + 1,
+                    lease_owner = ?, lease_expires_at = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (worker_id, now + lease_seconds, now, row["id"]),
+            )
+            row = conn.execute(
+                f"SELECT {JOB_COLUMNS} FROM jobs WHERE id = ?", (row["id"],)
+            ).fetchone()
+        return _row_to_job(row)
+
+    def heartbeat(self, job_id: int, worker_id: str, lease_seconds: float) -> bool:
+        """Extend a job lease. Returns False if the worker no longer owns the job."""
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs SET lease_expires_at = ?, updated_at = ?
+                WHERE id = ? AND state = 'running' AND lease_owner = ?
+                """,
+                (now + lease_seconds, now, job_id, worker_id),
+            )
+            return cursor.rowcount > 0
+
+    def complete(self, job_id: int, worker_id: str) -> None:
+        """Mark a job as succeeded."""
+        with self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE jobs SET state = 'succeeded', exit_code = 0, lease_owner = NULL,
+                    lease_expires_at = NULL, updated_at = ?
+                WHERE id = ? AND lease_owner = ?
+                """,
+                (time.time(), job_id, worker_id),
+            )
+
+    def fail(
+        self, job_id: int, worker_id: str, error: str, exit_code: Optional[int] = None
+    ) -> str:
+        """Record a failed attempt. Re-queues with backoff while attempts remain.
+
+        Returns the job's new state.
+        """
+        now = time.time()
+        with self._connect(immediate=True) as conn:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND lease_owner = ?",
+                (job_id, worker_id),
+            ).fetchone()
+            if row is None:
+                # Cancelled or taken over by another worker; leave it as is
+                row = conn.execute("SELECT state FROM jobs WHERE id = ?", (job_id,)).fetchone()
+                return row["state"] if row else "unknown"
+
+            if row["attempts"] < row["max_attempts"]:
+                state = "queued"
+                available_at = now + RETRY_BACKOFF_SECONDS * (2 ** (row["attempts"] - 1))
+            else:
+                state = "failed"
+                available_at = now
+
+            conn.execute(
+                """
+                UPDATE jobs SET state = ?, available_at = ?, exit_code = ?, last_error = ?,
+                    lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+                WHERE id = ?
+                """,
+                (state, available_at, exit_code, error[-2000:], now, job_id),
+            )
+        return state
+
+    def cancel(self, adw_id: str) -> Optional[str]:
+        """Cancel a queued or running job.
+
+        Returns the state the job was in, or None if it was not active. The
+        worker running a cancelled job loses its lease and stops the workflow.
+        """
+        with self._connect(immediate=True) as conn:
+            row = conn.execute(
+                "SELECT id, state FROM jobs WHERE adw_id = ? AND state IN ('queued', 'running')",
+                (adw_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                """
+                UPDATE jobs SET state = 'cancelled', last_error = 'Cancelled',
+                    lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+                WHERE id = ?
+                """,
+                (time.time(), row["id"]),
+            )
+        return row["state"]
+
+    def is_active(self, repo_path: str, issue_number: int) -> bool:
+        """Check whether an issue has a queued or running job."""
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT 1 FROM jobs
+                WHERE repo_path = ? AND issue_number = ? AND state IN ('queued', 'running')
+                LIMIT 1
+                """,
+                (repo_path, issue_number),
+            ).fetchone()
+        return row is not None
+
+    def get(self, adw_id: str) -> Optional[WorkflowJob]:
+        """Look up a job by its ADW ID."""
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT {JOB_COLUMNS} FROM jobs WHERE adw_id = ?", (adw_id,)
+            ).fetchone()
+        return _row_to_job(row) if row else None
+
+    def list_jobs(self, states: List[str], limit: int = 100) -> List[WorkflowJob]:
+        """List jobs in the given states, oldest first."""
+        placeholders = ", ".join("?" for _ in states)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT {JOB_COLUMNS} FROM jobs
+                WHERE state IN ({placeholders})
+                ORDER BY created_at
+                LIMIT ?
+                """,
+                (*states, limit),
+            ).fetchall()
+        return [_row_to_job(row) for row in rows]
+
+    def stats(self) -> Dict[str, object]:
+        """Return job counts per state and the age of the oldest queued job."""
+        now = time.time()
+        with self._connect() as conn:
+            counts = {
+                row["state"]: row["count"]
+                for row in conn.execute(
+                    "SELECT state, COUNT(*) AS count FROM jobs GROUP BY state"
+                )
+            }
+            oldest = conn.execute(
+                "SELECT MIN(created_at) AS oldest FROM jobs WHERE state = 'queued'"
+            ).fetchone()["oldest"]
+        return {
+            "queued": counts.get("queued", 0),
+            "running": counts.get("running", 0),
+            "succeeded": counts.get("succeeded", 0),
+            "failed": counts.get("failed", 0),
+            "cancelled": counts.get("cancelled", 0),
+            "oldest_queued_seconds": round(now - oldest, 1) if oldest else 0.0,
+        }
+
+
+def _row_to_job(row: sqlite3.Row) -> WorkflowJob:
+    return WorkflowJob(
+        id=row["id"],
+        issue_number=row["issue_number"],
+        comment_id=row["comment_id"],
+        repo_path=row["repo_path"],
+        adw_id=row["adw_id"],
+        reason=row["reason"],
+        state=row["state"],
+        attempts=row["attempts"],
+        exit_code=row["exit_code"],
+        last_error=row["last_error"],
+        enqueued_at=row["created_at"],
+    )
@@ -0,0 +1,113 @@
+"""
+Pipeline - AI Developer Workflow (ADW)
+
+Runs workflow stages one after another. Each stage declares the stages it
+depends on and receives their results; the declared order is checked against
+those dependencies. Every stage of adw_plan_build.py builds on the checkout
+left by the one before it, so stages run sequentially.
+Per-stage timings are logged when the pipeline finishes. Stages completed by
+an earlier run can be passed in to skip them when resuming.
+"""
+
+import logging
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from data_types import StageTiming
+
+
+class StageError(Exception):
+    """Raised by a stage to fail the workflow with an issue comment."""
+
+    def __init__(self, agent_name: str, error_prefix: str, error: str):
+        super().__init__(f"{error_prefix}: {error}")
+        self.agent_name = agent_name
+        self.error_prefix = error_prefix
+        self.error = error
+
+
+class Stage:
+    """A named unit of work that runs once its dependencies have finished.
+
+    func receives the results of all finished stages keyed by stage name.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Dict[str, Any]], Any],
+        after: Iterable[str] = (),
+    ):
+        self.name = name
+        self.func = func
+        self.after = tuple(after)
+
+
+def run_pipeline(
+    stages: List[Stage],
+    logger: logging.Logger,
+    completed: Optional[Dict[str, Any]] = None,
+    on_stage_complete: Optional[Callable[[str, Any], None]] = None,
+) -> Dict[str, Any]:
+    """Run stages in order, each after the stages it depends on.
+
+    Stages in completed are not run again; their recorded results are used.
+    on_stage_complete is called with each stage's name and result as it
+    finishes. The first failure stops the pipeline and is re-raised once the
+    timings are logged. Returns the results of all stages keyed by name.
+    """
+    names = {stage.name for stage in stages}
+    seen = set()
+    for stage in stages:
+        unknown = set(stage.after) - names
+        if unknown:
+            raise ValueError(f"Stage {stage.name} depends on unknown stages: {sorted(unknown)}")
+        later = set(stage.after) - seen
+        if later:
+            raise ValueError(f"Stage {stage.name} must come after stages: {sorted(later)}")
+        seen.add(stage.name)
+
+    pipeline_start = time.time()
+    results: Dict[str, Any] = {
+        name: result for name, result in (completed or {}).items() if name in names
+    }
+    timings: List[StageTiming] = []
+    if results:
+        logger.info(f"Skipping completed stages: {', '.join(results)}")
+
+    try:
+        for stage in stages:
+            if stage.name in results:
+                continue
+            logger.info(f"\n=== Starting stage: {stage.name} ===")
+            start = time.time()
+            status = "failed"
+            try:
+                results[stage.name] = stage.func(dict(results))
+                status = "succeeded"
+            except BaseException as e:
+                logger.error(f"Stage {stage.name} failed: {e}")
+                raise
+            finally:
+                timings.append(StageTiming(
+                    name=stage.name,
+                    started_at=round(start - pipeline_start, 2),
+                    duration_seconds=round(time.time() - start, 2),
+                    status=status,
+                ))
+            if on_stage_complete:
+                on_stage_complete(stage.name, results[stage.name])
+    finally:
+        log_timings(timings, time.time() - pipeline_start, logger)
+    return results
+
+
+def log_timings(timings: List[StageTiming], total_seconds: float, logger: logging.Logger) -> None:
+    """Log how long each stage took and when it started."""
+    logger.info("\n=== Stage timings ===")
+    for timing in sorted(timings, key=lambda t: t.started_at):
+        logger.info(
+            f"{timing.name:<24} start +{timing.started_at:7.1f}s  "
+            f"took {timing.duration_seconds:7.1f}s  {timing.status}"
+        )
+    logger.info(f"{'total wall time':<24} {total_seconds:.1f}s")
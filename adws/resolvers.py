@@ -0,0 +1,174 @@
+"""
+Deterministic Resolvers - AI Developer Workflow (ADW)
+
+Fast paths tried before spending an agent session on a trivial stage. Each
+resolver either returns a confident answer or None; the workflow falls back
+to the LLM when no resolver answers or the answers disagree.
+
+- Plan files: paths mentioned in the planner output that are new in git, then
+  any single new-in-git file following the specs/{type}-{issue_number}-*.md
+  naming convention. Committed specs, whether one the planner merely refers
+  to or one written by an earlier run for the same issue, are never picked.
+- Classification: issue labels, conventional title prefixes ("bug:",
+  "[chore]", "feat(ui):") and a slash command on the first line of the body.
+
+Resolvers are plain functions registered in PLAN_FILE_RESOLVERS and
+ISSUE_CLASS_RESOLVERS, so new fast paths can be added without touching the
+workflow.
+
+Environment:
+- ADW_DETERMINISTIC_RESOLVERS: Set to "false" to always use the agents (default: true)
+- ADW_CLASSIFY_LABELS: Extra label mappings, e.g. "defect=/bug,ux=/feature"
+"""
+
+import glob
+import os
+import re
+import subprocess
+from typing import Callable, Dict, List, Optional
+
+from data_types import GitHubIssue, IssueClassSlashCommand
+
+RESOLVERS_ENABLED = os.getenv("ADW_DETERMINISTIC_RESOLVERS", "true").lower() != "false"
+
+PLAN_FILE_PATTERN = re.compile(r"specs/[\w./-]+\.md")
+
+DEFAULT_LABEL_CLASSES: Dict[str, IssueClassSlashCommand] = {
+    "bug": "/bug",
+    "fix": "/bug",
+    "feature": "/feature",
+    "enhancement": "/feature",
+    "chore": "/chore",
+    "documentation": "/chore",
+    "refactor": "/chore",
+    "maintenance": "/chore",
+}
+
+# Conventional prefixes: "bug: ...", "[chore] ...", "feat(api): ..."
+TITLE_PREFIX_PATTERN = re.compile(r"^\s*\[?(\w+)\]?(?:\([^)]*\))?\s*[:\]]", re.IGNORECASE)
+TITLE_PREFIX_CLASSES: Dict[str, IssueClassSlashCommand] = {
+    "bug": "/bug",
+    "fix": "/bug",
+    "bugfix": "/bug",
+    "hotfix": "/bug",
+    "feat": "/feature",
+    "feature": "/feature",
+    "chore": "/chore",
+    "docs": "/chore",
+    "refactor": "/chore",
+    "build": "/chore",
+    "ci": "/chore",
+}
+
+BODY_COMMAND_PATTERN = re.compile(r"^\s*(/chore|/bug|/feature)\b")
+
+
+def parse_label_classes(value: str) -> Dict[str, IssueClassSlashCommand]:
+    """Parse ADW_CLASSIFY_LABELS, e.g. "defect=/bug,ux=/feature"."""
+    mapping = {}
+    for item in value.split(","):
+        if "=" not in item:
+            continue
+        label, command = (part.strip() for part in item.split("=", 1))
+        if command in ("/chore", "/bug", "/feature"):
+            mapping[label.lower()] = command
+    return mapping
+
+
+LABEL_CLASSES = {
+    **DEFAULT_LABEL_CLASSES,
+    **parse_label_classes(os.getenv("ADW_CLASSIFY_LABELS", "")),
+}
+
+
+def spec_pattern(issue: GitHubIssue, issue_class: str) -> str:
+    """Path pattern of the spec the planner writes for an issue."""
+    return os.path.join("specs", f"{issue_class.lstrip('/')}-{issue.number}-*.md")
+
+
+def is_new_in_git(path: str) -> bool:
+    """Check whether a file is untracked or newly added in the current checkout."""
+    result = subprocess.run(
+        ["git", "status", "--porcelain", "--untracked-files=all", "--", path],
+        capture_output=True,
+        text=True,
+    )
+    return result.returncode == 0 and result.stdout[:2] in ("??", "A ", "AM")
+
+
+def plan_file_from_output(plan_output: str, issue: GitHubIssue, issue_class: str) -> Optional[str]:
+    """Return the single new spec mentioned in the planner output.
+
+    Only paths new in git count, so a plan that merely refers to an older
+    spec, even one for the same issue, does not resolve to it.
+    """
+    paths = {path.rstrip(".") for path in PLAN_FILE_PATTERN.findall(plan_output)}
+    candidates = sorted(path for path in paths if os.path.isfile(path) and is_new_in_git(path))
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def plan_file_from_specs(plan_output: str, issue: GitHubIssue, issue_class: str) -> Optional[str]:
+    """Return the single new spec named after the issue: specs/{type}-{number}-*.md.
+
+    Specs already committed, e.g. by an earlier run for the same issue, are ignored.
+    """
+    matches = [path for path in glob.glob(spec_pattern(issue, issue_class)) if is_new_in_git(path)]
+    return matches[0] if len(matches) == 1 else None
+
+
+def class_from_labels(issue: GitHubIssue) -> Optional[IssueClassSlashCommand]:
+    """Classify by issue labels when they map to exactly one command."""
+    classes = {
+        LABEL_CLASSES[label.name.lower()]
+        for label in issue.labels
+        if label.name.lower() in LABEL_CLASSES
+    }
+    return classes.pop() if len(classes) == 1 else None
+
+
+def class_from_title_prefix(issue: GitHubIssue) -> Optional[IssueClassSlashCommand]:
+    """Classify by a conventional prefix on the issue title."""
+    match = TITLE_PREFIX_PATTERN.match(issue.title)
+    if not match:
+        return None
+    return TITLE_PREFIX_CLASSES.get(match.group(1).lower())
+
+
+def class_from_body_command(issue: GitHubIssue) -> Optional[IssueClassSlashCommand]:
+    """Classify by a /chore, /bug or /feature command opening the issue body."""
+    match = BODY_COMMAND_PATTERN.match(issue.body or "")
+    return match.group(1) if match else None  # type: ignore
+
+
+PLAN_FILE_RESOLVERS: List[Callable[[str, GitHubIssue, str], Optional[str]]] = [
+    plan_file_from_output,
+    plan_file_from_specs,
+]
+
+ISSUE_CLASS_RESOLVERS: List[Callable[[GitHubIssue], Optional[IssueClassSlashCommand]]] = [
+    class_from_labels,
+    class_from_title_prefix,
+    class_from_body_command,
+]
+
+
+def resolve_plan_file(plan_output: str, issue: GitHubIssue, issue_class: str) -> Optional[str]:
+    """Find the plan file without an agent. Returns None if no resolver is sure."""
+    if not RESOLVERS_ENABLED:
+        return None
+    for resolver in PLAN_FILE_RESOLVERS:
+        plan_file = resolver(plan_output, issue, issue_class)
+        if plan_file:
+            return plan_file
+    return None
+
+
+def resolve_issue_class(issue: GitHubIssue) -> Optional[IssueClassSlashCommand]:
+    """Classify an issue without an agent.
+
+    Returns None if no resolver answers or the answers disagree.
+    """
+    if not RESOLVERS_ENABLED:
+        return None
+    classes = {c for c in (resolver(issue) for resolver in ISSUE_CLASS_RESOLVERS) if c}
+    return classes.pop() if len(classes) == 1 else None
@@ -0,0 +1,138 @@
+"""
+Response Cache - AI Developer Workflow (ADW)
+
+On-disk cache of agent responses for idempotent slash commands, so retries
+and reruns of the same issue replay classification in milliseconds instead
+of starting a new Claude Code session.
+
+Entries are content addressed: the key is a SHA-256 of the slash command,
+model and the request's cache key arguments, which callers limit to the
+inputs that decide the answer (for classification: the issue number, title,
+body and labels, but not its comments or update time, which the workflow's
+own status comments change). Only successful responses are stored. Entries expire
+after a TTL, and the least recently used entries are evicted once the cache
+exceeds its size limit.
+
+Environment:
+- ADW_RESPONSE_CACHE: Set to "off" to bypass the cache (default: on)
+- ADW_RESPONSE_CACHE_DIR: Cache directory (default: agents/response_cache)
+- ADW_RESPONSE_CACHE_TTL_SECONDS: Entry lifetime (default: 86400)
+- ADW_RESPONSE_CACHE_MAX_MB: Size limit before eviction (default: 50)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import List, Optional
+
+from data_types import AgentPromptResponse
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_ENABLED = os.getenv("ADW_RESPONSE_CACHE", "on").lower() not in ("off", "false", "0")
+CACHE_DIR = os.getenv(
+    "ADW_RESPONSE_CACHE_DIR", os.path.join(PROJECT_ROOT, "agents", "response_cache")
+)
+CACHE_TTL_SECONDS = float(os.getenv("ADW_RESPONSE_CACHE_TTL_SECONDS", "86400"))
+CACHE_MAX_BYTES = int(float(os.getenv("ADW_RESPONSE_CACHE_MAX_MB", "50")) * 1024 * 1024)
+
+# Commands whose response depends only on stable inputs. /find_plan_file is
+# not cached: its input is the planner's free-form output, which differs per run.
+CACHEABLE_COMMANDS = {"/classify_issue"}
+
+_evict_lock = threading.Lock()
+
+
+def is_cacheable(slash_command: str) -> bool:
+    """Check whether responses to a slash command may be cached."""
+    return CACHE_ENABLED and slash_command in CACHEABLE_COMMANDS
+
+
+def make_cache_key(slash_command: str, key_args: List[str], model: str) -> str:
+    """Hash the inputs that determine an agent's response."""
+    payload = json.dumps(
+        {"command": slash_command, "args": key_args, "model": model},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(CACHE_DIR, key[:2], f"{key}.json")
+
+
+def get_cached_response(key: str) -> Optional[AgentPromptResponse]:
+    """Return a cached response, or None if missing or expired."""
+    path = _entry_path(key)
+    try:
+        with open(path, "r") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if time.time() - entry.get("created_at", 0) > CACHE_TTL_SECONDS:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+    # Touch the entry so eviction removes the least recently used first
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    response = AgentPromptResponse.model_validate(entry["response"])
+    response.cached = True
+    return response
+
+
+def put_cached_response(key: str, response: AgentPromptResponse) -> None:
+    """Store a successful response and evict old entries if over the size limit."""
+    if not response.success:
+        return
+    path = _entry_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(
+            {"created_at": time.time(), "response": response.model_dump(exclude={"cached"})},
+            f,
+        )
+    os.replace(tmp_path, path)
+    evict()
+
+
+def evict(max_bytes: int = CACHE_MAX_BYTES) -> int:
+    """Delete expired entries, then least recently used ones until under max_bytes.
+
+    Returns the number of entries removed.
+    """
+    with _evict_lock:
+        entries = []
+        for root, _, files in os.walk(CACHE_DIR):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        now = time.time()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for mtime, size, path in sorted(entries):
+            # mtime is refreshed on hits, so this only drops stale entries early
+            if total <= max_bytes and now - mtime <= CACHE_TTL_SECONDS:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
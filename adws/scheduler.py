@@ -0,0 +1,410 @@
+#!/usr/bin/env -S uv run
+# /// script
+# dependencies = ["python-dotenv", "pydantic"]
+# ///
+
+"""
+Workflow Scheduler - AI Developer Workflow (ADW)
+
+Runs adw_plan_build.py for several issues at once using a bounded pool of
+worker threads. Workers consume jobs from the durable JobQueue, so triggers
+only enqueue work and any number of scheduler processes can share the queue.
+Each workflow runs in its own git worktree under trees/{adw_id} so concurrent
+agents never share a checkout, branch or index. Workflows are handed to
+prewarmed worker processes (workflow_runner.py), so they start without
+paying for interpreter startup and imports.
+
+Usage:
+    uv run scheduler.py    # Standalone worker process
+
+Triggers embed a scheduler:
+    scheduler = WorkflowScheduler()
+    scheduler.start()
+    job_queue.enqueue(issue_number, repo_path, comment_id)
+    scheduler.wake()
+
+Environment:
+- ADW_MAX_WORKERS: Concurrent workflows (default: number of CPU cores)
+- ADW_MAX_WORKFLOWS_PER_REPO: Concurrent workflows per repository (default: 2)
+- ADW_JOB_LEASE_SECONDS: Lease renewed while a workflow runs (default: 120)
+- ADW_QUEUE_POLL_SECONDS: How often idle workers check the queue (default: 5)
+- ADW_WORKFLOW_TIMEOUT_SECONDS: Wall-clock limit for a whole workflow (default: 10800)
+- ADW_WORKFLOW_KILL_GRACE_SECONDS: Time a stopped workflow gets to cancel its
+  agents before it is killed (default: 30)
+- ADW_WORKTREE_BASE: Git ref new worktrees and their feature branches start
+  from (default: origin/main)
+- ADW_WORKTREE_COPY_FILES: Untracked files copied into each worktree
+  (default: .env,app/server/.env)
+"""
+
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from dotenv import load_dotenv
+
+from data_types import WorkflowJob
+from job_queue import JobQueue
+from state import state_path
+from workflow_runner import (
+    PREWARMED_WORKERS,
+    WORKFLOW_RUNNER,
+    PrewarmedWorkerPool,
+    launch_process,
+    worker_log_path,
+)
+
+# Load environment variables
+load_dotenv()
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+WORKTREES_DIR = os.path.join(PROJECT_ROOT, "trees")
+
+MAX_WORKERS = int(os.getenv("ADW_MAX_WORKERS", "0")) or (os.cpu_count() or 1)
+MAX_WORKFLOWS_PER_REPO = int(os.getenv("ADW_MAX_WORKFLOWS_PER_REPO", "2"))
+JOB_LEASE_SECONDS = float(os.getenv("ADW_JOB_LEASE_SECONDS", "120"))
+QUEUE_POLL_SECONDS = float(os.getenv("ADW_QUEUE_POLL_SECONDS", "5"))
+WORKFLOW_TIMEOUT_SECONDS = float(os.getenv("ADW_WORKFLOW_TIMEOUT_SECONDS", "10800"))
+WORKFLOW_KILL_GRACE_SECONDS = float(os.getenv("ADW_WORKFLOW_KILL_GRACE_SECONDS", "30"))
+WORKTREE_BASE = os.getenv("ADW_WORKTREE_BASE", "origin/main")
+WORKTREE_COPY_FILES = [
+    f.strip()
+    for f in os.getenv("ADW_WORKTREE_COPY_FILES", ".env,app/server/.env").split(",")
+    if f.strip()
+]
+
+
+def create_worktree(adw_id: str) -> str:
+    """Create an isolated git worktree for a workflow and return its path."""
+    worktree_path = os.path.join(WORKTREES_DIR, adw_id)
+    os.makedirs(WORKTREES_DIR, exist_ok=True)
+
+    # Left behind by a worker that died mid-run; the retry starts clean
+    if os.path.exists(worktree_path):
+        remove_worktree(worktree_path)
+
+    # Start from the latest remote state; ignore fetch errors (offline, no remote)
+    if "/" in WORKTREE_BASE:
+        remote = WORKTREE_BASE.split("/", 1)[0]
+        subprocess.run(
+            ["git", "fetch", remote], cwd=PROJECT_ROOT, capture_output=True, text=True
+        )
+
+    result = subprocess.run(
+        ["git", "worktree", "add", "--detach", worktree_path, WORKTREE_BASE],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to create worktree: {result.stderr.strip()}")
+
+    # Copy untracked config (e.g. .env files) the agents need to run the app
+    for relative_path in WORKTREE_COPY_FILES:
+        source = os.path.join(PROJECT_ROOT, relative_path)
+        if os.path.isfile(source):
+            destination = os.path.join(worktree_path, relative_path)
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            shutil.copy2(source, destination)
+
+    return worktree_path
+
+
+def remove_worktree(worktree_path: str) -> None:
+    """Remove a workflow worktree. Branches created in it are kept."""
+    result = subprocess.run(
+        ["git", "worktree", "remove", "--force", worktree_path],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(f"WARNING: Failed to remove worktree {worktree_path}: {result.stderr.strip()}")
+        shutil.rmtree(worktree_path, ignore_errors=True)
+        subprocess.run(["git", "worktree", "prune"], cwd=PROJECT_ROOT, capture_output=True)
+
+
+class WorkflowStopped(RuntimeError):
+    """Raised when a workflow is stopped before it finished."""
+
+
+def stop_workflow(process: subprocess.Popen) -> int:
+    """Ask a workflow to cancel its agents, killing it after the grace period."""
+    process.terminate()
+    try:
+        return process.wait(timeout=WORKFLOW_KILL_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        return process.wait()
+
+
+def run_workflow(
+    job: WorkflowJob,
+    heartbeat,
+    cancel_event: Optional[threading.Event] = None,
+    on_start: Optional[Callable[[subprocess.Popen], None]] = None,
+    worker_pool: Optional[PrewarmedWorkerPool] = None,
+) -> int:
+    """Run adw_plan_build.py for a job inside its own worktree. Returns the exit code.
+
+    heartbeat() is called periodically while the workflow runs. The workflow
+    is stopped and WorkflowStopped raised if heartbeat() returns False (the
+    job was cancelled or its lease taken over), cancel_event is set, or it
+    runs longer than WORKFLOW_TIMEOUT_SECONDS. The workflow runs in a worker
+    from worker_pool if given, otherwise in a new interpreter. on_start
+    receives the process once it is launched. The process is always waited for, so it never
+    lingers as a zombie.
+    """
+    worktree_path = create_worktree(job.adw_id)
+    process: Optional[subprocess.Popen] = None
+    try:
+        argv = [str(job.issue_number), job.adw_id]
+        if os.path.exists(state_path(job.adw_id)):
+            # A retry picks up where the failed attempt stopped
+            argv = ["--resume", job.adw_id]
+        log_path = worker_log_path(job.adw_id)
+        if worker_pool:
+            process = worker_pool.launch(argv, worktree_path, log_path)
+        else:
+            process = launch_process(argv, worktree_path, log_path)
+        if on_start:
+            on_start(process)
+        start_time = time.time()
+        next_heartbeat = start_time + JOB_LEASE_SECONDS / 3
+        while True:
+            try:
+                return process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                pass
+
+            now = time.time()
+            reason = None
+            if cancel_event and cancel_event.is_set():
+                reason = "was cancelled"
+            elif WORKFLOW_TIMEOUT_SECONDS and now - start_time > WORKFLOW_TIMEOUT_SECONDS:
+                reason = f"timed out after {WORKFLOW_TIMEOUT_SECONDS:.0f} seconds"
+            elif now >= next_heartbeat:
+                next_heartbeat = now + JOB_LEASE_SECONDS / 3
+                if not heartbeat():
+                    reason = "was cancelled or lost its lease"
+
+            if reason:
+                print(f"WARNING: Workflow {job.adw_id} {reason}, stopping it")
+                exit_code = stop_workflow(process)
+                raise WorkflowStopped(f"Workflow {reason} (exit code {exit_code})")
+    finally:
+        # Reap the child if we are leaving early (e.g. an exception in heartbeat)
+        if process is not None and process.poll() is None:
+            stop_workflow(process)
+        remove_worktree(worktree_path)
+
+
+class WorkflowScheduler:
+    """Bounded pool of workers that run queued ADW workflows concurrently.
+
+    Each worker claims the oldest runnable job from the JobQueue whose
+    repository is below its concurrency limit, so one busy repository cannot
+    occupy every worker while jobs for other repositories wait.
+    """
+
+    def __init__(
+        self,
+        job_queue: Optional[JobQueue] = None,
+        max_workers: int = MAX_WORKERS,
+        max_per_repo: int = MAX_WORKFLOWS_PER_REPO,
+    ):
+        self.job_queue = job_queue or JobQueue()
+        self.max_workers = max_workers
+        self.max_per_repo = max_per_repo
+        self.running: Dict[str, WorkflowJob] = {}
+        self.cancel_events: Dict[str, threading.Event] = {}
+        self.pids: Dict[str, int] = {}
+        self.started_at: Dict[str, float] = {}
+        self.completed = 0
+        self.failed = 0
+        self.lock = threading.Lock()
+        self.wake_event = threading.Event()
+        self.stopping = threading.Event()
+        self.workers = []
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self.worker_pool = (
+            PrewarmedWorkerPool(min(PREWARMED_WORKERS, max_workers))
+            if WORKFLOW_RUNNER == "prewarmed"
+            else None
+        )
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        if self.worker_pool:
+            self.worker_pool.fill()
+        for i in range(self.max_workers):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                args=(f"{self.worker_prefix}:{i}",),
+                name=f"adw-worker-{i}",
+                daemon=True,
+            )
+            worker.start()
+            self.workers.append(worker)
+        print(f"INFO: Workflow scheduler started with {self.max_workers} workers "
+              f"(max {self.max_per_repo} per repository)")
+
+    def wake(self) -> None:
+        """Wake idle workers after enqueueing a job."""
+        self.wake_event.set()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop claiming new jobs and wait for running workflows to finish."""
+        self.stopping.set()
+        self.wake_event.set()
+        deadline = time.time() + timeout if timeout else None
+        for worker in self.workers:
+            remaining = max(0, deadline - time.time()) if deadline else None
+            worker.join(remaining)
+        if self.worker_pool:
+            self.worker_pool.close()
+
+    def cancel(self, adw_id: str) -> Optional[str]:
+        """Cancel a queued or running workflow. Returns its previous state, or None.
+
+        Workflows running in this process are stopped right away; workflows
+        running elsewhere stop at their next heartbeat.
+        """
+        previous_state = self.job_queue.cancel(adw_id)
+        with self.lock:
+            cancel_event = self.cancel_events.get(adw_id)
+        if cancel_event:
+            cancel_event.set()
+        return previous_state
+
+    def metrics(self) -> Dict[str, object]:
+        """Return queue depth and throughput counters."""
+        with self.lock:
+            local = {
+                "workers": self.max_workers,
+                "busy_workers": len(self.running),
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+        return {**local, "queue": self.job_queue.stats()}
+
+    def running_workflows(self) -> List[Dict[str, Any]]:
+        """Describe the workflows running in this process."""
+        now = time.time()
+        with self.lock:
+            return [
+                {
+                    "adw_id": adw_id,
+                    "issue_number": job.issue_number,
+                    "attempt": job.attempts,
+                    "pid": self.pids.get(adw_id),
+                    "running_seconds": round(now - self.started_at[adw_id], 1),
+                }
+                for adw_id, job in self.running.items()
+            ]
+
+    def workflow_process(self, adw_id: str) -> Optional[Dict[str, Any]]:
+        """Return pid and run time of a workflow running in this process, or None."""
+        for workflow in self.running_workflows():
+            if workflow["adw_id"] == adw_id:
+                return {"pid": workflow["pid"], "running_seconds": workflow["running_seconds"]}
+        return None
+
+    def _worker_loop(self, worker_id: str) -> None:
+        while not self.stopping.is_set():
+            try:
+                job = self.job_queue.claim(worker_id, JOB_LEASE_SECONDS, self.max_per_repo)
+            except Exception as e:
+                print(f"ERROR: Failed to claim job: {e}")
+                job = None
+
+            if job is None:
+                self.wake_event.wait(QUEUE_POLL_SECONDS)
+                self.wake_event.clear()
+                continue
+
+            self._run_job(job, worker_id)
+
+    def _run_job(self, job: WorkflowJob, worker_id: str) -> None:
+        cancel_event = threading.Event()
+        with self.lock:
+            self.running[job.adw_id] = job
+            self.cancel_events[job.adw_id] = cancel_event
+            self.started_at[job.adw_id] = time.time()
+
+        def record_pid(process: subprocess.Popen) -> None:
+            with self.lock:
+                self.pids[job.adw_id] = process.pid
+
+        start_time = time.time()
+        print(f"INFO: Starting workflow {job.adw_id} for issue #{job.issue_number} "
+              f"(attempt {job.attempts})")
+        exit_code: Optional[int] = None
+        error = ""
+        try:
+            exit_code = run_workflow(
+                job,
+                lambda: self.job_queue.heartbeat(job.id, worker_id, JOB_LEASE_SECONDS),
+                cancel_event,
+                on_start=record_pid,
+                worker_pool=self.worker_pool,
+            )
+            if exit_code != 0:
+                error = (
+                    f"Workflow exited with code {exit_code}; see agents/{job.adw_id}/worker.log "
+                    f"and agents/{job.adw_id}/adw_plan_build/execution.log"
+                )
+        except WorkflowStopped as e:
+            error = str(e)
+        except Exception as e:
+            error = f"Exception running workflow: {e}"
+
+        success = exit_code == 0
+        if success:
+            self.job_queue.complete(job.id, worker_id)
+            status = "succeeded"
+        else:
+            status = self.job_queue.fail(job.id, worker_id, error, exit_code)
+            print(f"ERROR: Workflow {job.adw_id} for issue #{job.issue_number}: {error}")
+
+        with self.lock:
+            self.running.pop(job.adw_id, None)
+            self.cancel_events.pop(job.adw_id, None)
+            self.pids.pop(job.adw_id, None)
+            self.started_at.pop(job.adw_id, None)
+            if success:
+                self.completed += 1
+            else:
+                self.failed += 1
+
+        print(f"INFO: Workflow {job.adw_id} for issue #{job.issue_number} {status} "
+              f"in {time.time() - start_time:.0f} seconds")
+
+
+def main():
+    """Run a standalone scheduler that consumes the job queue."""
+    scheduler = WorkflowScheduler()
+
+    def handle_signal(signum, frame):
+        print(f"\nINFO: Received signal {signum}, finishing running workflows...")
+        scheduler.stopping.set()
+        scheduler.wake_event.set()
+
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+
+    scheduler.start()
+    while not scheduler.stopping.is_set():
+        time.sleep(1)
+    scheduler.stop()
+    print("INFO: Scheduler stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Workflow State - AI Developer Workflow (ADW)
+
+Checkpoints adw_plan_build runs in agents/{adw_id}/state.json: the result of
+every completed stage (classification, branch, plan file, commit SHAs, PR URL)
+and the latest Claude Code session id per agent. `adw_plan_build.py --resume
+<adw_id>` uses it to skip completed stages and continue interrupted sessions.
+"""
+
+import os
+import threading
+from datetime import datetime
+from typing import Any, Optional
+
+from data_types import WorkflowState
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def state_path(adw_id: str) -> str:
+    """Return the state file path for a workflow."""
+    return os.path.join(PROJECT_ROOT, "agents", adw_id, "state.json")
+
+
+class WorkflowStateStore:
+    """Thread-safe, crash-safe persistence of a WorkflowState."""
+
+    def __init__(self, state: WorkflowState):
+        self.state = state
+        self.path = state_path(state.adw_id)
+        self.lock = threading.Lock()
+
+    @classmethod
+    def load(cls, adw_id: str) -> Optional["WorkflowStateStore"]:
+        """Load a saved workflow state, or None if there is none."""
+        path = state_path(adw_id)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as f:
+            return cls(WorkflowState.model_validate_json(f.read()))
+
+    def complete_stage(self, name: str, result: Any) -> None:
+        """Record a finished stage and its result."""
+        with self.lock:
+            self.state.completed[name] = result
+            self._save()
+
+    def forget_stage(self, name: str) -> None:
+        """Mark a stage as not completed so it runs again."""
+        with self.lock:
+            self.state.completed.pop(name, None)
+            self._save()
+
+    def record_session(self, agent_name: str, session_id: Optional[str]) -> None:
+        """Remember an agent's Claude Code session so it can be resumed."""
+        if not session_id:
+            return
+        with self.lock:
+            self.state.session_ids[agent_name] = session_id
+            self._save()
+
+    def forget_session(self, agent_name: str) -> None:
+        """Drop an agent's session so it starts fresh next time."""
+        with self.lock:
+            self.state.session_ids.pop(agent_name, None)
+            self._save()
+
+    def save(self) -> None:
+        """Write the state to disk."""
+        with self.lock:
+            self._save()
+
+    def _save(self) -> None:
+        # Write then rename so a crash never leaves a truncated state file
+        self.state.updated_at = datetime.now()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(self.state.model_dump_json(indent=2))
+        os.replace(tmp_path, self.path)
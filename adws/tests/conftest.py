@@ -0,0 +1,49 @@
+import subprocess
+import pytest
+from data_types import GitHubIssue
+
+
+def git(cwd, *args) -> str:
+    """Run a git command in cwd and return its output."""
+    result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """Create a repository on main with an origin remote, and chdir into it."""
+    for name in ("AUTHOR", "COMMITTER"):
+        monkeypatch.setenv(f"GIT_{name}_NAME", "ADW Test")
+        monkeypatch.setenv(f"GIT_{name}_EMAIL", "adw@example.com")
+
+    origin = tmp_path / "origin.git"
+    repo = tmp_path / "repo"
+    git(tmp_path, "init", "-q", "--bare", "-b", "main", str(origin))
+    git(tmp_path, "init", "-q", "-b", "main", str(repo))
+    (repo / "README.md").write_text("# Test repo\n")
+    git(repo, "add", "README.md")
+    git(repo, "commit", "-q", "-m", "Initial commit")
+    git(repo, "remote", "add", "origin", str(origin))
+    git(repo, "push", "-q", "-u", "origin", "main")
+
+    monkeypatch.chdir(repo)
+    return repo
+
+
+@pytest.fixture
+def make_issue():
+    """Return a factory for GitHubIssue objects with overridable fields."""
+    def factory(**fields) -> GitHubIssue:
+        data = {
+            "number": 42,
+            "title": "Add task filters",
+            "body": "Filter tasks by type.",
+            "state": "OPEN",
+            "author": {"login": "octocat"},
+            "createdAt": "2026-01-01T00:00:00Z",
+            "updatedAt": "2026-01-01T00:00:00Z",
+            "url": "https://github.com/owner/repo/issues/42",
+        }
+        data.update(fields)
+        return GitHubIssue.model_validate(data)
+    return factory
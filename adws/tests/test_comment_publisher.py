@@ -0,0 +1,72 @@
+import pytest
+import comment_publisher
+from comment_publisher import CommentPublisher
+from github import rate_limit_budget
+
+
+@pytest.fixture
+def github_comments(monkeypatch):
+    """Record comment API calls instead of sending them."""
+    calls = []
+
+    def create(repo_path, issue_number, body, priority="status"):
+        calls.append(("create", body))
+        return f"comment-{len(calls)}"
+
+    def update(repo_path, comment_id, body):
+        calls.append(("update", comment_id, body))
+
+    monkeypatch.setattr(comment_publisher, "create_issue_comment", create)
+    monkeypatch.setattr(comment_publisher, "update_issue_comment", update)
+    monkeypatch.setattr(comment_publisher, "RETRY_BACKOFF_SECONDS", 0)
+    monkeypatch.setattr(rate_limit_budget, "allow", lambda priority, resource="core": True)
+    return calls
+
+
+def test_comments_are_posted_in_order_with_retries(github_comments, monkeypatch):
+    """Test a failed post is retried and later comments wait for it."""
+    create = comment_publisher.create_issue_comment
+    failures = [ConnectionError("reset")]
+
+    def flaky_create(*args, **kwargs):
+        if failures:
+            raise failures.pop()
+        return create(*args, **kwargs)
+
+    monkeypatch.setattr(comment_publisher, "create_issue_comment", flaky_create)
+    publisher = CommentPublisher("owner/repo", "42", coalesce=False)
+    for body in ("one", "two", "three"):
+        publisher.publish(body)
+
+    assert publisher.close(timeout=10)
+    assert github_comments == [("create", "one"), ("create", "two"), ("create", "three")]
+    assert publisher.posted == 3 and publisher.dropped == 0
+
+
+def test_status_updates_coalesce_into_one_progress_comment(github_comments):
+    """Test status updates edit one comment while notify comments are posted new."""
+    publisher = CommentPublisher("owner/repo", "42", coalesce=True)
+    publisher.publish("classified")
+    publisher.publish("branch created")
+    publisher.publish("failed", notify=True)
+
+    assert publisher.close(timeout=10)
+    creates = [call for call in github_comments if call[0] == "create"]
+    assert len(creates) == 2 and creates[-1] == ("create", "failed")
+    progress = [call[-1] for call in github_comments if call[-1] != "failed"][-1]
+    assert progress == "classified\n\nbranch created"
+
+
+def test_comment_is_dropped_after_max_attempts(github_comments, monkeypatch):
+    """Test a comment that keeps failing is dropped without raising."""
+    monkeypatch.setattr(comment_publisher, "MAX_ATTEMPTS", 2)
+
+    def broken_create(*args, **kwargs):
+        raise ConnectionError("unreachable")
+
+    monkeypatch.setattr(comment_publisher, "create_issue_comment", broken_create)
+    publisher = CommentPublisher("owner/repo", "42", coalesce=False)
+    publisher.publish("lost")
+
+    assert publisher.close(timeout=10)
+    assert publisher.posted == 0 and publisher.dropped == 1
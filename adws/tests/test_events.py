@@ -0,0 +1,65 @@
+import json
+import pytest
+import events
+from events import AgentEventTracker, read_events
+
+
+@pytest.fixture(autouse=True)
+def agents_dir(tmp_path, monkeypatch):
+    """Keep events files under tmp_path."""
+    monkeypatch.setattr(events, "PROJECT_ROOT", str(tmp_path))
+
+
+def assistant(message_id, content, input_tokens=10, output_tokens=5):
+    return {
+        "type": "assistant",
+        "message": {
+            "id": message_id,
+            "content": content,
+            "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens},
+        },
+    }
+
+
+def test_split_assistant_messages_are_counted_once():
+    """Test messages sharing an API message id count as one turn and one usage."""
+    tracker = AgentEventTracker("abcd1234", "sdlc_planner")
+    tracker({"type": "system", "subtype": "init", "model": "sonnet"})
+    tracker(assistant("msg_1", [{"type": "text", "text": "Reading the issue"}]))
+    tracker(assistant("msg_1", [{"type": "tool_use", "name": "Read"}]))
+    tracker(assistant("msg_2", [{"type": "tool_use", "name": "Write"}]))
+    tracker({
+        "type": "result",
+        "subtype": "success",
+        "total_cost_usd": 0.01,
+        "usage": {"input_tokens": 25, "output_tokens": 12},
+    })
+
+    lines, offset = read_events("abcd1234")
+    recorded = [json.loads(line) for line in lines]
+    assert [e["event"] for e in recorded] == [
+        "agent_started", "assistant_turn", "tool_call", "tool_call", "agent_finished",
+    ]
+    assert [e["turn"] for e in recorded[1:4]] == [1, 1, 2]
+    assert recorded[3]["input_tokens"] == 20 and recorded[3]["output_tokens"] == 10
+    assert recorded[4]["input_tokens"] == 25 and recorded[4]["cost_usd"] == 0.01
+    assert read_events("abcd1234", offset) == ([], offset)
+
+
+def test_read_events_leaves_partial_line_for_next_read(tmp_path):
+    """Test a half-written event is only returned once it is complete."""
+    path = tmp_path / "agents" / "abcd1234" / "events.jsonl"
+    path.parent.mkdir(parents=True)
+    path.write_text('{"event": "a"}\n{"event": ')
+
+    lines, offset = read_events("abcd1234")
+    assert lines == ['{"event": "a"}']
+    with open(path, "a") as f:
+        f.write('"b"}\n')
+    assert read_events("abcd1234", offset)[0] == ['{"event": "b"}']
+
+
+def test_events_path_rejects_path_traversal():
+    """Test ADW ids cannot escape the agents directory."""
+    with pytest.raises(ValueError):
+        events.events_path("../etc")
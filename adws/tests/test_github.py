@@ -0,0 +1,51 @@
+import github
+from data_types import GitHubIssueListItem
+
+
+def item(number, updated_at):
+    return GitHubIssueListItem(
+        number=number,
+        title=f"Issue {number}",
+        body="",
+        createdAt="2026-01-01T00:00:00Z",
+        updatedAt=updated_at,
+    )
+
+
+def test_poller_reports_each_change_once_and_prunes_seen(monkeypatch):
+    """Test unchanged issues at the since cursor are skipped and old entries dropped."""
+    responses = [
+        [item(1, "2026-01-01T01:00:00Z"), item(2, "2026-01-01T02:00:00Z"), item(3, "2026-01-01T03:00:00Z")],
+        # Issues 1 and 2 were closed; 3 comes back unchanged because since is inclusive
+        [item(3, "2026-01-01T03:00:00Z"), item(4, "2026-01-01T04:00:00Z")],
+        [item(4, "2026-01-01T04:00:00Z")],
+    ]
+    requested_since = []
+
+    def fetch(repo_path, since=None):
+        requested_since.append(since)
+        return responses.pop(0)
+
+    monkeypatch.setattr(github, "fetch_open_issues_with_last_comment", fetch)
+    poller = github.IssuePoller("owner/repo")
+    monkeypatch.setattr(poller, "has_changes", lambda: (True, '"etag"'))
+
+    assert [i.number for i in poller.poll()] == [1, 2, 3]
+    assert set(poller.seen) == {3}
+    assert [i.number for i in poller.poll()] == [4]
+    assert set(poller.seen) == {4}
+    assert poller.poll() == []
+    assert set(poller.seen) == {4}
+    assert requested_since == [None, "2026-01-01T03:00:00+00:00", "2026-01-01T04:00:00+00:00"]
+    assert poller.etag == '"etag"'
+
+
+
+def test_poller_keeps_etag_when_fetch_fails(monkeypatch):
+    """Test a failed fetch leaves the ETag unset so the next poll fetches again."""
+    monkeypatch.setattr(github, "fetch_open_issues_with_last_comment", lambda repo_path, since=None: None)
+    poller = github.IssuePoller("owner/repo")
+    monkeypatch.setattr(poller, "has_changes", lambda: (True, '"etag"'))
+
+    assert poller.poll() == []
+    assert poller.etag is None
@@ -0,0 +1,169 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from github_http import GitHubClient
+
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    """Answers each request with the next scripted response of the server."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        self.server.requests.append({
+            "method": self.command,
+            "path": self.path,
+            "headers": dict(self.headers),
+            "body": body,
+            "client_port": self.client_address[1],
+        })
+        status, headers, payload, action = self.server.responses.pop(0)
+
+        if action == "drop":
+            # Close the connection without answering, as a server dropping it would
+            self.close_connection = True
+            return
+
+        data = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        # "close" keeps the response keep-alive but closes the socket afterwards
+        self.close_connection = action == "close"
+
+    do_GET = do_POST = do_PATCH = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def github():
+    """Start a fake GitHub API on 127.0.0.1 and return (server, client)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGitHubHandler)
+    server.requests = []
+    server.responses = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    # Same as pointing ADW_GITHUB_API_URL at the fake server
+    client = GitHubClient(api_url=f"http://127.0.0.1:{server.server_port}/api/v3", token="test-token")
+    yield server, client
+
+    client.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_paginate_follows_link_headers(github):
+    """Test paginate yields every page, following rel="next" links."""
+    server, client = github
+    base = f"http://127.0.0.1:{server.server_port}/api/v3"
+    server.responses = [
+        (200, {"Link": f'<{base}/repos/o/r/issues?page=2>; rel="next", <{base}/repos/o/r/issues?page=3>; rel="last"'}, [{"number": 1}, {"number": 2}], None),
+        (200, {"Link": f'<{base}/repos/o/r/issues?page=3>; rel="next"'}, [{"number": 3}], None),
+        (200, {}, [{"number": 4}], None),
+    ]
+
+    numbers = [issue["number"] for issue in client.paginate("repos/o/r/issues")]
+
+    assert numbers == [1, 2, 3, 4]
+    assert [r["path"] for r in server.requests] == [
+        "/api/v3/repos/o/r/issues",
+        "/api/v3/repos/o/r/issues?page=2",
+        "/api/v3/repos/o/r/issues?page=3",
+    ]
+    assert server.requests[0]["headers"]["Authorization"] == "Bearer test-token"
+
+
+def test_rate_limited_request_is_retried(github):
+    """Test a 429 with Retry-After is retried once after the wait."""
+    server, client = github
+    server.responses = [
+        (429, {"Retry-After": "0"}, {"message": "API rate limit exceeded"}, None),
+        (200, {}, {"login": "adw-bot"}, None),
+    ]
+
+    assert client.request_json("GET", "user") == {"login": "adw-bot"}
+    assert len(server.requests) == 2
+
+
+def test_conditional_request_returns_not_modified(github):
+    """Test an If-None-Match request gets the 304 status and an empty body."""
+    server, client = github
+    server.responses = [
+        (200, {"ETag": '"abc"'}, [{"number": 1}], None),
+        (304, {"ETag": '"abc"'}, None, None),
+    ]
+
+    first = client.request("GET", "repos/o/r/issues")
+    second = client.request("GET", "repos/o/r/issues", headers={"If-None-Match": first.headers["etag"]})
+
+    assert second.status == 304
+    assert second.body == b""
+    assert server.requests[1]["headers"]["If-None-Match"] == '"abc"'
+
+
+def test_connections_are_reused(github):
+    """Test consecutive requests share one keep-alive connection."""
+    server, client = github
+    server.responses = [(200, {}, {"n": i}, None) for i in range(3)]
+
+    for i in range(3):
+        assert client.request_json("GET", "user") == {"n": i}
+
+    assert len({r["client_port"] for r in server.requests}) == 1
+
+
+def test_get_is_resent_when_connection_drops(github):
+    """Test an idempotent request is resent on a new connection after a drop."""
+    server, client = github
+    server.responses = [
+        (200, {}, {"n": 1}, None),
+        (0, {}, None, "drop"),
+        (200, {}, {"n": 2}, None),
+    ]
+
+    client.request_json("GET", "user")
+    assert client.request_json("GET", "user") == {"n": 2}
+    assert len(server.requests) == 3
+
+
+def test_post_is_not_resent_when_connection_drops(github):
+    """Test a POST the server may have applied is never sent twice."""
+    server, client = github
+    server.responses = [
+        (200, {}, {"n": 1}, None),
+        (0, {}, None, "drop"),
+    ]
+
+    client.request_json("GET", "user")
+    with pytest.raises(ConnectionError):
+        client.request("POST", "repos/o/r/issues/1/comments", {"body": "hi"})
+
+    assert [r["method"] for r in server.requests] == ["GET", "POST"]
+
+
+def test_post_avoids_connection_closed_by_server(github):
+    """Test a POST is not sent on an idle connection the server has closed."""
+    server, client = github
+    server.responses = [
+        (200, {}, {"n": 1}, "close"),
+        (201, {}, {"id": 7}, None),
+    ]
+
+    client.request_json("GET", "user")
+    time.sleep(0.1)  # Let the server's FIN arrive
+    response = client.request("POST", "repos/o/r/issues/1/comments", {"body": "hi"})
+
+    assert response.status == 201
+    assert [r["method"] for r in server.requests] == ["GET", "POST"]
@@ -0,0 +1,19 @@
+import health_check
+from health_check import HealthCheckResult, HealthMonitor
+
+
+def test_snapshot_schema_is_the_same_before_and_after_the_first_check(monkeypatch):
+    """Test /health always has the same keys, with stale set while pending."""
+    monitor = HealthMonitor(interval_seconds=600)
+    pending = monitor.snapshot()
+    assert pending["status"] == "pending"
+    assert pending["stale"] is True
+
+    result = HealthCheckResult(success=True, timestamp="2026-01-01T00:00:00", checks={})
+    monkeypatch.setattr(health_check, "run_health_check", lambda: result)
+    monitor.run()
+    checked = monitor.snapshot()
+
+    assert checked.keys() == pending.keys()
+    assert checked["status"] == "healthy"
+    assert checked["stale"] is False
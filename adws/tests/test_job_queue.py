@@ -0,0 +1,84 @@
+import pytest
+import job_queue
+from job_queue import JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    """Return an empty job queue with immediate retries."""
+    monkeypatch.setattr(job_queue, "RETRY_BACKOFF_SECONDS", 0)
+    return JobQueue(str(tmp_path / "queue.db"), max_attempts=2)
+
+
+def test_enqueue_deduplicates_triggers(queue):
+    """Test the same issue and comment are queued once; a new comment queues again."""
+    first = queue.enqueue(5, "owner/repo", "", reason="New issue opened")
+    assert first is not None and first.state == "queued"
+    assert queue.enqueue(5, "owner/repo", "") is None
+    assert queue.enqueue(5, "owner/repo", "1001") is not None
+    assert queue.enqueue(5, "other/repo", "") is not None
+    assert queue.is_active("owner/repo", 5)
+    assert not queue.is_active("owner/repo", 6)
+
+
+def test_claim_leases_job_and_heartbeat_requires_owner(queue):
+    """Test a claimed job is leased to one worker and only it can renew the lease."""
+    job = queue.enqueue(5, "owner/repo")
+
+    claimed = queue.claim("worker-a", lease_seconds=60, max_per_repo=2)
+    assert claimed.id == job.id
+    assert claimed.state == "running" and claimed.attempts == 1
+    assert queue.claim("worker-b", lease_seconds=60, max_per_repo=2) is None
+    assert queue.heartbeat(job.id, "worker-a", 60)
+    assert not queue.heartbeat(job.id, "worker-b", 60)
+
+
+def test_expired_lease_is_claimed_again(queue):
+    """Test a crashed worker's job is taken over once its lease expires."""
+    job = queue.enqueue(5, "owner/repo")
+    queue.claim("worker-a", lease_seconds=-1, max_per_repo=2)
+
+    taken_over = queue.claim("worker-b", lease_seconds=60, max_per_repo=2)
+    assert taken_over.id == job.id and taken_over.attempts == 2
+    assert not queue.heartbeat(job.id, "worker-a", 60)
+    # The old owner's late failure report does not touch the new attempt
+    assert queue.fail(job.id, "worker-a", "crashed") == "running"
+
+
+def test_failed_job_is_requeued_until_attempts_run_out(queue):
+    """Test failures re-queue the job with backoff, then mark it failed."""
+    job = queue.enqueue(5, "owner/repo")
+
+    queue.claim("worker-a", 60, 2)
+    assert queue.fail(job.id, "worker-a", "exit 1", exit_code=1) == "queued"
+    retry = queue.claim("worker-a", 60, 2)
+    assert retry.id == job.id and retry.attempts == 2
+    assert queue.fail(job.id, "worker-a", "exit 1", exit_code=1) == "failed"
+
+    failed = queue.get(job.adw_id)
+    assert failed.state == "failed" and failed.exit_code == 1 and failed.last_error == "exit 1"
+    assert queue.claim("worker-a", 60, 2) is None
+
+
+def test_claim_respects_repository_and_issue_limits(queue):
+    """Test busy repositories and issues with a running job are skipped."""
+    queue.enqueue(1, "owner/repo")
+    queue.enqueue(2, "owner/repo")
+    queue.enqueue(1, "owner/repo", "1001")
+    other = queue.enqueue(3, "other/repo")
+
+    assert queue.claim("w1", 60, max_per_repo=1).issue_number == 1
+    assert queue.claim("w2", 60, max_per_repo=1).id == other.id
+    assert queue.claim("w3", 60, max_per_repo=1) is None
+
+
+def test_cancel_stops_the_lease(queue):
+    """Test cancelling a running job makes its worker lose the lease."""
+    job = queue.enqueue(5, "owner/repo")
+    queue.claim("worker-a", 60, 2)
+
+    assert queue.cancel(job.adw_id) == "running"
+    assert queue.cancel(job.adw_id) is None
+    assert not queue.heartbeat(job.id, "worker-a", 60)
+    assert queue.fail(job.id, "worker-a", "stopped") == "cancelled"
+    assert queue.stats()["cancelled"] == 1
@@ -0,0 +1,64 @@
+import logging
+import pytest
+from pipeline import Stage, StageError, run_pipeline
+
+logger = logging.getLogger("test")
+
+
+def test_stages_run_in_order_with_dependency_results():
+    """Test each stage runs after its dependencies and receives their results."""
+    calls = []
+
+    def stage(name, value):
+        def func(results):
+            calls.append((name, dict(results)))
+            return value
+        return Stage(name, func, after=[c for c in ("a", "b") if c < name])
+
+    results = run_pipeline([stage("a", 1), stage("b", 2), stage("c", 3)], logger)
+
+    assert results == {"a": 1, "b": 2, "c": 3}
+    assert calls == [("a", {}), ("b", {"a": 1}), ("c", {"a": 1, "b": 2})]
+
+
+def test_completed_stages_are_skipped():
+    """Test stages recorded by an earlier run are not run again."""
+    ran = []
+    stages = [
+        Stage("a", lambda r: ran.append("a")),
+        Stage("b", lambda r: ran.append("b") or r["a"] + 1, after=["a"]),
+    ]
+    done = []
+
+    results = run_pipeline(
+        stages, logger, completed={"a": 41}, on_stage_complete=lambda n, v: done.append((n, v))
+    )
+
+    assert ran == ["b"]
+    assert results == {"a": 41, "b": 42}
+    assert done == [("b", 42)]
+
+
+def test_failure_stops_later_stages():
+    """Test a failing stage is re-raised and later stages never start."""
+    ran = []
+
+    def fail(results):
+        raise StageError("ops", "Error creating branch", "boom")
+
+    stages = [
+        Stage("a", lambda r: ran.append("a")),
+        Stage("b", fail, after=["a"]),
+        Stage("c", lambda r: ran.append("c"), after=["b"]),
+    ]
+    with pytest.raises(StageError):
+        run_pipeline(stages, logger)
+    assert ran == ["a"]
+
+
+def test_stage_before_its_dependency_is_rejected():
+    """Test a stage listed before a stage it depends on is a configuration error."""
+    with pytest.raises(ValueError, match="must come after"):
+        run_pipeline([Stage("b", lambda r: None, after=["a"]), Stage("a", lambda r: None)], logger)
+    with pytest.raises(ValueError, match="unknown stages"):
+        run_pipeline([Stage("b", lambda r: None, after=["x"])], logger)
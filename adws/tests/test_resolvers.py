@@ -0,0 +1,51 @@
+from resolvers import resolve_issue_class, resolve_plan_file
+from tests.conftest import git
+
+
+def write_spec(repo, name):
+    (repo / "specs").mkdir(exist_ok=True)
+    (repo / "specs" / name).write_text(f"# {name}\n")
+    return f"specs/{name}"
+
+
+def test_stale_committed_spec_is_not_resolved(git_repo, make_issue):
+    """Test a spec committed by an earlier run for the issue is never picked."""
+    stale = write_spec(git_repo, "feature-42-old-run-plan.md")
+    git(git_repo, "add", stale)
+    git(git_repo, "commit", "-q", "-m", "Plan from an earlier run")
+
+    # The planner's output does not name the file, so only the specs glob can answer
+    assert resolve_plan_file("Plan written.", make_issue(), "/feature") is None
+
+    new = write_spec(git_repo, "feature-42-new-run-plan.md")
+    assert resolve_plan_file("Plan written.", make_issue(), "/feature") == new
+    assert resolve_plan_file(f"See {stale} for context.", make_issue(), "/feature") == new
+
+
+def test_plan_file_from_output_ignores_unrelated_committed_specs(git_repo, make_issue):
+    """Test a committed spec of another issue mentioned by the planner is not picked."""
+    other = write_spec(git_repo, "chore-7-cleanup.md")
+    git(git_repo, "add", other)
+    git(git_repo, "commit", "-q", "-m", "Other plan")
+
+    assert resolve_plan_file(f"Based on {other}", make_issue(), "/feature") is None
+
+    new = write_spec(git_repo, "task-filters.md")
+    assert resolve_plan_file(f"Based on {other}, wrote {new}.", make_issue(), "/feature") == new
+
+
+def test_ambiguous_new_specs_fall_back_to_agent(git_repo, make_issue):
+    """Test two new specs for the issue resolve to nothing."""
+    write_spec(git_repo, "feature-42-a.md")
+    write_spec(git_repo, "feature-42-b.md")
+    assert resolve_plan_file("Plan written.", make_issue(), "/feature") is None
+
+
+def test_issue_class_from_labels_title_and_body(make_issue):
+    """Test deterministic classification and its disagreement fallback."""
+    bug_label = {"id": "1", "name": "bug", "color": "red"}
+    assert resolve_issue_class(make_issue(labels=[bug_label])) == "/bug"
+    assert resolve_issue_class(make_issue(title="feat(ui): Add filters")) == "/feature"
+    assert resolve_issue_class(make_issue(body="/chore\n\nTidy up")) == "/chore"
+    assert resolve_issue_class(make_issue(title="chore: tidy", labels=[bug_label])) is None
+    assert resolve_issue_class(make_issue()) is None
@@ -0,0 +1,86 @@
+import logging
+import os
+import shutil
+import pytest
+import adw_plan_build
+import agent
+import response_cache
+from data_types import AgentPromptResponse
+
+ADW_ID = "cachetst"
+
+
+@pytest.fixture
+def fake_claude(tmp_path, monkeypatch):
+    """Point the cache at tmp_path and replace Claude Code with a counting fake."""
+    monkeypatch.setattr(response_cache, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(response_cache, "CACHE_ENABLED", True)
+    prompts = []
+
+    def prompt_claude_code(request, on_message=None):
+        prompts.append(request.prompt)
+        return AgentPromptResponse(output="/feature", success=True, session_id="s1")
+
+    monkeypatch.setattr(agent, "prompt_claude_code", prompt_claude_code)
+    yield prompts
+    # execute_template creates agents/{adw_id}/ for the agent's output
+    shutil.rmtree(os.path.join(response_cache.PROJECT_ROOT, "agents", ADW_ID), ignore_errors=True)
+
+
+def status_comment(n):
+    return {
+        "id": f"c{n}",
+        "author": {"login": "adw-bot"},
+        "body": f"{ADW_ID}_ops: ✅ Stage {n} done",
+        "createdAt": "2026-01-02T00:00:00Z",
+    }
+
+
+def test_classification_hits_after_workflow_commented(fake_claude, make_issue):
+    """Test a rerun reuses the classification although the workflow commented on the issue."""
+    logger = logging.getLogger("test")
+    first = make_issue()
+    rerun = make_issue(
+        comments=[status_comment(1), status_comment(2)], updatedAt="2026-01-03T00:00:00Z"
+    )
+
+    assert adw_plan_build.classify_issue(first, ADW_ID, logger) == ("/feature", None)
+    assert adw_plan_build.classify_issue(rerun, ADW_ID, logger) == ("/feature", None)
+    assert len(fake_claude) == 1
+
+
+def test_classification_misses_when_issue_text_changes(fake_claude, make_issue):
+    """Test editing the issue body or labels asks the classifier again."""
+    logger = logging.getLogger("test")
+    label = {"id": "1", "name": "needs-triage", "color": "fff"}
+
+    adw_plan_build.classify_issue(make_issue(), ADW_ID, logger)
+    adw_plan_build.classify_issue(make_issue(body="Filter tasks by day."), ADW_ID, logger)
+    adw_plan_build.classify_issue(make_issue(labels=[label]), ADW_ID, logger)
+    assert len(fake_claude) == 3
+
+
+def test_cache_keys_and_expiry(tmp_path, monkeypatch):
+    """Test keys depend on command, model and key args, and expired entries miss."""
+    monkeypatch.setattr(response_cache, "CACHE_DIR", str(tmp_path))
+    key = response_cache.make_cache_key("/classify_issue", ["42", "Title"], "sonnet")
+    assert key == response_cache.make_cache_key("/classify_issue", ["42", "Title"], "sonnet")
+    assert key != response_cache.make_cache_key("/classify_issue", ["42", "Title"], "opus")
+    assert key != response_cache.make_cache_key("/classify_issue", ["43", "Title"], "sonnet")
+
+    response_cache.put_cached_response(key, AgentPromptResponse(output="/bug", success=True))
+    response_cache.put_cached_response("f" * 64, AgentPromptResponse(output="x", success=False))
+    cached = response_cache.get_cached_response(key)
+    assert cached.output == "/bug" and cached.cached
+    assert response_cache.get_cached_response("f" * 64) is None
+
+    monkeypatch.setattr(response_cache, "CACHE_TTL_SECONDS", -1)
+    assert response_cache.get_cached_response(key) is None
+
+
+def test_only_stable_commands_are_cacheable(monkeypatch):
+    """Test commands keyed on nondeterministic agent output are never cached."""
+    monkeypatch.setattr(response_cache, "CACHE_ENABLED", True)
+    assert response_cache.is_cacheable("/classify_issue")
+    assert not response_cache.is_cacheable("/find_plan_file")
+    assert not response_cache.is_cacheable("/implement")
@@ -0,0 +1,26 @@
+import logging
+import adw_plan_build
+import scheduler
+from tests.conftest import git
+
+
+def test_branch_stage_runs_inside_worktree(git_repo, make_issue, monkeypatch):
+    """Test the branch stage works in a worktree while main is checked out elsewhere."""
+    monkeypatch.setattr(scheduler, "PROJECT_ROOT", str(git_repo))
+    monkeypatch.setattr(scheduler, "WORKTREES_DIR", str(git_repo / "trees"))
+    monkeypatch.setattr(scheduler, "WORKTREE_COPY_FILES", [])
+    worktree_path = scheduler.create_worktree("abcd1234")
+    monkeypatch.chdir(worktree_path)
+
+    branch_name, error = adw_plan_build.git_branch(
+        make_issue(), "/feature", "abcd1234", logging.getLogger("test")
+    )
+
+    assert error is None
+    assert branch_name == "feature-42-abcd1234-add-task-filters"
+    assert git(worktree_path, "branch", "--show-current") == branch_name
+    assert git(worktree_path, "rev-parse", "HEAD") == git(git_repo, "rev-parse", "origin/main")
+    assert git(git_repo, "branch", "--show-current") == "main"
+
+    scheduler.remove_worktree(worktree_path)
+    assert not (git_repo / "trees" / "abcd1234").exists()
@@ -0,0 +1,80 @@
+import json
+import logging
+import os
+import pytest
+import state
+from data_types import WorkflowState
+from pipeline import Stage, run_pipeline
+from state import WorkflowStateStore
+
+
+@pytest.fixture(autouse=True)
+def agents_dir(tmp_path, monkeypatch):
+    """Keep state files under tmp_path."""
+    monkeypatch.setattr(state, "PROJECT_ROOT", str(tmp_path))
+
+
+def test_state_round_trips_through_disk():
+    """Test completed stages and sessions are saved and loaded again."""
+    store = WorkflowStateStore(WorkflowState(adw_id="abcd1234", issue_number="42"))
+    store.complete_stage("classify", "/feature")
+    store.complete_stage("branch", "feature-42-abcd1234-add-task-filters")
+    store.record_session("sdlc_planner", "session-1")
+    store.record_session("sdlc_planner_committer", None)
+    store.forget_stage("branch")
+
+    loaded = WorkflowStateStore.load("abcd1234")
+    assert loaded.state.completed == {"classify": "/feature"}
+    assert loaded.state.session_ids == {"sdlc_planner": "session-1"}
+    assert WorkflowStateStore.load("missing1") is None
+    assert os.listdir(os.path.dirname(store.path)) == ["state.json"]
+
+
+def test_failed_write_keeps_previous_state(monkeypatch):
+    """Test a crash while saving leaves the last complete state file in place."""
+    store = WorkflowStateStore(WorkflowState(adw_id="abcd1234", issue_number="42"))
+    store.complete_stage("classify", "/feature")
+
+    def crash(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(state.os, "replace", crash)
+    with pytest.raises(OSError):
+        store.complete_stage("branch", "feature-42")
+
+    with open(store.path) as f:
+        assert json.load(f)["completed"] == {"classify": "/feature"}
+
+
+def test_resume_skips_checkpointed_stages():
+    """Test a resumed pipeline only runs the stages missing from the state file."""
+    first = WorkflowStateStore(WorkflowState(adw_id="abcd1234", issue_number="42"))
+    ran = []
+
+    def stage(name, fail=False):
+        def func(results):
+            ran.append(name)
+            if fail:
+                raise RuntimeError(f"{name} failed")
+            return f"{name}-result"
+        return func
+
+    with pytest.raises(RuntimeError):
+        run_pipeline(
+            [Stage("a", stage("a")), Stage("b", stage("b", fail=True), after=["a"])],
+            logging.getLogger("test"),
+            completed=first.state.completed,
+            on_stage_complete=first.complete_stage,
+        )
+
+    resumed = WorkflowStateStore.load("abcd1234")
+    results = run_pipeline(
+        [Stage("a", stage("a")), Stage("b", stage("b"), after=["a"])],
+        logging.getLogger("test"),
+        completed=resumed.state.completed,
+        on_stage_complete=resumed.complete_stage,
+    )
+
+    assert ran == ["a", "b", "b"]
+    assert results == {"a": "a-result", "b": "b-result"}
+    assert WorkflowStateStore.load("abcd1234").state.completed == results
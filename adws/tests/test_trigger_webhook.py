@@ -0,0 +1,102 @@
+import hashlib
+import hmac
+import json
+import pytest
+from fastapi.testclient import TestClient
+import trigger_webhook
+from job_queue import JobQueue
+
+
+@pytest.fixture
+def webhook(tmp_path, monkeypatch):
+    """Serve the webhook app with a temporary job queue and no scheduler."""
+    job_queue = JobQueue(str(tmp_path / "queue.db"))
+    monkeypatch.setattr(trigger_webhook, "job_queue", job_queue)
+    monkeypatch.setattr(trigger_webhook.scheduler, "job_queue", job_queue)
+    monkeypatch.setattr(trigger_webhook.scheduler, "wake", lambda: None)
+    monkeypatch.setattr(trigger_webhook, "seen_deliveries", trigger_webhook.TTLStore(60))
+    monkeypatch.setattr(trigger_webhook, "recent_issue_triggers", trigger_webhook.TTLStore(60))
+    return TestClient(trigger_webhook.app)
+
+
+def issue_opened(number=5):
+    return json.dumps({
+        "action": "opened",
+        "issue": {"number": number},
+        "repository": {"full_name": "owner/repo"},
+    }).encode()
+
+
+def post(client, body, delivery="d1", signature=None):
+    headers = {"X-GitHub-Event": "issues", "X-GitHub-Delivery": delivery}
+    if signature:
+        headers["X-Hub-Signature-256"] = signature
+    return client.post("/gh-webhook", content=body, headers=headers)
+
+
+def sign(body, secret):
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def test_verify_signature_fails_closed_without_secret():
+    """Test unsigned bodies are only accepted when explicitly allowed."""
+    body = b"{}"
+    assert not trigger_webhook.verify_signature(body, "", secret="", allow_unsigned=False)
+    assert trigger_webhook.verify_signature(body, "", secret="", allow_unsigned=True)
+    assert trigger_webhook.verify_signature(body, sign(body, "s3cret"), secret="s3cret")
+    assert not trigger_webhook.verify_signature(body, sign(body, "other"), secret="s3cret")
+
+
+def test_unsigned_webhook_is_rejected_without_secret(webhook, monkeypatch):
+    """Test a webhook is refused when no secret is configured and unsigned is not allowed."""
+    monkeypatch.setattr(trigger_webhook, "WEBHOOK_SECRET", "")
+    monkeypatch.setattr(trigger_webhook, "ALLOW_UNSIGNED_WEBHOOKS", False)
+    response = post(webhook, issue_opened())
+    assert response.status_code == 401
+    assert trigger_webhook.job_queue.stats()["queued"] == 0
+
+
+def test_signed_webhook_is_queued(webhook, monkeypatch):
+    """Test a correctly signed trigger is queued, and a bad signature is refused."""
+    monkeypatch.setattr(trigger_webhook, "WEBHOOK_SECRET", "s3cret")
+    body = issue_opened()
+
+    assert post(webhook, body, signature=sign(body, "wrong")).status_code == 401
+    response = post(webhook, body, signature=sign(body, "s3cret"))
+    assert response.json()["status"] == "accepted"
+
+
+def test_delivery_is_recorded_only_after_it_was_handled(webhook, monkeypatch):
+    """Test a delivery that failed is processed again when GitHub redelivers it."""
+    monkeypatch.setattr(trigger_webhook, "WEBHOOK_SECRET", "s3cret")
+    body = issue_opened()
+    enqueue = trigger_webhook.job_queue.enqueue
+    calls = []
+
+    def flaky_enqueue(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        return enqueue(*args, **kwargs)
+
+    monkeypatch.setattr(trigger_webhook.job_queue, "enqueue", flaky_enqueue)
+    statuses = [post(webhook, body, signature=sign(body, "s3cret")).json()["status"] for _ in range(3)]
+
+    assert statuses == ["error", "accepted", "duplicate"]
+    assert len(calls) == 2
+
+
+def test_workflow_endpoints_list_and_cancel(webhook, monkeypatch):
+    """Test queued workflows can be listed, fetched and cancelled with the API token."""
+    monkeypatch.setattr(trigger_webhook, "API_TOKEN", "token")
+    auth = {"Authorization": "Bearer token"}
+    job = trigger_webhook.job_queue.enqueue(5, "owner/repo", "", reason="test")
+
+    assert webhook.get("/workflows").status_code == 401
+    listed = webhook.get("/workflows", headers=auth).json()["workflows"]
+    assert [w["adw_id"] for w in listed] == [job.adw_id]
+    assert webhook.get(f"/workflows/{job.adw_id}", headers=auth).json()["state"] == "queued"
+
+    cancelled = webhook.post(f"/workflows/{job.adw_id}/cancel", headers=auth).json()
+    assert cancelled == {"status": "cancelled", "adw_id": job.adw_id, "previous_state": "queued"}
+    assert webhook.get("/workflows", headers=auth).json()["workflows"] == []
@@ -0,0 +1,38 @@
+import ttl_store
+from ttl_store import TTLStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+def test_keys_expire_after_ttl(monkeypatch):
+    """Test a key is present until its TTL passes, then can be added again."""
+    clock = FakeClock()
+    monkeypatch.setattr(ttl_store, "time", clock)
+    store = TTLStore(ttl_seconds=30)
+
+    assert store.add("delivery-1")
+    assert not store.add("delivery-1")
+    clock.now += 10
+    assert store.age("delivery-1") == 10
+    assert "delivery-1" in store
+    clock.now += 25
+    assert "delivery-1" not in store
+    assert store.age("delivery-1") is None
+    assert store.add("delivery-1")
+
+
+def test_oldest_keys_are_evicted_over_max_entries():
+    """Test the store never holds more than max_entries keys."""
+    store = TTLStore(ttl_seconds=60, max_entries=3)
+    for key in range(5):
+        store.add(key)
+
+    assert len(store) == 3
+    assert 0 not in store and 1 not in store
+    assert all(key in store for key in (2, 3, 4))
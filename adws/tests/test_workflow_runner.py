@@ -0,0 +1,30 @@
+import workflow_runner
+from workflow_runner import PrewarmedWorkerPool, launch_process
+
+
+def test_launch_process_logs_early_crash(tmp_path):
+    """Test a workflow failing before its logger is set up leaves its error in the log."""
+    log_path = tmp_path / "agents" / "abcd1234" / "worker.log"
+    process = launch_process(["--no-such-option"], str(tmp_path), str(log_path))
+
+    assert process.wait(timeout=60) == 2
+    assert "unrecognized arguments: --no-such-option" in log_path.read_text()
+
+
+def test_prewarmed_worker_logs_early_crash(tmp_path):
+    """Test a prewarmed worker redirects the workflow's output once handed a job."""
+    log_path = tmp_path / "worker.log"
+    pool = PrewarmedWorkerPool(size=0)
+    process = pool.launch(["--no-such-option"], str(tmp_path), str(log_path))
+
+    try:
+        assert process.wait(timeout=60) == 2
+    finally:
+        pool.close()
+    assert "unrecognized arguments: --no-such-option" in log_path.read_text()
+
+
+def test_worker_log_path_is_under_agents():
+    """Test worker logs sit next to the workflow's other logs."""
+    path = workflow_runner.worker_log_path("abcd1234")
+    assert path.endswith("agents/abcd1234/worker.log")
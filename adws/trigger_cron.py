@@ -11,31 +11,45 @@
 """
 Cron-based ADW trigger system that monitors GitHub issues and automatically processes them.
 
-This script polls GitHub every 20 seconds to detect:
+This script polls GitHub every 20 seconds (ADW_POLL_INTERVAL_SECONDS) to detect:
 1. New issues without comments
 2. Issues where the latest comment contains 'adw'
 
-When a qualifying issue is found, it triggers the existing manual workflow script.
+Polling is incremental: each cycle first sends a conditional request (ETag), so
+a quiet repository costs one 304 response. When something changed, the issues
+updated since the last cycle are fetched together with their latest comment in
+a single paginated GraphQL query, so the cost stays flat as issues grow.
+
+After each cycle the interval is adapted to the GitHub API budget: when
+polling at the base rate would eat into the calls reserved for workflows
+before the rate limit resets, polling slows down until the reset.
+
+When a qualifying issue is found, it is added to the durable job queue
+(job_queue.py), deduplicated by issue and triggering comment so restarts never
+lose or repeat work. An embedded WorkflowScheduler consumes the queue and runs
+up to ADW_MAX_WORKERS workflows concurrently, each in its own git worktree.
 """
 
 import os
 import signal
-import subprocess
 import sys
 import time
-from pathlib import Path
-from typing import Dict, Set, Optional
+from typing import Dict, Optional, Tuple
 
 import schedule
 from dotenv import load_dotenv
 
-from github import fetch_open_issues, fetch_issue_comments, get_repo_url, extract_repo_path
+from data_types import GitHubIssueListItem
+from github import IssuePoller, get_repo_url, extract_repo_path, rate_limit_budget
+from job_queue import JobQueue
+from scheduler import WorkflowScheduler
 
 # Load environment variables from current or parent directories
 load_dotenv()
 
 # Optional environment variables
 GITHUB_PAT = os.getenv("GITHUB_PAT")
+POLL_INTERVAL_SECONDS = int(os.getenv("ADW_POLL_INTERVAL_SECONDS", "20"))
 
 # Get repository URL from git remote
 try:
@@ -45,14 +59,20 @@ except ValueError as e:
     print(f"ERROR: {e}")
     sys.exit(1)
 
-# Track processed issues
-processed_issues: Set[int] = set()
-# Track issues with their last processed comment ID
-issue_last_comment: Dict[int, Optional[int]] = {}
-
 # Graceful shutdown flag
 shutdown_requested = False
 
+# Durable queue of workflow runs, consumed by the embedded scheduler
+job_queue = JobQueue()
+scheduler = WorkflowScheduler(job_queue)
+
+# Asks GitHub only for issues updated since the last cycle
+issue_poller = IssuePoller(REPO_PATH)
+# Changed issues that had an active workflow; re-checked once it finishes
+deferred_issues: Dict[int, GitHubIssueListItem] = {}
+# Scheduled poll job, its interval adapted to the API budget after each cycle
+poll_job: Optional[schedule.Job] = None
+
 
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
@@ -61,67 +81,61 @@ def signal_handler(signum, frame):
     shutdown_requested = True
 
 
-def should_process_issue(issue_number: int) -> bool:
-    """Determine if an issue should be processed based on comments."""
-    comments = fetch_issue_comments(REPO_PATH, issue_number)
-    
+def should_process_issue(issue: GitHubIssueListItem) -> Tuple[bool, str]:
+    """Determine if a changed issue should be processed based on comments.
+
+    The poller fetches each issue with its latest comment, so this needs no
+    further API calls. Returns (should_process, trigger_comment_id). The
+    trigger comment id is empty for new issues and is the queue's
+    deduplication key, so the same trigger is only ever processed once.
+    """
+    issue_number = issue.number
+
     # If no comments, it's a new issue - process it
-    if not comments:
+    if not issue.comment_count:
         print(f"INFO: Issue #{issue_number} has no comments - marking for processing")
-        return True
-    
-    # Get the latest comment
-    latest_comment = comments[-1]
-    comment_body = latest_comment.get("body", "").lower()
-    comment_id = latest_comment.get("id")
-    
-    # Check if we've already processed this comment
-    last_processed_comment = issue_last_comment.get(issue_number)
-    if last_processed_comment == comment_id:
-        # DEBUG level - not printing
-        return False
-    
+        return True, ""
+
     # Check if latest comment is exactly 'adw' (after stripping whitespace)
+    comment_body = (issue.last_comment_body or "").lower()
     if comment_body.strip() == "adw":
         print(f"INFO: Issue #{issue_number} - latest comment is 'adw' - marking for processing")
-        issue_last_comment[issue_number] = comment_id
-        return True
-    
+        return True, issue.last_comment_id or ""
+
     # DEBUG level - not printing
-    return False
+    return False, ""
 
 
-def trigger_adw_workflow(issue_number: int) -> bool:
-    """Trigger the ADW plan and build workflow for a specific issue."""
+def trigger_adw_workflow(issue_number: int, comment_id: str = "") -> bool:
+    """Queue the ADW plan and build workflow for a specific issue.
+
+    Returns True if a new job was queued, False if this trigger was already handled.
+    """
     try:
-        script_path = Path(__file__).parent / "adw_plan_build.py"
-        
-        print(f"INFO: Triggering ADW workflow for issue #{issue_number}")
-        
-        cmd = [sys.executable, str(script_path), str(issue_number)]
-        
-        # Run the manual trigger script
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=script_path.parent
-        )
-        
-        if result.returncode == 0:
-            print(f"INFO: Successfully triggered workflow for issue #{issue_number}")
-            # DEBUG level - not printing output
-            return True
-        else:
-            print(f"ERROR: Failed to trigger workflow for issue #{issue_number}")
-            print(f"ERROR: {result.stderr}")
+        job = job_queue.enqueue(issue_number, REPO_PATH, comment_id, reason="cron")
+        if job is None:
+            # DEBUG level - trigger already queued or processed
             return False
-            
+
+        print(f"INFO: Queued ADW workflow {job.adw_id} for issue #{issue_number}")
+        scheduler.wake()
+        return True
+
     except Exception as e:
         print(f"ERROR: Exception while triggering workflow for issue #{issue_number}: {e}")
         return False
 
 
+def adapt_poll_interval() -> None:
+    """Poll less often while the GitHub API budget is low."""
+    if poll_job is None:
+        return
+    interval = round(rate_limit_budget.poll_interval(POLL_INTERVAL_SECONDS))
+    if interval != poll_job.interval:
+        print(f"INFO: Polling interval now {interval} seconds (GitHub API budget: {rate_limit_budget.describe()})")
+        poll_job.interval = interval
+
+
 def check_and_process_issues():
     """Main function that checks for issues and processes qualifying ones."""
     if shutdown_requested:
@@ -132,51 +146,54 @@ def check_and_process_issues():
     print(f"INFO: Starting issue check cycle")
     
     try:
-        # Fetch all open issues
-        issues = fetch_open_issues(REPO_PATH)
+        # Fetch only issues changed since the last cycle (304 when nothing changed)
+        changed_issues = issue_poller.poll()
+        for issue in changed_issues:
+            deferred_issues[issue.number] = issue
         
-        if not issues:
-            print(f"INFO: No open issues found")
+        if not deferred_issues:
+            print(f"INFO: No changed issues to check")
+            print(f"INFO: Check cycle completed in {time.time() - start_time:.2f} seconds")
             return
         
-        # Track newly qualified issues
+        # Track newly qualified issues with their triggering comment
         new_qualifying_issues = []
         
-        # Check each issue
-        for issue in issues:
-            issue_number = issue.number
-            if not issue_number:
-                continue
-            
-            # Skip if already processed in this session
-            if issue_number in processed_issues:
+        # Check each changed issue
+        for issue_number, issue in list(deferred_issues.items()):
+            # Wait until the active workflow for this issue finishes
+            if job_queue.is_active(REPO_PATH, issue_number):
                 continue
+            del deferred_issues[issue_number]
             
             # Check if issue should be processed
-            if should_process_issue(issue_number):
-                new_qualifying_issues.append(issue_number)
+            should_process, comment_id = should_process_issue(issue)
+            if should_process:
+                new_qualifying_issues.append((issue_number, comment_id))
         
         # Process qualifying issues
         if new_qualifying_issues:
-            print(f"INFO: Found {len(new_qualifying_issues)} new qualifying issues: {new_qualifying_issues}")
+            print(f"INFO: Found {len(new_qualifying_issues)} qualifying issues: {[n for n, _ in new_qualifying_issues]}")
             
-            for issue_number in new_qualifying_issues:
+            queued = 0
+            for issue_number, comment_id in new_qualifying_issues:
                 if shutdown_requested:
                     print(f"INFO: Shutdown requested, stopping issue processing")
                     break
                 
-                # Trigger the workflow
-                if trigger_adw_workflow(issue_number):
-                    processed_issues.add(issue_number)
-                else:
-                    print(f"WARNING: Failed to process issue #{issue_number}, will retry in next cycle")
+                # Queue the workflow; triggers already handled are skipped
+                if trigger_adw_workflow(issue_number, comment_id):
+                    queued += 1
+            print(f"INFO: Queued {queued} new workflows")
         else:
             print(f"INFO: No new qualifying issues found")
         
         # Log performance metrics
         cycle_time = time.time() - start_time
         print(f"INFO: Check cycle completed in {cycle_time:.2f} seconds")
-        print(f"INFO: Total processed issues in session: {len(processed_issues)}")
+        if deferred_issues:
+            print(f"INFO: Waiting on active workflows for issues: {sorted(deferred_issues)}")
+        print(f"INFO: Scheduler: {scheduler.metrics()}")
         
     except Exception as e:
         print(f"ERROR: Error during check cycle: {e}")
@@ -184,21 +201,32 @@ def check_and_process_issues():
         traceback.print_exc()
 
 
+def run_poll_cycle():
+    """Check issues, then adapt the polling interval to the API budget."""
+    check_and_process_issues()
+    adapt_poll_interval()
+    print(f"INFO: GitHub API budget: {rate_limit_budget.describe()}, calls: {rate_limit_budget.calls}")
+
+
 def main():
     """Main entry point for the cron trigger."""
+    global poll_job
     print(f"INFO: Starting ADW cron trigger")
     print(f"INFO: Repository: {REPO_PATH}")
-    print(f"INFO: Polling interval: 20 seconds")
+    print(f"INFO: Polling interval: {POLL_INTERVAL_SECONDS} seconds")
     
     # Set up signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
+    # Start workflow workers
+    scheduler.start()
+
     # Schedule the check function
-    schedule.every(20).seconds.do(check_and_process_issues)
+    poll_job = schedule.every(POLL_INTERVAL_SECONDS).seconds.do(run_poll_cycle)
     
     # Run initial check immediately
-    check_and_process_issues()
+    run_poll_cycle()
     
     # Main loop
     print(f"INFO: Entering main scheduling loop")
@@ -206,6 +234,8 @@ def main():
         schedule.run_pending()
         time.sleep(1)
     
+    print(f"INFO: Waiting for running workflows to finish")
+    scheduler.stop()
     print(f"INFO: Shutdown complete")
 
 
@@ -216,6 +246,10 @@ if __name__ == "__main__":
         print("\nUsage: ./trigger_cron.py")
         print("\nEnvironment variables:")
         print("  GITHUB_PAT - (Optional) GitHub Personal Access Token")
+        print("  ADW_MAX_WORKERS - (Optional) Concurrent workflows (default: CPU cores)")
+        print("  ADW_MAX_WORKFLOWS_PER_REPO - (Optional) Concurrent workflows per repo (default: 2)")
+        print("  ADW_QUEUE_DB - (Optional) Job queue database (default: agents/job_queue.db)")
+        print("  ADW_POLL_INTERVAL_SECONDS - (Optional) Base polling interval (default: 20)")
         print("\nThe script will poll GitHub issues every 20 seconds and trigger")
         print("the ADW workflow for qualifying issues.")
         print("\nNote: Repository URL is automatically detected from git remote.")
@@ -1,118 +1,229 @@
 #!/usr/bin/env -S uv run
 # /// script
-# dependencies = ["fastapi", "uvicorn", "python-dotenv"]
+# dependencies = ["fastapi", "uvicorn", "python-dotenv", "pydantic"]
 # ///
 
 """
 GitHub Webhook Trigger - AI Developer Workflow (ADW)
 
 FastAPI webhook endpoint that receives GitHub issue events and triggers ADW workflows.
-Responds immediately to meet GitHub's 10-second timeout by launching adw_plan_build.py
-in the background.
+Responds immediately to meet GitHub's 10-second timeout by adding the run to the
+durable job queue (job_queue.py). Redelivered events for the same trigger are
+ignored, and an embedded WorkflowScheduler runs the queued workflows.
 
-Usage: uv run trigger_webhook.py
+Requests are screened before any JSON parsing: events other than issues and
+issue_comment are ignored from the X-GitHub-Event header alone, bodies over
+the size limit are refused, and the X-Hub-Signature-256 HMAC of the raw body
+must match GITHUB_WEBHOOK_SECRET. Without a secret every webhook is rejected,
+since a triggered workflow runs an agent with write access to the repository;
+ADW_WEBHOOK_ALLOW_UNSIGNED=1 accepts unsigned webhooks instead (local testing).
+
+Bursts are coalesced into a single run: deliveries already seen (by
+X-GitHub-Delivery) are dropped, a trigger within the debounce window of an
+accepted trigger for the same issue is ignored, and so is a trigger for an
+issue that already has a queued or running workflow.
+
+The /workflows endpoints can list, follow and cancel workflows, so they
+require an "Authorization: Bearer <token>" header. The token is ADW_API_TOKEN,
+or when that is unset an HMAC of GITHUB_WEBHOOK_SECRET (print it with
+--print-api-token). With neither set the endpoints are disabled. /health/deep
+runs a Claude Code prompt, so it needs the token too unless the cached result
+is fresher than ADW_HEALTH_DEEP_MIN_AGE_SECONDS, in which case that is returned.
+
+Usage: uv run trigger_webhook.py [--print-api-token]
 
 Environment Requirements:
 - PORT: Server port (default: 8001)
+- GITHUB_WEBHOOK_SECRET: Webhook secret used to verify signatures (required
+  unless ADW_WEBHOOK_ALLOW_UNSIGNED=1)
+- ADW_WEBHOOK_ALLOW_UNSIGNED: Set to 1 to accept unsigned webhooks when no
+  secret is set (default: 0)
+- ADW_API_TOKEN: Bearer token for the /workflows endpoints (default: derived
+  from GITHUB_WEBHOOK_SECRET)
+- ADW_WEBHOOK_MAX_BYTES: Largest accepted payload (default: 1048576)
+- ADW_WEBHOOK_DEDUP_TTL_SECONDS: How long delivery ids are remembered (default: 86400)
+- ADW_WEBHOOK_DEDUP_MAX_ENTRIES: Most delivery ids remembered (default: 10000)
+- ADW_ISSUE_DEBOUNCE_SECONDS: Window after an accepted trigger in which
+  further triggers for the same issue are ignored (default: 30)
+- ADW_HEALTH_CHECK_INTERVAL_SECONDS: How often the full health check runs in
+  the background for /health (default: 600)
+- ADW_HEALTH_DEEP_MIN_AGE_SECONDS: /health/deep returns a cached result this
+  recent without running the checks or asking for the API token (default: 60)
 - All adw_plan_build.py requirements (GITHUB_PAT, ANTHROPIC_API_KEY, etc.)
 """
 
+import asyncio
+import hashlib
+import hmac
+import json
 import os
-import subprocess
 import sys
-from fastapi import FastAPI, Request
+import time
+from typing import List, Optional, get_args
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from dotenv import load_dotenv
 import uvicorn
-from utils import make_adw_id
+from data_types import JobState
+from events import events_path, read_events
+from github import get_repo_url, extract_repo_path, rate_limit_budget
+from health_check import HealthMonitor
+from job_queue import JobQueue
+from scheduler import WorkflowScheduler
+from ttl_store import TTLStore
 
 # Load environment variables
 load_dotenv()
 
 # Configuration
 PORT = int(os.getenv("PORT", "8001"))
+EVENTS_POLL_SECONDS = float(os.getenv("ADW_EVENTS_POLL_SECONDS", "0.5"))
+EVENTS_KEEPALIVE_SECONDS = 15
+WEBHOOK_SECRET = os.getenv("GITHUB_WEBHOOK_SECRET", "")
+ALLOW_UNSIGNED_WEBHOOKS = os.getenv("ADW_WEBHOOK_ALLOW_UNSIGNED", "0") == "1"
+WEBHOOK_MAX_BYTES = int(os.getenv("ADW_WEBHOOK_MAX_BYTES", str(1024 * 1024)))
+
+DEDUP_TTL_SECONDS = float(os.getenv("ADW_WEBHOOK_DEDUP_TTL_SECONDS", "86400"))
+DEDUP_MAX_ENTRIES = int(os.getenv("ADW_WEBHOOK_DEDUP_MAX_ENTRIES", "10000"))
+ISSUE_DEBOUNCE_SECONDS = float(os.getenv("ADW_ISSUE_DEBOUNCE_SECONDS", "30"))
+HEALTH_CHECK_INTERVAL_SECONDS = float(os.getenv("ADW_HEALTH_CHECK_INTERVAL_SECONDS", "600"))
+HEALTH_DEEP_MIN_AGE_SECONDS = float(os.getenv("ADW_HEALTH_DEEP_MIN_AGE_SECONDS", "60"))
+
+# Events that can trigger a workflow; everything else is ignored unread
+TRIGGER_EVENTS = {"issues", "issue_comment"}
+
+# Recently handled X-GitHub-Delivery ids, and issues with a recently accepted trigger
+seen_deliveries = TTLStore(DEDUP_TTL_SECONDS, DEDUP_MAX_ENTRIES)
+recent_issue_triggers = TTLStore(ISSUE_DEBOUNCE_SECONDS, DEDUP_MAX_ENTRIES)
 
 # Create FastAPI app
 app = FastAPI(title="ADW Webhook Trigger", description="GitHub webhook endpoint for ADW")
 
+# Durable queue of workflow runs, consumed by the embedded scheduler
+job_queue = JobQueue()
+scheduler = WorkflowScheduler(job_queue)
+
+# Runs health_check.py's checks in the background; /health serves the cached result
+health_monitor = HealthMonitor(HEALTH_CHECK_INTERVAL_SECONDS)
+
 print(f"Starting ADW Webhook Trigger on port {PORT}")
+if not WEBHOOK_SECRET and ALLOW_UNSIGNED_WEBHOOKS:
+    print("WARNING: GITHUB_WEBHOOK_SECRET not set - unsigned webhooks are accepted (ADW_WEBHOOK_ALLOW_UNSIGNED=1)")
+elif not WEBHOOK_SECRET:
+    print("ERROR: GITHUB_WEBHOOK_SECRET not set - all webhooks will be rejected "
+          "(set ADW_WEBHOOK_ALLOW_UNSIGNED=1 to accept unsigned webhooks)")
+
+
+def verify_signature(
+    body: bytes,
+    signature: str,
+    secret: str = WEBHOOK_SECRET,
+    allow_unsigned: bool = ALLOW_UNSIGNED_WEBHOOKS,
+) -> bool:
+    """Check an X-Hub-Signature-256 header against the HMAC of the raw body.
+
+    Without a secret nothing can be verified, so the body is only accepted
+    if unsigned webhooks were explicitly allowed.
+    """
+    if not secret:
+        return allow_unsigned
+    expected = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+def derive_api_token(api_token: str, secret: str) -> str:
+    """Return the token for the /workflows endpoints, or "" if none is configured."""
+    if api_token:
+        return api_token
+    if secret:
+        return hmac.new(secret.encode(), b"adw-api-token", hashlib.sha256).hexdigest()
+    return ""
+
+
+API_TOKEN = derive_api_token(os.getenv("ADW_API_TOKEN", ""), WEBHOOK_SECRET)
+
+
+def has_api_token(request: Request) -> bool:
+    """Check the request's Authorization header against the API token."""
+    supplied = request.headers.get("Authorization", "")
+    return bool(API_TOKEN) and hmac.compare_digest(supplied.encode(), f"Bearer {API_TOKEN}".encode())
+
+
+def require_api_token(request: Request) -> None:
+    """Dependency that rejects requests without the API token."""
+    if not API_TOKEN:
+        raise HTTPException(
+            status_code=403,
+            detail="Workflow endpoints are disabled: set ADW_API_TOKEN or GITHUB_WEBHOOK_SECRET",
+        )
+    if not has_api_token(request):
+        raise HTTPException(
+            status_code=401,
+            detail="Invalid or missing API token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+async def read_body(request: Request, max_bytes: int = WEBHOOK_MAX_BYTES) -> Optional[bytes]:
+    """Read the request body, or return None once it exceeds max_bytes."""
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_bytes:
+        return None
+
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+@app.on_event("startup")
+def start_scheduler():
+    """Start workflow workers, resuming any jobs left in the queue, and health checks."""
+    scheduler.start()
+    health_monitor.start()
+
+
+@app.on_event("shutdown")
+def stop_scheduler():
+    """Stop claiming jobs and wait for running workflows to finish."""
+    health_monitor.stop()
+    scheduler.stop()
 
 
 @app.post("/gh-webhook")
 async def github_webhook(request: Request):
     """Handle GitHub webhook events."""
+    # Get event type from header; irrelevant events are dropped before reading the body
+    event_type = request.headers.get("X-GitHub-Event", "")
+    if event_type not in TRIGGER_EVENTS:
+        return {"status": "ignored", "reason": f"Not a triggering event (event={event_type})"}
+
+    body = await read_body(request)
+    if body is None:
+        raise HTTPException(status_code=413, detail="Payload too large")
+    signature = request.headers.get("X-Hub-Signature-256", "")
+    if not verify_signature(body, signature, WEBHOOK_SECRET, ALLOW_UNSIGNED_WEBHOOKS):
+        print(f"Rejected webhook with invalid signature: event={event_type}")
+        raise HTTPException(status_code=401, detail="Invalid signature")
+
+    # Deduplication and queueing use SQLite, so they run off the event loop
+    delivery_id = request.headers.get("X-GitHub-Delivery", "")
+    return await asyncio.to_thread(handle_delivery, event_type, body, delivery_id)
+
+
+def handle_delivery(event_type: str, body: bytes, delivery_id: str) -> dict:
+    """Process a verified delivery unless it was already handled."""
+    # GitHub redelivers events (retries and manual redeliveries) with the same id
+    if delivery_id and delivery_id in seen_deliveries:
+        print(f"Ignoring redelivered webhook: delivery={delivery_id}")
+        return {"status": "duplicate", "reason": f"Delivery {delivery_id} already processed"}
+
     try:
-        # Get event type from header
-        event_type = request.headers.get("X-GitHub-Event", "")
-        
-        # Parse webhook payload
-        payload = await request.json()
-        
-        # Extract event details
-        action = payload.get("action", "")
-        issue = payload.get("issue", {})
-        issue_number = issue.get("number")
-        
-        print(f"Received webhook: event={event_type}, action={action}, issue_number={issue_number}")
-        
-        should_trigger = False
-        trigger_reason = ""
-        
-        # Check if this is an issue opened event
-        if event_type == "issues" and action == "opened" and issue_number:
-            should_trigger = True
-            trigger_reason = "New issue opened"
-        
-        # Check if this is an issue comment with 'adw' text
-        elif event_type == "issue_comment" and action == "created" and issue_number:
-            comment = payload.get("comment", {})
-            comment_body = comment.get("body", "").strip().lower()
-            
-            print(f"Comment body: '{comment_body}'")
-            
-            if comment_body == "adw":
-                should_trigger = True
-                trigger_reason = "Comment with 'adw' command"
-        
-        if should_trigger:
-            # Generate ADW ID for this workflow
-            adw_id = make_adw_id()
-            
-            # Build command to run adw_plan_build.py with adw_id
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            project_root = os.path.dirname(script_dir)
-            trigger_script = os.path.join(script_dir, "adw_plan_build.py")
-            
-            cmd = ["uv", "run", trigger_script, str(issue_number), adw_id]
-            
-            print(f"Launching background process: {' '.join(cmd)} (reason: {trigger_reason})")
-            
-            # Launch in background using Popen
-            # Run from project root - adw_plan_build.py will handle its own logging
-            process = subprocess.Popen(
-                cmd,
-                cwd=project_root,  # Run from project root, not adws directory
-                env=os.environ.copy()  # Pass all environment variables
-            )
-            
-            print(f"Background process started for issue #{issue_number} with ADW ID: {adw_id}")
-            print(f"Logs will be written to: agents/{adw_id}/adw_plan_build/execution.log")
-            
-            # Return immediately
-            return {
-                "status": "accepted",
-                "issue": issue_number,
-                "adw_id": adw_id,
-                "message": f"ADW workflow triggered for issue #{issue_number}",
-                "reason": trigger_reason,
-                "logs": f"agents/{adw_id}/adw_plan_build/"
-            }
-        else:
-            print(f"Ignoring webhook: event={event_type}, action={action}, issue_number={issue_number}")
-            return {
-                "status": "ignored",
-                "reason": f"Not a triggering event (event={event_type}, action={action})"
-            }
-            
+        response = process_webhook(event_type, body)
     except Exception as e:
         print(f"Error processing webhook: {e}")
         # Always return 200 to GitHub to prevent retries
@@ -121,87 +232,237 @@ async def github_webhook(request: Request):
             "message": "Internal error processing webhook"
         }
 
+    # Only remember the delivery once it was queued or deliberately ignored,
+    # so a redelivery after an error is processed again
+    if delivery_id:
+        seen_deliveries.add(delivery_id)
+    return response
 
-@app.get("/health")
-async def health():
-    """Health check endpoint - runs comprehensive system health check."""
-    try:
-        # Run the health check script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        health_check_script = os.path.join(script_dir, "health_check.py")
-        
-        # Run health check with timeout
-        result = subprocess.run(
-            ["uv", "run", health_check_script],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=script_dir
-        )
-        
-        # Print the health check output for debugging
-        print("=== Health Check Output ===")
-        print(result.stdout)
-        if result.stderr:
-            print("=== Health Check Errors ===")
-            print(result.stderr)
+
+def process_webhook(event_type: str, body: bytes) -> dict:
+    """Parse a verified webhook body and queue a workflow if it is a trigger."""
+    # Parse webhook payload
+    payload = json.loads(body)
+    
+    # Extract event details
+    action = payload.get("action", "")
+    issue = payload.get("issue", {})
+    issue_number = issue.get("number")
+    
+    print(f"Received webhook: event={event_type}, action={action}, issue_number={issue_number}")
+    
+    should_trigger = False
+    trigger_reason = ""
+    comment_id = ""
+    
+    # Check if this is an issue opened event
+    if event_type == "issues" and action == "opened" and issue_number:
+        should_trigger = True
+        trigger_reason = "New issue opened"
+    
+    # Check if this is an issue comment with 'adw' text
+    elif event_type == "issue_comment" and action == "created" and issue_number:
+        comment = payload.get("comment", {})
+        comment_body = comment.get("body", "").strip().lower()
         
-        # Parse the output - look for the overall status
-        output_lines = result.stdout.strip().split('\n')
-        is_healthy = result.returncode == 0
+        print(f"Comment body: '{comment_body}'")
         
-        # Extract key information from output
-        warnings = []
-        errors = []
+        if comment_body == "adw":
+            should_trigger = True
+            comment_id = str(comment.get("id", ""))
+            trigger_reason = "Comment with 'adw' command"
+    
+    if should_trigger:
+        repo_path = payload.get("repository", {}).get("full_name") or extract_repo_path(get_repo_url())
+
+        # Coalesce bursts: one run per debounce window and at most one active run per issue
+        issue_key = (repo_path, issue_number)
+        since_last = recent_issue_triggers.age(issue_key)
+        if since_last is not None:
+            print(f"Debouncing trigger for issue #{issue_number} ({since_last:.0f}s after the last one)")
+            return {
+                "status": "debounced",
+                "issue": issue_number,
+                "message": f"Issue #{issue_number} was triggered {since_last:.0f}s ago",
+            }
+        if job_queue.is_active(repo_path, issue_number):
+            print(f"Ignoring trigger for issue #{issue_number}: workflow already queued or running")
+            return {
+                "status": "coalesced",
+                "issue": issue_number,
+                "message": f"ADW workflow already queued or running for issue #{issue_number}",
+            }
         
-        capturing_warnings = False
-        capturing_errors = False
+        # Queue the workflow; redelivered events for the same trigger are ignored
+        job = job_queue.enqueue(issue_number, repo_path, comment_id, reason=trigger_reason)
+        if job is None:
+            print(f"Ignoring duplicate trigger for issue #{issue_number} (comment: {comment_id or 'none'})")
+            return {
+                "status": "duplicate",
+                "issue": issue_number,
+                "message": f"ADW workflow already queued for this trigger on issue #{issue_number}",
+            }
         
-        for line in output_lines:
-            if "⚠️  Warnings:" in line:
-                capturing_warnings = True
-                capturing_errors = False
-                continue
-            elif "❌ Errors:" in line:
-                capturing_errors = True
-                capturing_warnings = False
-                continue
-            elif "📝 Next Steps:" in line:
-                break
-            
-            if capturing_warnings and line.strip().startswith("-"):
-                warnings.append(line.strip()[2:])
-            elif capturing_errors and line.strip().startswith("-"):
-                errors.append(line.strip()[2:])
+        recent_issue_triggers.add(issue_key)
+        scheduler.wake()
+        adw_id = job.adw_id
         
-        return {
-            "status": "healthy" if is_healthy else "unhealthy",
-            "service": "adw-webhook-trigger",
-            "health_check": {
-                "success": is_healthy,
-                "warnings": warnings,
-                "errors": errors,
-                "details": "Run health_check.py directly for full report"
-            }
-        }
+        print(f"Queued workflow for issue #{issue_number} with ADW ID: {adw_id} (reason: {trigger_reason})")
+        print(f"Logs will be written to: agents/{adw_id}/adw_plan_build/execution.log")
         
-    except subprocess.TimeoutExpired:
+        # Return immediately
         return {
-            "status": "unhealthy",
-            "service": "adw-webhook-trigger",
-            "error": "Health check timed out"
+            "status": "accepted",
+            "issue": issue_number,
+            "adw_id": adw_id,
+            "message": f"ADW workflow queued for issue #{issue_number}",
+            "reason": trigger_reason,
+            "logs": f"agents/{adw_id}/adw_plan_build/"
         }
-    except Exception as e:
+    else:
+        print(f"Ignoring webhook: event={event_type}, action={action}, issue_number={issue_number}")
         return {
-            "status": "unhealthy", 
-            "service": "adw-webhook-trigger",
-            "error": f"Health check failed: {str(e)}"
+            "status": "ignored",
+            "reason": f"Not a triggering event (event={event_type}, action={action})"
         }
 
 
+
+# The /workflows handlers query SQLite, so they are plain functions that
+# FastAPI runs in its thread pool instead of on the event loop
+@app.get("/workflows", dependencies=[Depends(require_api_token)])
+def list_workflows(
+    state: List[str] = Query(["running", "queued"]), limit: int = Query(100, ge=1, le=1000)
+):
+    """List workflows in the given states (default: running and queued), oldest first.
+
+    Workflows running in this process include their pid and run time.
+    """
+    unknown = set(state) - set(get_args(JobState))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown states: {sorted(unknown)}")
+
+    local = {workflow["adw_id"]: workflow for workflow in scheduler.running_workflows()}
+    workflows = []
+    for job in job_queue.list_jobs(state, limit):
+        workflow = job.model_dump(mode="json")
+        if job.adw_id in local:
+            workflow["pid"] = local[job.adw_id]["pid"]
+            workflow["running_seconds"] = local[job.adw_id]["running_seconds"]
+        workflows.append(workflow)
+    return {"workflows": workflows, "metrics": scheduler.metrics()}
+
+
+@app.get("/workflows/{adw_id}", dependencies=[Depends(require_api_token)])
+def get_workflow(adw_id: str):
+    """Return a workflow's state, attempts, exit code and last error."""
+    job = job_queue.get(adw_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Workflow {adw_id} not found")
+    workflow = job.model_dump(mode="json")
+    process = scheduler.workflow_process(adw_id)
+    if process:
+        workflow.update(process)
+    return workflow
+
+
+@app.get("/workflows/{adw_id}/events", dependencies=[Depends(require_api_token)])
+async def workflow_events(adw_id: str, request: Request):
+    """Stream a workflow's agent progress events as Server-Sent Events.
+
+    Replays events recorded so far, then follows new ones until the workflow
+    finishes or the client disconnects.
+    """
+    try:
+        events_path(adw_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid ADW ID")
+    if await asyncio.to_thread(job_queue.get, adw_id) is None:
+        raise HTTPException(status_code=404, detail=f"Workflow {adw_id} not found")
+
+    async def event_stream():
+        offset = 0
+        last_sent = time.time()
+        while not await request.is_disconnected():
+            lines, offset = read_events(adw_id, offset)
+            for line in lines:
+                yield f"data: {line}\n\n"
+            if lines:
+                last_sent = time.time()
+                continue
+
+            job = await asyncio.to_thread(job_queue.get, adw_id)
+            if job is None or job.state in ("succeeded", "failed", "cancelled"):
+                yield f"event: end\ndata: {job.state if job else 'unknown'}\n\n"
+                return
+
+            # Comment line keeps proxies from closing an idle stream
+            if time.time() - last_sent >= EVENTS_KEEPALIVE_SECONDS:
+                yield ": keep-alive\n\n"
+                last_sent = time.time()
+            await asyncio.sleep(EVENTS_POLL_SECONDS)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.post("/workflows/{adw_id}/cancel", dependencies=[Depends(require_api_token)])
+def cancel_workflow(adw_id: str):
+    """Cancel a queued or running workflow, stopping its agents."""
+    previous_state = scheduler.cancel(adw_id)
+    if previous_state is None:
+        job = job_queue.get(adw_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Workflow {adw_id} not found")
+        return {"status": "ignored", "adw_id": adw_id, "message": f"Workflow already {job.state}"}
+
+    print(f"Cancelled workflow {adw_id} (was {previous_state})")
+    return {"status": "cancelled", "adw_id": adw_id, "previous_state": previous_state}
+
+
+@app.get("/health")
+async def health():
+    """Health check endpoint - returns the latest background health check instantly."""
+    return {
+        "service": "adw-webhook-trigger",
+        **health_monitor.snapshot(),
+        "github_rate_limit": rate_limit_budget.snapshot(),
+    }
+
+
+@app.get("/health/deep")
+async def deep_health(request: Request):
+    """Run the full health check now (up to ~30s, includes a Claude Code prompt).
+
+    A result younger than HEALTH_DEEP_MIN_AGE_SECONDS is returned as is; running
+    the checks again requires the API token.
+    """
+    checked_at = health_monitor.checked_at
+    if checked_at is not None and time.time() - checked_at < HEALTH_DEEP_MIN_AGE_SECONDS:
+        return await health()
+
+    require_api_token(request)
+    await asyncio.to_thread(health_monitor.run)
+    return await health()
+
+
 if __name__ == "__main__":
+    if sys.argv[1:] == ["--print-api-token"]:
+        print(API_TOKEN or "No API token: set ADW_API_TOKEN or GITHUB_WEBHOOK_SECRET")
+        sys.exit(0 if API_TOKEN else 1)
+
     print(f"Starting server on http://0.0.0.0:{PORT}")
-    print(f"Webhook endpoint: POST /gh-webhook")
-    print(f"Health check: GET /health")
+    if WEBHOOK_SECRET:
+        signatures = "verified"
+    else:
+        signatures = "NOT verified" if ALLOW_UNSIGNED_WEBHOOKS else "no secret set - all rejected"
+    print(f"Webhook endpoint: POST /gh-webhook (signatures {signatures})")
+    print(f"Workflows: GET /workflows, GET /workflows/{{adw_id}} (API token {'required' if API_TOKEN else 'not set - disabled'})")
+    print(f"Agent events (SSE): GET /workflows/{{adw_id}}/events")
+    print(f"Cancel workflow: POST /workflows/{{adw_id}}/cancel")
+    print(f"Health check: GET /health (cached), GET /health/deep (runs checks now, API token required)")
     
     uvicorn.run(app, host="0.0.0.0", port=PORT)
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+TTL Store - AI Developer Workflow (ADW)
+
+Bounded in-memory set of recently seen keys, used by the webhook to drop
+redelivered events and to debounce bursts of triggers for the same issue.
+Keys are forgotten after a TTL, and the oldest keys are evicted first once
+the store is full, so memory stays bounded under any event rate.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class TTLStore:
+    """Thread-safe set of keys that expire ttl_seconds after they were added."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _purge(self, now: float) -> None:
+        # Entries are kept in insertion order, so expired ones are at the front
+        while self._entries:
+            key, added_at = next(iter(self._entries.items()))
+            if now - added_at < self.ttl_seconds and len(self._entries) <= self.max_entries:
+                break
+            self._entries.popitem(last=False)
+
+    def add(self, key: Hashable) -> bool:
+        """Add a key. Returns False if it was already present and not expired."""
+        now = time.time()
+        with self._lock:
+            self._purge(now)
+            if key in self._entries:
+                return False
+            self._entries[key] = now
+            self._purge(now)
+            return True
+
+    def age(self, key: Hashable) -> Optional[float]:
+        """Seconds since the key was added, or None if absent or expired."""
+        now = time.time()
+        with self._lock:
+            self._purge(now)
+            added_at = self._entries.get(key)
+        return None if added_at is None else now - added_at
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.age(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge(time.time())
+            return len(self._entries)
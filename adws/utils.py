@@ -2,6 +2,7 @@
 
 import logging
 import os
+import re
 import sys
 import uuid
 from datetime import datetime
@@ -12,6 +13,12 @@ def make_adw_id() -> str:
     return str(uuid.uuid4())[:8]
 
 
+def make_branch_name(issue_type: str, issue_number: int, adw_id: str, title: str) -> str:
+    """Build the feature branch name: {type}-{issue_number}-{adw_id}-{slug}."""
+    slug = "-".join(re.findall(r"[a-z0-9]+", title.lower())[:6])[:40].strip("-")
+    return f"{issue_type}-{issue_number}-{adw_id}-{slug or 'issue'}"
+
+
 def setup_logger(adw_id: str, trigger_type: str = "adw_plan_build") -> logging.Logger:
     """Set up logger that writes to both console and file using adw_id.
     
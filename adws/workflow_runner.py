@@ -0,0 +1,163 @@
+"""
+Workflow Runner - AI Developer Workflow (ADW)
+
+Launches adw_plan_build workflows for the scheduler. Starting a fresh
+interpreter per workflow pays for Python startup and for importing
+adw_plan_build and its dependencies (pydantic, dotenv, ...) before the first
+agent call. A PrewarmedWorkerPool keeps a few worker processes that have
+already done that and are blocked waiting for a job; a workflow is handed to
+one of them and a replacement starts warming up in the background.
+
+Each worker runs exactly one workflow and then exits, so workflows keep a
+fresh process each: their own working directory (the worktree), module state
+and signal handlers, as with a direct launch. Workers are children of the
+scheduler, so they are stopped and reaped like any subprocess.
+
+A workflow's stdout and stderr go to agents/{adw_id}/worker.log, so a crash
+before the workflow's own logger is set up (import error, bad arguments,
+unreadable state) still leaves a traceback. Idle workers write to the
+scheduler's stderr until they are handed a workflow.
+
+Environment:
+- ADW_WORKFLOW_RUNNER: "prewarmed" or "process" to start a new interpreter
+  per workflow (default: prewarmed)
+- ADW_PREWARMED_WORKERS: Idle workers kept ready (default: 2)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from typing import List, Optional
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
+WORKFLOW_SCRIPT = os.path.join(SCRIPT_DIR, "adw_plan_build.py")
+RUNNER_SCRIPT = os.path.abspath(__file__)
+
+WORKFLOW_RUNNER = os.getenv("ADW_WORKFLOW_RUNNER", "prewarmed").lower()
+PREWARMED_WORKERS = int(os.getenv("ADW_PREWARMED_WORKERS", "2"))
+
+
+def worker_log_path(adw_id: str) -> str:
+    """Return the file a workflow's stdout and stderr are written to."""
+    return os.path.join(PROJECT_ROOT, "agents", adw_id, "worker.log")
+
+
+def open_log(log_path: str) -> int:
+    """Open a log file for appending and return its descriptor."""
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    return os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+
+
+def launch_process(argv: List[str], cwd: str, log_path: str) -> subprocess.Popen:
+    """Start adw_plan_build.py in a new interpreter, logging its output to log_path."""
+    log_fd = open_log(log_path)
+    try:
+        return subprocess.Popen(
+            [sys.executable, WORKFLOW_SCRIPT, *argv],
+            cwd=cwd,
+            stdout=log_fd,
+            stderr=subprocess.STDOUT,
+        )
+    finally:
+        os.close(log_fd)
+
+
+class PrewarmedWorkerPool:
+    """Pool of single-use worker processes with adw_plan_build already imported."""
+
+    def __init__(self, size: int = PREWARMED_WORKERS):
+        self.size = size
+        self._idle: List[subprocess.Popen] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _spawn(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            [sys.executable, RUNNER_SCRIPT, "--worker"],
+            cwd=SCRIPT_DIR,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            text=True,
+        )
+
+    def fill(self) -> None:
+        """Start workers until size are idle."""
+        with self._lock:
+            # Drop workers that died while idle
+            for worker in [w for w in self._idle if w.poll() is not None]:
+                self._idle.remove(worker)
+            while not self._closed and len(self._idle) < self.size:
+                self._idle.append(self._spawn())
+
+    def launch(self, argv: List[str], cwd: str, log_path: str) -> subprocess.Popen:
+        """Hand a workflow to an idle worker, or start one if none is ready."""
+        worker: Optional[subprocess.Popen] = None
+        with self._lock:
+            while self._idle and worker is None:
+                candidate = self._idle.pop(0)
+                if candidate.poll() is None:
+                    worker = candidate
+        if worker is None:
+            worker = self._spawn()
+
+        try:
+            worker.stdin.write(json.dumps({"argv": argv, "cwd": cwd, "log_path": log_path}) + "\n")
+            worker.stdin.close()
+        except OSError:
+            # The worker died between the check and the handoff; start the workflow directly
+            worker.wait()
+            return launch_process(argv, cwd, log_path)
+
+        # Warm up the replacement off the scheduler's path
+        threading.Thread(target=self.fill, name="adw-prewarm", daemon=True).start()
+        return worker
+
+    def close(self) -> None:
+        """Stop idle workers. Workers running a workflow are not affected."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            # Closing stdin makes an idle worker exit without running anything
+            try:
+                worker.stdin.close()
+            except OSError:
+                pass
+            try:
+                worker.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                worker.kill()
+                worker.wait()
+
+
+def worker_main() -> None:
+    """Import the workflow, then wait for one job on stdin and run it."""
+    import adw_plan_build
+
+    line = sys.stdin.readline()
+    if not line:
+        return  # Pool closed before a job arrived
+    job = json.loads(line)
+
+    # From here on everything the workflow prints goes to its log
+    sys.stdout.flush()
+    sys.stderr.flush()
+    log_fd = open_log(job["log_path"])
+    os.dup2(log_fd, 1)
+    os.dup2(log_fd, 2)
+    os.close(log_fd)
+
+    os.chdir(job["cwd"])
+    sys.argv = [WORKFLOW_SCRIPT, *job["argv"]]
+    adw_plan_build.main(job["argv"])
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--worker"]:
+        worker_main()
+    else:
+        print("Usage: workflow_runner.py --worker (started by the scheduler)", file=sys.stderr)
+        sys.exit(2)
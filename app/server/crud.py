@@ -1,5 +1,6 @@
 from datetime import datetime
 from typing import List, Optional, Dict, Any
+from database import DAY_ORDER_SQL
 from models import TaskCreate, TaskUpdate
 
 
@@ -28,20 +29,11 @@ def create_task(db, task_data: TaskCreate) -> Dict[str, Any]:
 
 def get_all_tasks(db) -> List[Dict[str, Any]]:
     """Retrieve all tasks from the database."""
-    result = db.execute("""
+    result = db.execute(f"""
         SELECT id, title, description, day_of_week, time_slot, task_type, completed, created_at, updated_at
         FROM tasks
-        ORDER BY
-            CASE day_of_week
-                WHEN 'Monday' THEN 1
-                WHEN 'Tuesday' THEN 2
-                WHEN 'Wednesday' THEN 3
-                WHEN 'Thursday' THEN 4
-                WHEN 'Friday' THEN 5
-                WHEN 'Saturday' THEN 6
-                WHEN 'Sunday' THEN 7
-            END,
-            time_slot
+        WHERE deleted_at IS NULL
+        ORDER BY {DAY_ORDER_SQL}, time_slot
     """)
 
     tasks = []
@@ -66,7 +58,7 @@ def get_task_by_id(db, task_id: int) -> Optional[Dict[str, Any]]:
     result = db.execute("""
         SELECT id, title, description, day_of_week, time_slot, task_type, completed, created_at, updated_at
         FROM tasks
-        WHERE id = ?
+        WHERE id = ? AND deleted_at IS NULL
     """, [task_id])
 
     if result.rows:
@@ -135,6 +127,40 @@ def update_task(db, task_id: int, task_data: TaskUpdate) -> Optional[Dict[str, A
 
 
 def delete_task(db, task_id: int) -> bool:
-    """Delete a task by ID."""
-    result = db.execute("DELETE FROM tasks WHERE id = ?", [task_id])
+    """Soft delete a task by ID.
+
+    The row is kept as a tombstone with `deleted_at` set so the delete can be
+    undone; `purge_deleted_tasks` removes it physically later.
+    """
+    now = datetime.utcnow().isoformat()
+    result = db.execute(
+        "UPDATE tasks SET deleted_at = ?, updated_at = ? WHERE id = ? AND deleted_at IS NULL",
+        [now, now, task_id]
+    )
     return result.rows_affected > 0
+
+
+def restore_task(db, task_id: int) -> Optional[Dict[str, Any]]:
+    """Undo a soft delete. Returns the restored task, or None if not deleted."""
+    result = db.execute(
+        "UPDATE tasks SET deleted_at = NULL, updated_at = ? WHERE id = ? AND deleted_at IS NOT NULL",
+        [datetime.utcnow().isoformat(), task_id]
+    )
+    if result.rows_affected == 0:
+        return None
+    return get_task_by_id(db, task_id)
+
+
+def purge_deleted_tasks(db, deleted_before: str, batch_size: int) -> int:
+    """Physically delete up to `batch_size` tasks soft deleted before the given
+    ISO timestamp, oldest first. Returns the number of rows removed."""
+    result = db.execute("""
+        DELETE FROM tasks
+        WHERE id IN (
+            SELECT id FROM tasks
+            WHERE deleted_at IS NOT NULL AND deleted_at < ?
+            ORDER BY deleted_at
+            LIMIT ?
+        )
+    """, [deleted_before, batch_size])
+    return result.rows_affected
@@ -11,9 +11,33 @@ load_dotenv()
 TURSO_DATABASE_URL = os.getenv("TURSO_DATABASE_URL", "")
 TURSO_AUTH_TOKEN = os.getenv("TURSO_AUTH_TOKEN", "")
 
-# Create Turso client
+# Sort key for day_of_week. Queries must use this exact expression in ORDER BY
+# so SQLite can read rows in order from idx_tasks_week_order instead of sorting.
+DAY_ORDER_SQL = """CASE day_of_week
+    WHEN 'Monday' THEN 1
+    WHEN 'Tuesday' THEN 2
+    WHEN 'Wednesday' THEN 3
+    WHEN 'Thursday' THEN 4
+    WHEN 'Friday' THEN 5
+    WHEN 'Saturday' THEN 6
+    WHEN 'Sunday' THEN 7
+END"""
+
+# Turso client for the current process. It is created lazily on first use so
+# that every server worker opens its own connection after it has been forked.
 client = None
-if TURSO_DATABASE_URL and TURSO_AUTH_TOKEN:
+
+if not (TURSO_DATABASE_URL and TURSO_AUTH_TOKEN):
+    print("Warning: TURSO_DATABASE_URL or TURSO_AUTH_TOKEN not set.")
+
+
+def connect():
+    """Create the Turso client for the current process."""
+    global client
+
+    if not (TURSO_DATABASE_URL and TURSO_AUTH_TOKEN):
+        return None
+
     try:
         # Convert libsql:// to https:// for HTTP protocol (more reliable than WebSocket)
         connection_url = TURSO_DATABASE_URL.replace("libsql://", "https://")
@@ -21,16 +45,34 @@ if TURSO_DATABASE_URL and TURSO_AUTH_TOKEN:
             url=connection_url,
             auth_token=TURSO_AUTH_TOKEN
         )
-        print("Connected to Turso database")
+        print(f"Connected to Turso database (pid {os.getpid()})")
     except Exception as e:
         print(f"Failed to connect to Turso: {e}")
         client = None
-else:
-    print("Warning: TURSO_DATABASE_URL or TURSO_AUTH_TOKEN not set.")
+    return client
+
+
+def get_client():
+    """Return the client for the current process, connecting on first use."""
+    if client is None:
+        return connect()
+    return client
+
+
+def _reset_client_after_fork():
+    """Drop the parent's client in a forked child; its sockets and background
+    thread do not survive fork. The child reconnects on first use."""
+    global client
+    client = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_client_after_fork)
 
 
 def init_db():
     """Initialize the database and create tables if they don't exist."""
+    client = get_client()
     if not client:
         print("No database client available")
         return
@@ -47,9 +89,31 @@ def init_db():
                 task_type TEXT NOT NULL,
                 completed INTEGER DEFAULT 0,
                 created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                deleted_at TEXT
             )
         """)
+
+        # Add soft delete column to tables created before it existed
+        columns = [row[1] for row in client.execute("PRAGMA table_info(tasks)").rows]
+        if "deleted_at" not in columns:
+            client.execute("ALTER TABLE tasks ADD COLUMN deleted_at TEXT")
+
+        # idx_tasks_active was superseded by idx_tasks_week_order; drop it from
+        # existing databases so writes stop maintaining it
+        client.execute("DROP INDEX IF EXISTS idx_tasks_active")
+
+        # Partial indexes: live tasks in week order for reads, tombstones for the purge job
+        client.execute(f"""
+            CREATE INDEX IF NOT EXISTS idx_tasks_week_order
+            ON tasks({DAY_ORDER_SQL}, time_slot)
+            WHERE deleted_at IS NULL
+        """)
+        client.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_deleted_at
+            ON tasks(deleted_at)
+            WHERE deleted_at IS NOT NULL
+        """)
         print("Database initialized successfully")
     except Exception as e:
         print(f"Database initialization failed: {e}")
@@ -58,6 +122,7 @@ def init_db():
 
 def get_db():
     """Get database client."""
+    client = get_client()
     if not client:
         raise Exception("Database client not initialized")
     return client
@@ -66,6 +131,7 @@ def get_db():
 def check_db_connection():
     """Check if database connection is working."""
     try:
+        client = get_client()
         if client:
             result = client.execute("SELECT 1")
             return True
@@ -0,0 +1,379 @@
+import asyncio
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Brotli is optional - fall back to gzip only when brotli-asgi is not installed
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
+
+
+# Cache-Control policy per route prefix for safe (GET/HEAD) requests.
+# The longest matching prefix wins; unmatched routes use DEFAULT_CACHE_POLICY.
+CACHE_POLICIES: Dict[str, str] = {
+    "/api/tasks": "private, no-cache",
+    "/api/health": "no-store",
+    "/docs": "public, max-age=3600",
+    "/openapi.json": "public, max-age=3600",
+}
+DEFAULT_CACHE_POLICY = "no-store"
+
+# Headers that change the representation of a response
+DEFAULT_VARY = ["Accept-Encoding", "Origin"]
+
+SAFE_METHODS = ("GET", "HEAD")
+
+# Paths that are never rate limited or shed (load balancer probes, docs)
+UNLIMITED_PATHS = ("/api/health",)
+
+
+def get_cache_policy(path: str, policies: Dict[str, str], default: str) -> str:
+    """Return the Cache-Control value for a path using longest-prefix matching."""
+    best_match = ""
+    for prefix in policies:
+        if path.startswith(prefix) and len(prefix) > len(best_match):
+            best_match = prefix
+    return policies[best_match] if best_match else default
+
+
+def merge_vary(existing: Optional[str], values: List[str]) -> str:
+    """Merge header names into an existing Vary value without duplicates."""
+    merged = [v.strip() for v in existing.split(",") if v.strip()] if existing else []
+    lowered = {v.lower() for v in merged}
+    for value in values:
+        if value.lower() not in lowered:
+            merged.append(value)
+            lowered.add(value.lower())
+    return ", ".join(merged)
+
+
+class CacheControlMiddleware:
+    """Attach Cache-Control, Vary and ETag headers to API responses.
+
+    Safe requests get the Cache-Control policy of their route. Responses whose
+    policy allows storing ("no-cache", "max-age") also get a weak ETag so that
+    clients can revalidate with If-None-Match and receive an empty 304 when the
+    payload has not changed. Unsafe requests are always marked "no-store".
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        policies: Optional[Dict[str, str]] = None,
+        default_policy: str = DEFAULT_CACHE_POLICY,
+        vary: Optional[List[str]] = None,
+    ) -> None:
+        self.app = app
+        self.policies = CACHE_POLICIES if policies is None else policies
+        self.default_policy = default_policy
+        self.vary = DEFAULT_VARY if vary is None else vary
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method in SAFE_METHODS:
+            policy = get_cache_policy(scope["path"], self.policies, self.default_policy)
+        else:
+            policy = "no-store"
+
+        if method != "GET" or "no-store" in policy:
+            await self.app(scope, receive, self._header_sender(send, policy))
+            return
+
+        await self._send_with_etag(scope, receive, send, policy)
+
+    def _apply_headers(self, message: Message, policy: str) -> MutableHeaders:
+        headers = MutableHeaders(scope=message)
+        headers.setdefault("Cache-Control", policy)
+        headers["Vary"] = merge_vary(headers.get("Vary"), self.vary)
+        return headers
+
+    def _header_sender(self, send: Send, policy: str) -> Send:
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self._apply_headers(message, policy)
+            await send(message)
+
+        return send_wrapper
+
+    async def _send_with_etag(
+        self, scope: Scope, receive: Receive, send: Send, policy: str
+    ) -> None:
+        """Buffer a cacheable GET response, tag it and answer 304 when unchanged."""
+        start_message: Optional[Message] = None
+        body_parts: List[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or start_message is None:
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            status = start_message["status"]
+            headers = self._apply_headers(start_message, policy)
+
+            if status != 200:
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            etag = headers.get("ETag") or f'W/"{hashlib.sha1(body).hexdigest()}"'
+            headers["ETag"] = etag
+
+            if etag_matches(Headers(scope=scope).get("If-None-Match"), etag):
+                not_modified = {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [
+                        (key, value)
+                        for key, value in start_message["headers"]
+                        if key.lower() not in (b"content-length", b"content-type")
+                    ],
+                }
+                await send(not_modified)
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    def strip_weak(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    target = strip_weak(etag)
+    return any(strip_weak(tag) == target for tag in if_none_match.split(","))
+
+
+def compression_middleware(
+    minimum_size: int, gzip_level: int, brotli_quality: int
+) -> Tuple[type, Dict[str, int]]:
+    """Pick the response compression middleware and its options.
+
+    Uses brotli (with gzip fallback for clients that do not accept br) when
+    brotli-asgi is installed, otherwise Starlette's gzip middleware.
+    """
+    if BrotliMiddleware is not None:
+        return BrotliMiddleware, {
+            "quality": brotli_quality,
+            "minimum_size": minimum_size,
+        }
+
+    return GZipMiddleware, {
+        "minimum_size": minimum_size,
+        "compresslevel": gzip_level,
+    }
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at `rate` tokens per second."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def consume(self, now: Optional[float] = None) -> float:
+        """Take one token. Returns 0 on success, else seconds until one is available."""
+        now = time.monotonic() if now is None else now
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+def hash_api_key(api_key: str) -> str:
+    """Digest an API key so raw keys are never kept or compared directly."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def client_key(scope: Scope, api_key_hashes: frozenset = frozenset()) -> str:
+    """Identify the caller by a configured API key, otherwise by client address.
+
+    Unknown keys are ignored rather than trusted: otherwise a client could
+    send a fresh random key with every request to get a fresh bucket.
+    """
+    api_key = Headers(scope=scope).get("X-API-Key")
+    if api_key:
+        key_hash = hash_api_key(api_key)
+        if key_hash in api_key_hashes:
+            return f"key:{key_hash}"
+    client = scope.get("client")
+    return f"ip:{client[0]}" if client else "ip:unknown"
+
+
+def retry_response(status_code: int, detail: str, retry_after: float) -> JSONResponse:
+    """Build a rejection response with a Retry-After header (whole seconds)."""
+    return JSONResponse(
+        {"detail": detail},
+        status_code=status_code,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+class RateLimitMiddleware:
+    """Per-client token bucket rate limiting for the API.
+
+    Every client gets a bucket for all requests and a stricter one for writes,
+    since writes are what consume the database quota. Clients are identified
+    by an `X-API-Key` listed in `api_keys`, otherwise by IP address.
+
+    Buckets live in process memory, so each worker enforces the limits on its
+    own: with N workers a client can reach up to N times the configured rate.
+    Idle buckets are evicted once `max_clients` is reached.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rate: float,
+        burst: int,
+        write_rate: float,
+        write_burst: int,
+        api_keys: Iterable[str] = (),
+        max_clients: int = 10000,
+    ) -> None:
+        self.app = app
+        self.rate = rate
+        self.burst = burst
+        self.write_rate = write_rate
+        self.write_burst = write_burst
+        self.api_key_hashes = frozenset(hash_api_key(key) for key in api_keys)
+        self.max_clients = max_clients
+        self.buckets: "OrderedDict[str, Tuple[TokenBucket, TokenBucket]]" = OrderedDict()
+
+    def _get_buckets(self, key: str) -> Tuple[TokenBucket, TokenBucket]:
+        buckets = self.buckets.get(key)
+        if buckets is None:
+            buckets = (
+                TokenBucket(self.rate, self.burst),
+                TokenBucket(self.write_rate, self.write_burst),
+            )
+            self.buckets[key] = buckets
+            if len(self.buckets) > self.max_clients:
+                self.buckets.popitem(last=False)
+        else:
+            self.buckets.move_to_end(key)
+        return buckets
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or not scope["path"].startswith("/api/")
+            or scope["path"].startswith(UNLIMITED_PATHS)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        all_bucket, write_bucket = self._get_buckets(client_key(scope, self.api_key_hashes))
+        retry_after = all_bucket.consume()
+        if not retry_after and scope["method"] not in SAFE_METHODS:
+            retry_after = write_bucket.consume()
+
+        if retry_after:
+            response = retry_response(429, "Rate limit exceeded", retry_after)
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+
+class AdmissionControlMiddleware:
+    """Cap concurrent API requests and shed load when the wait queue is full.
+
+    At most `max_concurrent` requests run at once. Up to `max_queued` more wait
+    for a slot for at most `queue_timeout` seconds; anything beyond that is
+    rejected immediately with 503 so latency for admitted requests stays bounded.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_concurrent: int,
+        max_queued: int,
+        queue_timeout: float,
+    ) -> None:
+        self.app = app
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self.queued = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the worker's running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not scope["path"].startswith("/api/")
+            or scope["path"].startswith(UNLIMITED_PATHS)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        semaphore = self.semaphore
+        if semaphore.locked():
+            if self.queued >= self.max_queued:
+                response = retry_response(503, "Server overloaded, retry later", self.queue_timeout)
+                await response(scope, receive, send)
+                return
+
+            self.queued += 1
+            try:
+                await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                response = retry_response(503, "Server overloaded, retry later", self.queue_timeout)
+                await response(scope, receive, send)
+                return
+            finally:
+                self.queued -= 1
+        else:
+            await semaphore.acquire()
+
+        self.active += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.active -= 1
+            semaphore.release()
@@ -0,0 +1,64 @@
+"""Background purge of soft deleted tasks.
+
+Soft deleted tasks stay in the table as tombstones for PURGE_RETENTION_HOURS
+so deletes can be undone. This job removes older tombstones in small batches
+so the table and its indexes do not grow without bound, and so no single
+DELETE holds the database for long.
+
+The server runs the job periodically in the background. On deployments
+without a long-running process (e.g. Vercel) run it from a scheduler instead:
+    uv run python purge.py
+"""
+import asyncio
+import os
+from datetime import datetime, timedelta
+from dotenv import load_dotenv
+from database import get_db
+import crud
+
+# Load environment variables
+load_dotenv()
+
+PURGE_RETENTION_HOURS = float(os.getenv("PURGE_RETENTION_HOURS", "168"))
+PURGE_INTERVAL_SECONDS = float(os.getenv("PURGE_INTERVAL_SECONDS", "3600"))
+PURGE_BATCH_SIZE = int(os.getenv("PURGE_BATCH_SIZE", "500"))
+PURGE_MAX_BATCHES = int(os.getenv("PURGE_MAX_BATCHES", "20"))
+
+
+def purge_once(
+    retention_hours: float = PURGE_RETENTION_HOURS,
+    batch_size: int = PURGE_BATCH_SIZE,
+    max_batches: int = PURGE_MAX_BATCHES,
+) -> int:
+    """Purge expired tombstones, at most `max_batches` batches per run.
+
+    Returns the total number of rows removed.
+    """
+    db = get_db()
+    deleted_before = (datetime.utcnow() - timedelta(hours=retention_hours)).isoformat()
+
+    total = 0
+    for _ in range(max_batches):
+        removed = crud.purge_deleted_tasks(db, deleted_before, batch_size)
+        total += removed
+        if removed < batch_size:
+            break
+    return total
+
+
+async def purge_loop(interval: float = PURGE_INTERVAL_SECONDS):
+    """Run `purge_once` every `interval` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            # Run the blocking database calls off the event loop
+            removed = await asyncio.to_thread(purge_once)
+            if removed:
+                print(f"Purged {removed} deleted tasks")
+        except Exception as e:
+            print(f"Warning: Task purge failed: {e}")
+
+
+if __name__ == "__main__":
+    removed = purge_once()
+    print(f"Purged {removed} deleted tasks")
@@ -77,3 +77,26 @@ async def delete_task(task_id: int):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error deleting task: {str(e)}"
         )
+
+
+@router.post("/api/tasks/{task_id}/restore", response_model=Task)
+async def restore_task(task_id: int):
+    """Restore a deleted task (undo delete)."""
+    try:
+        db = get_db()
+        restored_task = crud.restore_task(db, task_id)
+
+        if not restored_task:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Deleted task with id {task_id} not found"
+            )
+
+        return restored_task
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error restoring task: {str(e)}"
+        )
@@ -0,0 +1,181 @@
+"""Command line entry point for running the API server.
+
+Development (single process, hot reload):
+    uv run python serve.py
+
+Production (multi-worker, tuned for throughput):
+    uv run python serve.py --production
+
+Every option can also be set through the environment variable shown in
+``--help``, which is how the Procfile configures deployments.
+"""
+import argparse
+import importlib.util
+import os
+import random
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+
+def default_worker_count() -> int:
+    """One worker per CPU core available to this process."""
+    if hasattr(os, "sched_getaffinity"):
+        cores = len(os.sched_getaffinity(0))
+    else:
+        cores = os.cpu_count() or 1
+    return max(cores, 1)
+
+
+def detect_loop() -> str:
+    """Use uvloop when installed, otherwise the stdlib asyncio loop."""
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def detect_http() -> str:
+    """Use the httptools parser when installed, otherwise h11."""
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+class JitteredConfig(uvicorn.Config):
+    """uvicorn config that adds a random 0..max_requests_jitter to each worker's
+    request limit, so workers started together do not all recycle at once."""
+
+    def __init__(self, *args, max_requests_jitter: int = 0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_requests_jitter = max_requests_jitter
+
+    def load(self) -> None:
+        # load() runs once in every worker process, including restarted ones
+        if not self.loaded and self.limit_max_requests and self.max_requests_jitter:
+            self.limit_max_requests += random.randint(0, self.max_requests_jitter)
+        super().load()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments, falling back to environment variables."""
+    parser = argparse.ArgumentParser(description="Weekly Task Planner API server")
+    parser.add_argument(
+        "--production",
+        action="store_true",
+        default=os.getenv("SERVER_MODE", "") == "production",
+        help="Run with multiple workers and no reload (env: SERVER_MODE=production)",
+    )
+    parser.add_argument(
+        "--host", default=os.getenv("HOST", "0.0.0.0"), help="Bind address (env: HOST)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=int(os.getenv("PORT", "5173")), help="Bind port (env: PORT)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("WEB_CONCURRENCY", "0")),
+        help="Worker processes; 0 means one per CPU core (env: WEB_CONCURRENCY)",
+    )
+    parser.add_argument(
+        "--keep-alive",
+        type=int,
+        default=int(os.getenv("KEEP_ALIVE_TIMEOUT", "15")),
+        help="Seconds to hold idle keep-alive connections open (env: KEEP_ALIVE_TIMEOUT)",
+    )
+    parser.add_argument(
+        "--backlog",
+        type=int,
+        default=int(os.getenv("SOCKET_BACKLOG", "2048")),
+        help="Maximum pending connections on the listen socket (env: SOCKET_BACKLOG)",
+    )
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        default=int(os.getenv("MAX_REQUESTS_PER_WORKER", "10000")),
+        help="Recycle a worker after this many requests; 0 disables (env: MAX_REQUESTS_PER_WORKER)",
+    )
+    parser.add_argument(
+        "--max-requests-jitter",
+        type=int,
+        default=int(os.getenv("MAX_REQUESTS_JITTER", "1000")),
+        help="Add up to this many requests to each worker's limit (env: MAX_REQUESTS_JITTER)",
+    )
+    parser.add_argument(
+        "--forwarded-allow-ips",
+        default=os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1"),
+        help="Comma-separated proxy IPs (or *) trusted to set X-Forwarded-For (env: FORWARDED_ALLOW_IPS)",
+    )
+    parser.add_argument(
+        "--access-log",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("ACCESS_LOG", "false").lower() == "true",
+        help="Log every request in production mode (env: ACCESS_LOG=true)",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=int(os.getenv("GRACEFUL_SHUTDOWN_TIMEOUT", "30")),
+        help="Seconds to let in-flight requests finish on shutdown (env: GRACEFUL_SHUTDOWN_TIMEOUT)",
+    )
+    return parser.parse_args(argv)
+
+
+def build_config(args: argparse.Namespace) -> dict:
+    """Build uvicorn.run keyword arguments for the selected mode."""
+    if not args.production:
+        return {
+            "host": args.host,
+            "port": args.port,
+            "reload": True,
+        }
+
+    return {
+        "host": args.host,
+        "port": args.port,
+        "workers": args.workers or default_worker_count(),
+        "loop": detect_loop(),
+        "http": detect_http(),
+        "timeout_keep_alive": args.keep_alive,
+        "backlog": args.backlog,
+        # Exiting workers are restarted by uvicorn's process manager
+        "limit_max_requests": args.max_requests or None,
+        "max_requests_jitter": args.max_requests_jitter,
+        "timeout_graceful_shutdown": args.graceful_timeout,
+        "proxy_headers": True,
+        "forwarded_allow_ips": args.forwarded_allow_ips,
+        "access_log": args.access_log,
+    }
+
+
+def run_production(config: dict) -> None:
+    """Run uvicorn.run's multi-worker path with a JitteredConfig."""
+    server_config = JitteredConfig("server:app", **config)
+    server = uvicorn.Server(config=server_config)
+    if server_config.workers > 1:
+        sock = server_config.bind_socket()
+        Multiprocess(server_config, target=server.run, sockets=[sock]).run()
+    else:
+        server.run()
+
+
+def main(argv=None):
+    """Start the server."""
+    args = parse_args(argv)
+    config = build_config(args)
+
+    if args.production:
+        print(
+            f"Starting production server: workers={config['workers']}, "
+            f"loop={config['loop']}, http={config['http']}, "
+            f"keep_alive={config['timeout_keep_alive']}s, backlog={config['backlog']}, "
+            f"max_requests={config['limit_max_requests']} (+0..{config['max_requests_jitter']}), "
+            f"forwarded_allow_ips={config['forwarded_allow_ips']}"
+        )
+        run_production(config)
+    else:
+        print("Starting development server with hot reload")
+        uvicorn.run("server:app", **config)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,17 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 import uvicorn
+import asyncio
 import os
 from database import init_db
+from middleware import (
+    AdmissionControlMiddleware,
+    CacheControlMiddleware,
+    RateLimitMiddleware,
+    compression_middleware,
+)
 from routers import health, tasks
+from purge import PURGE_INTERVAL_SECONDS, purge_loop
 
 # Load environment variables
 load_dotenv()
@@ -31,12 +39,60 @@ else:
 
 print(f"CORS allowed origins: {allowed_origins}")  # Debug logging
 
+# How long browsers may cache a CORS preflight response (seconds)
+cors_max_age = int(os.getenv("CORS_MAX_AGE", "600"))
+
+# Response compression settings
+compression_minimum_size = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "500"))
+gzip_level = int(os.getenv("GZIP_COMPRESS_LEVEL", "6"))
+brotli_quality = int(os.getenv("BROTLI_QUALITY", "4"))
+
+# Rate limiting per client (configured API key or IP), per worker process:
+# with WEB_CONCURRENCY workers the effective limit is that many times higher
+rate_limit_rps = float(os.getenv("RATE_LIMIT_RPS", "50"))
+rate_limit_burst = int(os.getenv("RATE_LIMIT_BURST", "100"))
+write_rate_limit_rps = float(os.getenv("WRITE_RATE_LIMIT_RPS", "10"))
+write_rate_limit_burst = int(os.getenv("WRITE_RATE_LIMIT_BURST", "50"))
+rate_limit_api_keys = [key.strip() for key in os.getenv("RATE_LIMIT_API_KEYS", "").split(",") if key.strip()]
+
+# Admission control per worker process
+max_concurrent_requests = int(os.getenv("MAX_CONCURRENT_REQUESTS", "32"))
+max_queued_requests = int(os.getenv("MAX_QUEUED_REQUESTS", "64"))
+queue_timeout = float(os.getenv("QUEUE_TIMEOUT_SECONDS", "5"))
+
+# Middleware added last runs first:
+# CORS -> rate limit -> admission control -> compression -> cache headers
+app.add_middleware(CacheControlMiddleware)
+
+compression_class, compression_options = compression_middleware(
+    compression_minimum_size, gzip_level, brotli_quality
+)
+print(f"Response compression: {compression_class.__name__}")  # Debug logging
+app.add_middleware(compression_class, **compression_options)
+
+app.add_middleware(
+    AdmissionControlMiddleware,
+    max_concurrent=max_concurrent_requests,
+    max_queued=max_queued_requests,
+    queue_timeout=queue_timeout,
+)
+
+app.add_middleware(
+    RateLimitMiddleware,
+    rate=rate_limit_rps,
+    burst=rate_limit_burst,
+    write_rate=write_rate_limit_rps,
+    write_burst=write_rate_limit_burst,
+    api_keys=rate_limit_api_keys,
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=cors_max_age,
 )
 
 # Register routers
@@ -53,6 +109,18 @@ async def startup_event():
     except Exception as e:
         print(f"Warning: Database initialization failed: {e}")
 
+    # Purge old soft deleted tasks in the background, never on the request path
+    if PURGE_INTERVAL_SECONDS > 0:
+        app.state.purge_task = asyncio.create_task(purge_loop())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background jobs."""
+    purge_task = getattr(app.state, "purge_task", None)
+    if purge_task:
+        purge_task.cancel()
+
 
 @app.get("/")
 async def root():
@@ -1,9 +1,10 @@
 import pytest
-import sqlite3
 from pathlib import Path
 from fastapi.testclient import TestClient
+from libsql_client import create_client_sync
 from server import app
-from database import DATABASE_PATH, init_db
+from database import init_db
+from middleware import RateLimitMiddleware
 
 # Test database path
 TEST_DB_PATH = Path(__file__).parent / "test_tasks.db"
@@ -11,33 +12,53 @@ TEST_DB_PATH = Path(__file__).parent / "test_tasks.db"
 
 @pytest.fixture(scope="function")
 def test_db():
-    """Create a test database for each test."""
-    # Backup original database path
+    """Create a local SQLite test database for each test."""
+    # Backup original database client
     import database
-    original_path = database.DATABASE_PATH
+    original_client = database.client
 
-    # Set test database path
-    database.DATABASE_PATH = TEST_DB_PATH
+    # Point the app at a local file database instead of Turso
+    database.client = create_client_sync(url=f"file:{TEST_DB_PATH}")
 
     # Initialize test database
     init_db()
 
-    yield TEST_DB_PATH
+    yield database.client
 
-    # Cleanup: remove test database
+    # Cleanup: close and remove test database
+    database.client.close()
     if TEST_DB_PATH.exists():
         TEST_DB_PATH.unlink()
 
-    # Restore original database path
-    database.DATABASE_PATH = original_path
+    # Restore original database client
+    database.client = original_client
+
+
+def set_rate_limits(monkeypatch, **limits):
+    """Override the server's rate limiter settings for one test."""
+    limiter = next(m for m in app.user_middleware if m.cls is RateLimitMiddleware)
+    for name, value in limits.items():
+        monkeypatch.setitem(limiter.kwargs, name, value)
+    # Rebuild the middleware stack so the limiter starts with fresh buckets
+    app.middleware_stack = None
 
 
 @pytest.fixture(scope="function")
-def client(test_db):
+def client(test_db, monkeypatch):
     """Create a test client with test database."""
-    # Update database module path for the test
-    import database
-    database.DATABASE_PATH = test_db
+    # Rate limiting has its own tests; keep it out of the way of the others
+    set_rate_limits(monkeypatch, burst=1_000_000, write_burst=1_000_000)
+
+    with TestClient(app) as test_client:
+        yield test_client
+    app.middleware_stack = None
+
+
+@pytest.fixture(scope="function")
+def rate_limited_client(test_db, monkeypatch):
+    """Create a test client whose writes are limited to a burst of 2."""
+    set_rate_limits(monkeypatch, rate=100, burst=100, write_rate=0.01, write_burst=2)
 
     with TestClient(app) as test_client:
         yield test_client
+    app.middleware_stack = None
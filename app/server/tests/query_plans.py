@@ -0,0 +1,131 @@
+"""Query plan checks for the statements issued by crud.py.
+
+Runs every crud function against a seeded local SQLite database, records the
+SQL it sends, and inspects `EXPLAIN QUERY PLAN` for each statement. A plan is
+rejected if it scans a whole table or builds a temporary B-tree to sort or
+group rows, since both get slower as the tasks table grows.
+
+Used by tests/test_query_plans.py. To print the plans:
+    uv run python -m tests.query_plans
+"""
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from libsql_client import create_client_sync
+import crud
+import database
+from models import TaskCreate, TaskUpdate
+
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# "SCAN tasks" is a full table scan; "SCAN tasks USING INDEX ..." walks an index in order.
+# SQLite before 3.36 prints "SCAN TABLE tasks" instead.
+FULL_SCAN = re.compile(r"^SCAN (TABLE )?(?!CONSTANT ROW)(\w+)$")
+TEMP_BTREE = re.compile(r"USE TEMP B-TREE")
+
+
+class RecordingClient:
+    """Database client wrapper that records every statement it executes."""
+
+    def __init__(self, client):
+        self.client = client
+        self.statements: List[Tuple[str, List[Any]]] = []
+
+    def execute(self, sql: str, args: Optional[List[Any]] = None):
+        self.statements.append((sql, list(args or [])))
+        return self.client.execute(sql, args or [])
+
+
+def seed(db, count: int = 700) -> None:
+    """Insert tasks across the week, soft delete some, and collect statistics."""
+    now = "2024-01-01T00:00:00"
+    for i in range(count):
+        db.execute(
+            """
+            INSERT INTO tasks (title, description, day_of_week, time_slot, task_type, completed, created_at, updated_at, deleted_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                f"Task {i}",
+                "Seeded task",
+                DAYS[i % 7],
+                f"{i % 24:02d}:00",
+                "work",
+                i % 2,
+                now,
+                now,
+                now if i % 10 == 0 else None,
+            ],
+        )
+    db.execute("ANALYZE")
+
+
+# One call per public crud function; tests fail if a crud function is missing here
+CRUD_CALLS: Dict[str, Callable[[Any], Any]] = {
+    "create_task": lambda db: crud.create_task(db, TaskCreate(
+        title="Plan check", day_of_week="Monday", time_slot="09:00", task_type="work"
+    )),
+    "get_all_tasks": lambda db: crud.get_all_tasks(db),
+    "get_task_by_id": lambda db: crud.get_task_by_id(db, 2),
+    "update_task": lambda db: crud.update_task(db, 2, TaskUpdate(completed=True)),
+    "delete_task": lambda db: crud.delete_task(db, 3),
+    "restore_task": lambda db: crud.restore_task(db, 3),
+    "purge_deleted_tasks": lambda db: crud.purge_deleted_tasks(db, "2000-01-01T00:00:00", 100),
+}
+
+
+def explain(db, sql: str, args: List[Any]) -> List[str]:
+    """Return the detail column of EXPLAIN QUERY PLAN for a statement."""
+    result = db.execute(f"EXPLAIN QUERY PLAN {sql}", args)
+    return [row[3] for row in result.rows]
+
+
+def plan_problems(plan: List[str]) -> List[str]:
+    """Return the plan steps that indicate a full table scan or temp sort."""
+    return [
+        step for step in plan
+        if FULL_SCAN.match(step.strip()) or TEMP_BTREE.search(step)
+    ]
+
+
+def collect_plans(db_path: Path) -> List[Dict[str, Any]]:
+    """Seed a database, run every crud function and explain each statement.
+
+    Returns one entry per statement with the crud function, SQL, plan and problems.
+    """
+    original_client = database.client
+    client = create_client_sync(url=f"file:{db_path}")
+    database.client = client
+    try:
+        database.init_db()
+        seed(client)
+
+        reports = []
+        for name, call in CRUD_CALLS.items():
+            recorder = RecordingClient(client)
+            call(recorder)
+            for sql, args in recorder.statements:
+                plan = explain(client, sql, args)
+                reports.append({
+                    "function": name,
+                    "sql": " ".join(sql.split()),
+                    "plan": plan,
+                    "problems": plan_problems(plan),
+                })
+        return reports
+    finally:
+        client.close()
+        database.client = original_client
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        failed = False
+        for report in collect_plans(Path(tmp_dir) / "plans.db"):
+            status = "FAIL" if report["problems"] else "ok"
+            failed = failed or bool(report["problems"])
+            print(f"[{status}] {report['function']}: {report['sql']}")
+            for step in report["plan"]:
+                print(f"    {step}")
+        raise SystemExit(1 if failed else 0)
@@ -240,3 +240,167 @@ def test_create_task_with_different_types(client):
         assert response.status_code == 201
         data = response.json()
         assert data["task_type"] == task_type
+
+
+def test_large_task_list_is_compressed(client):
+    """Test GET /api/tasks compresses payloads above the size threshold."""
+    for i in range(20):
+        client.post("/api/tasks", json={
+            "title": f"Task {i}",
+            "description": "A task with enough text to make the payload worth compressing",
+            "day_of_week": "Monday",
+            "time_slot": "09:00 AM",
+            "task_type": "work",
+            "completed": False
+        })
+
+    response = client.get("/api/tasks", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] in ("gzip", "br")
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert len(response.json()) == 20
+
+
+def test_small_response_is_not_compressed(client):
+    """Test responses below the size threshold are sent uncompressed."""
+    response = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+def test_task_list_cache_headers_and_revalidation(client):
+    """Test GET /api/tasks sets Cache-Control/ETag and answers 304 when unchanged."""
+    response = client.get("/api/tasks")
+    assert response.headers["cache-control"] == "private, no-cache"
+    etag = response.headers["etag"]
+
+    not_modified = client.get("/api/tasks", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    client.post("/api/tasks", json={
+        "title": "New Task",
+        "day_of_week": "Monday",
+        "time_slot": "09:00 AM",
+        "task_type": "work",
+        "completed": False
+    })
+
+    modified = client.get("/api/tasks", headers={"If-None-Match": etag})
+    assert modified.status_code == 200
+    assert modified.headers["etag"] != etag
+
+
+def test_mutations_and_health_are_not_cached(client):
+    """Test write endpoints and health checks are marked no-store."""
+    response = client.post("/api/tasks", json={
+        "title": "Task",
+        "day_of_week": "Monday",
+        "time_slot": "09:00 AM",
+        "task_type": "work",
+        "completed": False
+    })
+    assert response.headers["cache-control"] == "no-store"
+
+    response = client.get("/api/health")
+    assert response.headers["cache-control"] == "no-store"
+
+
+def test_cors_preflight_is_cacheable(client):
+    """Test CORS preflight responses include Access-Control-Max-Age."""
+    response = client.options("/api/tasks", headers={
+        "Origin": "http://localhost:4200",
+        "Access-Control-Request-Method": "POST",
+    })
+    assert response.status_code == 200
+    assert int(response.headers["access-control-max-age"]) > 0
+
+
+def test_restore_deleted_task(client):
+    """Test POST /api/tasks/{id}/restore undoes a delete."""
+    create_response = client.post("/api/tasks", json={
+        "title": "Task to Restore",
+        "day_of_week": "Thursday",
+        "time_slot": "08:00 AM",
+        "task_type": "personal",
+        "completed": False
+    })
+    task_id = create_response.json()["id"]
+
+    client.delete(f"/api/tasks/{task_id}")
+    assert client.patch(f"/api/tasks/{task_id}", json={"title": "x"}).status_code == 404
+
+    response = client.post(f"/api/tasks/{task_id}/restore")
+    assert response.status_code == 200
+    assert response.json()["title"] == "Task to Restore"
+    assert len(client.get("/api/tasks").json()) == 1
+
+    # Restoring a task that is not deleted is a 404
+    response = client.post(f"/api/tasks/{task_id}/restore")
+    assert response.status_code == 404
+
+
+def test_purge_removes_only_expired_tombstones(client):
+    """Test the purge job physically removes old soft deleted tasks in batches."""
+    import database
+    from purge import purge_once
+
+    task_ids = []
+    for i in range(5):
+        response = client.post("/api/tasks", json={
+            "title": f"Task {i}",
+            "day_of_week": "Saturday",
+            "time_slot": "10:00 AM",
+            "task_type": "other",
+            "completed": False
+        })
+        task_ids.append(response.json()["id"])
+
+    for task_id in task_ids[:3]:
+        client.delete(f"/api/tasks/{task_id}")
+
+    db = database.get_db()
+
+    # Tombstones newer than the retention window are kept
+    assert purge_once(retention_hours=1, batch_size=2, max_batches=10) == 0
+
+    assert purge_once(retention_hours=0, batch_size=2, max_batches=10) == 3
+    remaining = db.execute("SELECT COUNT(*) FROM tasks").rows[0][0]
+    assert remaining == 2
+    assert len(client.get("/api/tasks").json()) == 2
+
+
+def test_writes_are_rate_limited(rate_limited_client):
+    """Test the server's write limit returns 429 once a client's burst is spent."""
+    task = {
+        "title": "Limited",
+        "day_of_week": "Monday",
+        "time_slot": "9:00 AM",
+        "task_type": "work",
+        "completed": False
+    }
+    assert rate_limited_client.post("/api/tasks", json=task).status_code == 201
+    assert rate_limited_client.post("/api/tasks", json=task).status_code == 201
+
+    response = rate_limited_client.post("/api/tasks", json=task)
+    assert response.status_code == 429
+    assert "retry-after" in response.headers
+
+    # Reads have their own, larger budget
+    assert rate_limited_client.get("/api/tasks").status_code == 200
+
+
+def test_init_db_drops_superseded_index(test_db):
+    """Test init_db removes the old idx_tasks_active index from existing databases."""
+    from database import init_db
+
+    test_db.execute("CREATE INDEX idx_tasks_active ON tasks(day_of_week) WHERE deleted_at IS NULL")
+    init_db()
+
+    indexes = {
+        row[0] for row in test_db.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'tasks'"
+        ).rows
+    }
+    assert "idx_tasks_active" not in indexes
+    assert "idx_tasks_week_order" in indexes
@@ -0,0 +1,119 @@
+import asyncio
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from middleware import AdmissionControlMiddleware, RateLimitMiddleware, TokenBucket
+
+
+def make_rate_limited_app(**limits):
+    """Create a small app behind the rate limiter."""
+    app = FastAPI()
+
+    @app.get("/api/tasks")
+    async def list_tasks():
+        return []
+
+    @app.post("/api/tasks")
+    async def create_task():
+        return {}
+
+    @app.get("/api/health")
+    async def health():
+        return {"status": "healthy"}
+
+    app.add_middleware(RateLimitMiddleware, **limits)
+    return app
+
+
+def test_token_bucket_refills_over_time():
+    """Test the bucket allows a burst, then refills at the configured rate."""
+    bucket = TokenBucket(rate=2, capacity=2)
+    start = bucket.updated
+
+    assert bucket.consume(start) == 0
+    assert bucket.consume(start) == 0
+    assert bucket.consume(start) > 0
+    assert bucket.consume(start + 0.5) == 0
+
+
+def test_rate_limit_returns_429_with_retry_after():
+    """Test a client exceeding its burst gets 429 with Retry-After."""
+    app = make_rate_limited_app(rate=1, burst=3, write_rate=1, write_burst=3)
+    client = TestClient(app)
+
+    for _ in range(3):
+        assert client.get("/api/tasks").status_code == 200
+
+    response = client.get("/api/tasks")
+    assert response.status_code == 429
+    assert int(response.headers["retry-after"]) >= 1
+
+    # Health checks are never limited
+    assert client.get("/api/health").status_code == 200
+
+
+def test_write_limit_is_separate_and_per_client():
+    """Test writes use their own bucket and API keys are limited independently."""
+    app = make_rate_limited_app(
+        rate=100, burst=100, write_rate=1, write_burst=2, api_keys=["other-client"]
+    )
+    client = TestClient(app)
+
+    assert client.post("/api/tasks").status_code == 200
+    assert client.post("/api/tasks").status_code == 200
+    assert client.post("/api/tasks").status_code == 429
+
+    # Reads are still allowed for the same client
+    assert client.get("/api/tasks").status_code == 200
+
+    # Another API key has its own budget
+    other = client.post("/api/tasks", headers={"X-API-Key": "other-client"})
+    assert other.status_code == 200
+
+
+def test_unknown_api_keys_are_limited_by_ip():
+    """Test random API keys cannot be used to get a fresh bucket per request."""
+    app = make_rate_limited_app(
+        rate=100, burst=100, write_rate=1, write_burst=2, api_keys=["known-client"]
+    )
+    client = TestClient(app)
+
+    assert client.post("/api/tasks", headers={"X-API-Key": "random-1"}).status_code == 200
+    assert client.post("/api/tasks", headers={"X-API-Key": "random-2"}).status_code == 200
+    assert client.post("/api/tasks", headers={"X-API-Key": "random-3"}).status_code == 429
+
+    # A configured key is still limited on its own
+    assert client.post("/api/tasks", headers={"X-API-Key": "known-client"}).status_code == 200
+
+
+def test_admission_control_sheds_load_when_queue_is_full():
+    """Test requests beyond the concurrency cap and queue length get 503."""
+    app = FastAPI()
+    release = asyncio.Event()
+
+    @app.get("/api/tasks")
+    async def slow_tasks():
+        await release.wait()
+        return []
+
+    app.add_middleware(
+        AdmissionControlMiddleware, max_concurrent=1, max_queued=1, queue_timeout=5
+    )
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            running = asyncio.create_task(client.get("/api/tasks"))
+            await asyncio.sleep(0.05)
+            queued = asyncio.create_task(client.get("/api/tasks"))
+            await asyncio.sleep(0.05)
+
+            shed = await client.get("/api/tasks")
+            release.set()
+            return shed, await running, await queued
+
+    shed, running, queued = asyncio.run(run())
+    assert shed.status_code == 503
+    assert "retry-after" in shed.headers
+    assert running.status_code == 200
+    assert queued.status_code == 200
@@ -0,0 +1,35 @@
+import inspect
+import crud
+from tests.query_plans import CRUD_CALLS, collect_plans, plan_problems
+
+
+def test_every_crud_function_is_checked():
+    """Test the query plan check exercises every public crud function."""
+    crud_functions = {
+        name for name, func in inspect.getmembers(crud, inspect.isfunction)
+        if func.__module__ == "crud" and not name.startswith("_")
+    }
+    assert crud_functions == set(CRUD_CALLS)
+
+
+def test_plan_problems_detects_scans_and_temp_sorts():
+    """Test the plan checker flags full scans and temp B-tree sorts only."""
+    assert plan_problems(["SCAN tasks"]) == ["SCAN tasks"]
+    assert plan_problems(["SCAN TABLE tasks"]) == ["SCAN TABLE tasks"]
+    assert plan_problems(["SCAN CONSTANT ROW"]) == []
+    assert plan_problems(["USE TEMP B-TREE FOR ORDER BY"]) == ["USE TEMP B-TREE FOR ORDER BY"]
+    assert plan_problems(["SCAN tasks USING INDEX idx_tasks_week_order"]) == []
+    assert plan_problems(["SCAN TABLE tasks USING INDEX idx_tasks_week_order"]) == []
+    assert plan_problems(["SEARCH tasks USING INTEGER PRIMARY KEY (rowid=?)"]) == []
+
+
+def test_crud_queries_avoid_full_scans_and_temp_sorts(tmp_path):
+    """Test no crud statement falls back to a full table scan or temp sort."""
+    reports = collect_plans(tmp_path / "plans.db")
+    assert reports
+
+    failures = [
+        f"{r['function']}: {r['sql']} -> {r['problems']}"
+        for r in reports if r["problems"]
+    ]
+    assert not failures, "\n".join(failures)